@@ -8,20 +8,32 @@ from ospx.connection import (
 )
 from ospx.component import Component
 from ospx.system import System
+from ospx.topology import Topology
+from ospx.unitCompatibility import UnitCompatibility
+from ospx.validation import ConnectionIssue, ConnectionValidator, ValidationReport
 from ospx.ospSimulationCase import OspSimulationCase
 from ospx.graph import Graph
 from ospx.ospCaseBuilder import OspCaseBuilder
+from ospx.ospSweepBuilder import OspSweepBuilder
+from ospx.buildServer import OspBuildServer
 from ospx.importer import OspSystemStructureImporter
 
 __all__ = [
     "Component",
     "Connection",
+    "ConnectionIssue",
+    "ConnectionValidator",
     "Connector",
     "Endpoint",
     "Graph",
+    "OspBuildServer",
     "OspCaseBuilder",
     "OspSimulationCase",
+    "OspSweepBuilder",
     "OspSystemStructureImporter",
     "Simulation",
     "System",
+    "Topology",
+    "UnitCompatibility",
+    "ValidationReport",
 ]
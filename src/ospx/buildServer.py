@@ -0,0 +1,196 @@
+"""Long-running build server, answering ospCaseBuilder requests with parsed FMUs and system structures kept warm."""
+
+from __future__ import annotations
+
+import inspect
+import json
+import logging
+import sys
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ospx.fmi import FMUCache
+from ospx.ospCaseBuilder import OspCaseBuilder
+from ospx.ospSimulationCase import clear_system_snapshots
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import TextIO
+
+__all__ = ["OspBuildServer"]
+
+logger = logging.getLogger(__name__)
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR: int = -32700
+INVALID_REQUEST: int = -32600
+METHOD_NOT_FOUND: int = -32601
+INVALID_PARAMS: int = -32602
+SERVER_ERROR: int = -32000
+
+
+class OspBuildServer:
+    """Build server answering build and inspect requests via JSON-RPC 2.0.
+
+    Requests are read line by line from an input stream (one JSON-RPC request per line),
+    responses are written line by line to an output stream. Log output is not written to the output stream.
+
+    Across requests, the build server keeps parsed FMUs (in an FMUCache)
+    and the resolved system structures (as in-memory system snapshots) warm.
+    Cached FMUs and system snapshots are validated against the files on disk with each request:
+    Whenever a case dict or a referenced FMU changed, the affected entries get rebuilt.
+
+    Supported methods:
+        - build(caseDictFile, graph=False, clean=False, profile=False)
+        - inspect(caseDictFile)
+        - invalidate(fmu=None): drops the cached FMU (or all cached FMUs) and all system snapshots held in memory
+        - status()
+        - shutdown()
+    """
+
+    def __init__(self) -> None:
+        self.fmu_cache: FMUCache = FMUCache()
+        self.requests_served: int = 0
+        self._shutdown_requested: bool = False
+        self._methods: dict[str, Callable[..., Any]] = {
+            "build": self._build,
+            "inspect": self._inspect,
+            "invalidate": self._invalidate,
+            "status": self._status,
+            "shutdown": self._shutdown,
+        }
+
+    def serve(self, input_stream: TextIO | None = None, output_stream: TextIO | None = None) -> None:
+        """Serve requests until a shutdown request is received or the input stream is closed.
+
+        Parameters
+        ----------
+        input_stream : TextIO | None, optional
+            stream requests are read from. If None, sys.stdin is used. By default None
+        output_stream : TextIO | None, optional
+            stream responses are written to. If None, sys.stdout is used. By default None
+        """
+        input_stream = input_stream or sys.stdin
+        output_stream = output_stream or sys.stdout
+        logger.info("OspBuildServer: ready.")
+        with self.fmu_cache:
+            for line in input_stream:
+                if not line.strip():
+                    continue
+                # Anything printed while handling a request must not end up in between the responses.
+                with redirect_stdout(sys.stderr):
+                    response = self.handle(line)
+                if response is not None:
+                    _ = output_stream.write(json.dumps(response) + "\n")
+                    output_stream.flush()
+                if self._shutdown_requested:
+                    break
+        logger.info("OspBuildServer: shut down.")
+
+    def handle(self, message: str) -> dict[str, Any] | None:
+        """Handle a single JSON-RPC request.
+
+        Parameters
+        ----------
+        message : str
+            the JSON-RPC request
+
+        Returns
+        -------
+        dict[str, Any] | None
+            the JSON-RPC response, or None if the request is a notification (a request without id)
+        """
+        try:
+            request = json.loads(message)
+        except json.JSONDecodeError as e:
+            return _error_response(None, PARSE_ERROR, f"Parse error: {e}")
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return _error_response(None, INVALID_REQUEST, "Invalid request")
+
+        request_id = request.get("id")
+        method = self._methods.get(request["method"])
+        params = request.get("params", {})
+        if method is None:
+            response = _error_response(request_id, METHOD_NOT_FOUND, f"Method not found: {request['method']}")
+        elif not isinstance(params, dict):
+            response = _error_response(request_id, INVALID_PARAMS, "Invalid params: params must be an object")
+        elif params_error := _check_params(method, params):
+            response = _error_response(request_id, INVALID_PARAMS, f"Invalid params: {params_error}")
+        else:
+            try:
+                response = {"jsonrpc": "2.0", "id": request_id, "result": method(**params)}
+            except Exception as e:
+                logger.exception(f"OspBuildServer: request '{request['method']}' failed.")
+                response = _error_response(request_id, SERVER_ERROR, f"{type(e).__name__}: {e}")
+        self.requests_served += 1
+        return response if "id" in request else None
+
+    def _build(
+        self,
+        caseDictFile: str,  # noqa: N803
+        *,
+        graph: bool = False,
+        clean: bool = False,
+        profile: bool = False,
+    ) -> dict[str, Any]:
+        return self._run_case_builder(caseDictFile, inspect=False, graph=graph, clean=clean, profile=profile)
+
+    def _inspect(self, caseDictFile: str) -> dict[str, Any]:  # noqa: N803
+        return self._run_case_builder(caseDictFile, inspect=True)
+
+    def _run_case_builder(self, case_dict_file: str, **kwargs: Any) -> dict[str, Any]:  # noqa: ANN401
+        errors = _ErrorCollector()
+        logging.getLogger().addHandler(errors)
+        start_time = time.perf_counter()
+        try:
+            OspCaseBuilder.build(case_dict_file, cache=True, **kwargs)
+        finally:
+            logging.getLogger().removeHandler(errors)
+        return {
+            "caseDictFile": str(Path(case_dict_file).resolve()),
+            "wallTime": time.perf_counter() - start_time,
+            "errors": errors.messages,
+            "fmuCache": self.fmu_cache.to_dict(),
+        }
+
+    def _invalidate(self, fmu: str | None = None) -> dict[str, Any]:
+        return {
+            "fmusDropped": self.fmu_cache.invalidate(fmu),
+            "systemSnapshotsDropped": clear_system_snapshots(),
+        }
+
+    def _status(self) -> dict[str, Any]:
+        return {
+            "requestsServed": self.requests_served,
+            "fmuCache": self.fmu_cache.to_dict(),
+        }
+
+    def _shutdown(self) -> dict[str, Any]:
+        self._shutdown_requested = True
+        return {"shutdown": True}
+
+
+class _ErrorCollector(logging.Handler):
+    """Logging handler collecting the messages of all error records logged while a request is handled."""
+
+    def __init__(self) -> None:
+        super().__init__(level=logging.ERROR)
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+def _error_response(request_id: Any, code: int, message: str) -> dict[str, Any]:  # noqa: ANN401
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def _check_params(method: Callable[..., Any], params: dict[str, Any]) -> str | None:
+    """Check whether the passed in params match the signature of the method. Return the mismatch, if any."""
+    try:
+        _ = inspect.signature(method).bind(**params)
+    except TypeError as e:
+        return str(e)
+    return None
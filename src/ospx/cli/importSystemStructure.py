@@ -29,17 +29,40 @@ def _argparser() -> argparse.ArgumentParser:
         epilog="_________________importSystemStructure___________________",
         prefix_chars="-",
         add_help=True,
-        description=("Imports an existing OspSystemStructure.xml and translates it into a case dict file."),
+        description=(
+            "Imports an existing OspSystemStructure.xml, SystemStructure.ssd or SSP file (.ssp) "
+            "and translates it into a case dict file. "
+            "If a folder is passed in, all system structure files found in the folder and its subfolders "
+            "are imported in parallel, each into a case dict file beside it."
+        ),
     )
 
     _ = parser.add_argument(
         "system_structure_file",
         metavar="system_structure_file",
         type=str,
-        help="name of the system structure file",
+        help="name of the system structure file, or folder to be searched for system structure files",
         default="OspSystemStructure.xml",
     )
 
+    _ = parser.add_argument(
+        "--pattern",
+        action="store",
+        type=str,
+        help="glob pattern system structure file names need to match when importing a folder, e.g. '*.ssp'.",
+        default="*OspSystemStructure*.xml",
+        required=False,
+    )
+
+    _ = parser.add_argument(
+        "--workers",
+        action="store",
+        type=int,
+        help="maximum number of worker threads when importing a folder.",
+        default=None,
+        required=False,
+    )
+
     console_verbosity = parser.add_mutually_exclusive_group(required=False)
 
     _ = console_verbosity.add_argument(
@@ -108,8 +131,8 @@ def main() -> None:
 
     system_structure_file: Path = Path(args.system_structure_file)
 
-    # Check whether system structure file exists
-    if not system_structure_file.is_file():
+    # Check whether system structure file (or folder) exists
+    if not system_structure_file.exists():
         logger.error(f"importSystemStructure.py: File {system_structure_file} not found.")
         return
 
@@ -129,7 +152,14 @@ def main() -> None:
     )
 
     # Invoke API
-    OspSystemStructureImporter.import_system_structure(system_structure_file)
+    if system_structure_file.is_dir():
+        _ = OspSystemStructureImporter.import_system_structures(
+            system_structure_file,
+            pattern=args.pattern,
+            max_workers=args.workers,
+        )
+    else:
+        _ = OspSystemStructureImporter.import_system_structure(system_structure_file)
 
     return
 
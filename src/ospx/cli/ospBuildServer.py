@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+"""ospBuildServer command line interface."""
+
+import argparse
+import logging
+import sys
+from contextlib import redirect_stdout
+from importlib import metadata
+from pathlib import Path
+
+from ospx.buildServer import OspBuildServer
+from ospx.utils.logging import configure_logging
+
+logger = logging.getLogger(__name__)
+
+
+def _get_version() -> str:
+    """Return the installed package version, or a safe fallback if unavailable."""
+    try:
+        return metadata.version("ospx")
+    except metadata.PackageNotFoundError:
+        # Fallback when package metadata is not available (e.g. running from source)
+        return "ospx (version unknown)"
+
+
+def _argparser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="ospBuildServer",
+        usage="%(prog)s [options [args]]",
+        epilog="_________________ospBuildServer___________________",
+        prefix_chars="-",
+        add_help=True,
+        description=(
+            "Long-running ospCaseBuilder server. Reads JSON-RPC 2.0 requests (one per line) from stdin "
+            "and writes the responses to stdout. Parsed FMUs and system structures are kept warm in memory. "
+            "Methods: build, inspect, invalidate, status, shutdown."
+        ),
+    )
+
+    console_verbosity = parser.add_mutually_exclusive_group(required=False)
+
+    _ = console_verbosity.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help=("console output will be quiet."),
+        default=False,
+    )
+
+    _ = console_verbosity.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help=("console output will be verbose."),
+        default=False,
+    )
+
+    _ = parser.add_argument(
+        "--log",
+        action="store",
+        type=str,
+        help="name of log file. If specified, this will activate logging to file.",
+        default=None,
+        required=False,
+    )
+
+    _ = parser.add_argument(
+        "--log-level",
+        action="store",
+        type=str,
+        help="log level applied to logging to file.",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        default="WARNING",
+        required=False,
+    )
+
+    _ = parser.add_argument(
+        "-V",
+        "--version",
+        action="version",
+        version=_get_version(),
+    )
+
+    return parser
+
+
+def main() -> None:
+    """Entry point for console script as configured in pyproject.toml.
+
+    Runs the command line interface and parses arguments and options entered on the console.
+    """
+    parser = _argparser()
+    args = parser.parse_args()
+
+    # Configure Logging
+    # ..to console (stderr, as stdout is reserved for the JSON-RPC responses)
+    log_level_console: str = "WARNING"
+    if any([args.quiet, args.verbose]):
+        log_level_console = "ERROR" if args.quiet else log_level_console
+        log_level_console = "INFO" if args.verbose else log_level_console
+    # ..to file
+    log_file: Path | None = Path(args.log) if args.log else None
+    log_level_file: str = args.log_level
+    with redirect_stdout(sys.stderr):
+        configure_logging(log_level_console, log_file, log_level_file, console_stream=sys.stderr)
+
+    # Invoke API
+    OspBuildServer().serve(sys.stdin, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
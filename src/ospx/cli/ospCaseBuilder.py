@@ -4,6 +4,7 @@
 import argparse
 import logging
 import pprint
+import sys
 from importlib import metadata
 from pathlib import Path
 
@@ -58,6 +59,18 @@ def _argparser() -> argparse.ArgumentParser:
         required=False,
     )
 
+    _ = parser.add_argument(
+        "--validate",
+        action="store_true",
+        help=(
+            "validate mode: checks all connections against the variables and variable groups of the FMUs, "
+            "saves the result as validationReport.json, and exits with exit code 1 if any issue is found. "
+            "Does not create the OSP case files."
+        ),
+        default=False,
+        required=False,
+    )
+
     _ = parser.add_argument(
         "-g",
         "--graph",
@@ -67,6 +80,112 @@ def _argparser() -> argparse.ArgumentParser:
         required=False,
     )
 
+    _ = parser.add_argument(
+        "--graph-engine",
+        action="store",
+        type=str,
+        help=(
+            "graphviz layout engine used for the dependency graph. "
+            "If not specified, dot is used for small systems and sfdp for large systems."
+        ),
+        choices=["dot", "sfdp", "neato", "fdp"],
+        default=None,
+        required=False,
+    )
+
+    _ = parser.add_argument(
+        "--graph-cluster",
+        action="store",
+        type=str,
+        help=(
+            "separator of component name prefixes. If specified, components sharing the same name prefix "
+            "are grouped into a cluster in the dependency graph."
+        ),
+        metavar="SEPARATOR",
+        default=None,
+        required=False,
+    )
+
+    _ = parser.add_argument(
+        "--graph-render",
+        action="store",
+        type=str,
+        help=(
+            "how the dependency graph gets rendered: in foreground, in background (without waiting for graphviz "
+            "to finish), or not at all (only the graph source in DOT format is saved). "
+            "An unchanged dependency graph is not rendered again."
+        ),
+        choices=["foreground", "background", "none"],
+        default="foreground",
+        required=False,
+    )
+
+    _ = parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="times the individual build phases and writes a timing report (buildProfile.json) into the case folder.",
+        default=False,
+        required=False,
+    )
+
+    _ = parser.add_argument(
+        "--profiler",
+        action="store",
+        type=str,
+        help=(
+            "code profiler to run alongside the build. "
+            "Its output is saved beside the timing report (buildProfile.prof or buildProfile.html). "
+            "Implies --profile."
+        ),
+        choices=["cProfile", "pyinstrument"],
+        default=None,
+        required=False,
+    )
+
+    _ = parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=(
+            "saves the resolved system structure as snapshot (systemSnapshot.pickle) in the case folder "
+            "and reuses it in subsequent runs, as long as the case dict and the referenced FMUs are unchanged."
+        ),
+        default=False,
+        required=False,
+    )
+
+    _ = parser.add_argument(
+        "--osp-model-descriptions",
+        action="store_true",
+        help=(
+            "writes a <component>_OspModelDescription.xml file for each component, beside the FMU of the component "
+            "(i.e. into the libSource folder for FMUs located there, not into the case folder). "
+            "The files are written concurrently, once per FMU."
+        ),
+        default=False,
+        required=False,
+    )
+
+    _ = parser.add_argument(
+        "--workers",
+        action="store",
+        type=int,
+        help="maximum number of worker threads writing the OspModelDescription.xml files.",
+        metavar="N",
+        default=None,
+        required=False,
+    )
+
+    _ = parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help=(
+            "hardlinks the OspModelDescription.xml files of components sharing an FMU to one shared file, "
+            "which is only rewritten if its content changed. Implies --osp-model-descriptions."
+        ),
+        default=False,
+        required=False,
+    )
+
     console_verbosity = parser.add_mutually_exclusive_group(required=False)
 
     _ = console_verbosity.add_argument(
@@ -135,7 +254,16 @@ def main() -> None:
 
     inspect: bool = args.inspect
     graph: bool = args.graph
+    graph_engine: str | None = args.graph_engine
+    graph_cluster: str | None = args.graph_cluster
+    graph_render: str = args.graph_render
     clean: bool = args.clean
+    profile: bool = args.profile
+    profiler: str | None = args.profiler
+    cache: bool = args.cache
+    osp_model_descriptions: bool = args.osp_model_descriptions
+    workers: int | None = args.workers
+    dedupe: bool = args.dedupe
 
     case_dict_file: Path = Path(args.case_dict_file)
 
@@ -160,11 +288,24 @@ def main() -> None:
     )
 
     # Invoke API
+    if args.validate:
+        report = OspCaseBuilder.validate(case_dict_file, cache=cache)
+        sys.exit(0 if report.is_valid else 1)
+
     OspCaseBuilder.build(
         case_dict_file=case_dict_file,
         inspect=inspect,
         graph=graph,
+        graph_engine=graph_engine,
+        graph_cluster=graph_cluster,
+        graph_render=graph_render,
         clean=clean,
+        profile=profile,
+        profiler=profiler,
+        cache=cache,
+        osp_model_descriptions=osp_model_descriptions,
+        workers=workers,
+        dedupe=dedupe,
     )
 
 
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+"""ospSweepBuilder command line interface."""
+
+import argparse
+import logging
+from importlib import metadata
+from pathlib import Path
+
+from dictIO import DictReader
+
+from ospx.ospSweepBuilder import OspSweepBuilder
+from ospx.utils.logging import configure_logging
+
+logger = logging.getLogger(__name__)
+
+
+def _get_version() -> str:
+    """Return the installed package version, or a safe fallback if unavailable."""
+    try:
+        return metadata.version("ospx")
+    except metadata.PackageNotFoundError:
+        # Fallback when package metadata is not available (e.g. running from source)
+        return "ospx (version unknown)"
+
+
+def _argparser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="ospSweepBuilder",
+        usage="%(prog)s case_dict_file sweep_dict_file [options [args]]",
+        epilog="_________________ospSweepBuilder___________________",
+        prefix_chars="-",
+        add_help=True,
+        description=(
+            "Builds the OSP-specific configuration files for all variants of a parameter sweep over one base case."
+        ),
+    )
+
+    _ = parser.add_argument(
+        "case_dict_file",
+        metavar="case_dict_file",
+        type=str,
+        help="name of the dict file containing the OSP simulation case configuration of the base case.",
+    )
+
+    _ = parser.add_argument(
+        "sweep_dict_file",
+        metavar="sweep_dict_file",
+        type=str,
+        help=(
+            "name of the dict file defining the parameter grid in its 'parameters' section. "
+            "Parameter names are 'baseStepSize' or '<component>.<variable>', each with a list of values."
+        ),
+    )
+
+    _ = parser.add_argument(
+        "--sweep-folder",
+        action="store",
+        type=str,
+        help="folder the variant case folders get created in. Default: 'sweep' inside the base case folder.",
+        default=None,
+        required=False,
+    )
+
+    _ = parser.add_argument(
+        "--max-workers",
+        action="store",
+        type=int,
+        help="maximum number of worker threads writing the variants in parallel.",
+        default=None,
+        required=False,
+    )
+
+    console_verbosity = parser.add_mutually_exclusive_group(required=False)
+
+    _ = console_verbosity.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help=("console output will be quiet."),
+        default=False,
+    )
+
+    _ = console_verbosity.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help=("console output will be verbose."),
+        default=False,
+    )
+
+    _ = parser.add_argument(
+        "--log",
+        action="store",
+        type=str,
+        help="name of log file. If specified, this will activate logging to file.",
+        default=None,
+        required=False,
+    )
+
+    _ = parser.add_argument(
+        "--log-level",
+        action="store",
+        type=str,
+        help="log level applied to logging to file.",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        default="WARNING",
+        required=False,
+    )
+
+    _ = parser.add_argument(
+        "-V",
+        "--version",
+        action="version",
+        version=_get_version(),
+    )
+
+    return parser
+
+
+def main() -> None:
+    """Entry point for console script as configured in pyproject.toml.
+
+    Runs the command line interface and parses arguments and options entered on the console.
+    """
+    parser = _argparser()
+    args = parser.parse_args()
+
+    # Configure Logging
+    # ..to console
+    log_level_console: str = "WARNING"
+    if any([args.quiet, args.verbose]):
+        log_level_console = "ERROR" if args.quiet else log_level_console
+        log_level_console = "INFO" if args.verbose else log_level_console
+    # ..to file
+    log_file: Path | None = Path(args.log) if args.log else None
+    log_level_file: str = args.log_level
+    configure_logging(log_level_console, log_file, log_level_file)
+
+    case_dict_file: Path = Path(args.case_dict_file)
+    sweep_dict_file: Path = Path(args.sweep_dict_file)
+    sweep_folder: Path | None = Path(args.sweep_folder) if args.sweep_folder else None
+    max_workers: int | None = args.max_workers
+
+    # Check whether case dict file and sweep dict file exist
+    for file in (case_dict_file, sweep_dict_file):
+        if not file.is_file():
+            logger.error(f"ospSweepBuilder.py: File {file} not found.")
+            return
+
+    sweep_dict = DictReader.read(sweep_dict_file, comments=False)
+    if "parameters" not in sweep_dict:
+        logger.error(f"ospSweepBuilder.py: no 'parameters' section found in {sweep_dict_file}.")
+        return
+
+    # Invoke API
+    _ = OspSweepBuilder.build(
+        case_dict_file=case_dict_file,
+        parameters=dict(sweep_dict["parameters"]),
+        sweep_folder=sweep_folder,
+        max_workers=max_workers,
+    )
+
+
+if __name__ == "__main__":
+    main()
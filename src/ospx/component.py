@@ -1,15 +1,16 @@
 import logging
-from collections.abc import MutableMapping
-from copy import deepcopy
+from collections.abc import Mapping, MutableMapping
+from copy import copy
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Self
 
-from dictIO import DictWriter
+from dictIO import NativeParser, XmlFormatter
 from dictIO.utils.counter import BorgCounter
 
 from ospx import Connector
-from ospx.fmi import FMU, ScalarVariable, Unit
+from ospx.fmi import FMU, ScalarVariable, Unit, cast_to_fmi_data_types, load_fmu
+from ospx.utils.file import write_text_atomic
 
 __all__ = ["Component"]
 
@@ -73,7 +74,7 @@ class Component:
         if not fmu_file.exists():
             logger.exception(f"component {self.name}: referenced FMU file {fmu_file} not found.")
             raise FileNotFoundError(fmu_file)
-        self.fmu = FMU(fmu_file)
+        self.fmu = load_fmu(fmu_file)
         if self.fmu.default_experiment and not self.step_size:
             self.step_size = self.fmu.default_experiment.step_size
 
@@ -85,14 +86,47 @@ class Component:
     def _read_initialize(self, properties: MutableMapping[Any, Any]) -> None:
         if "initialize" not in properties:
             return
+        fmu_variables = self.fmu.variables
+
+        # Cast all start values in one batch, to the data types the variables have in the FMU
+        names_with_start: list[str] = [
+            variable_name
+            for variable_name, variable_properties in properties["initialize"].items()
+            if "start" in variable_properties
+        ]
+        data_types: list[str | None] = [
+            fmu_variables[variable_name].data_type if variable_name in fmu_variables else None
+            for variable_name in names_with_start
+        ]
+        raw_values: list[Any] = [properties["initialize"][variable_name]["start"] for variable_name in names_with_start]
+        casted_values, failures = cast_to_fmi_data_types(raw_values, data_types)
+        if failures:
+            details = "\n".join(
+                f"\t{names_with_start[failure.index]}: start value {failure.value!r} "
+                f"cannot be casted to {failure.data_type} ({failure.reason})"
+                for failure in failures
+            )
+            logger.error(
+                f"component {self.name}: {len(failures)} start value(s) failed to cast "
+                f"and are kept as they are:\n{details}"
+            )
+        start_values: dict[str, Any] = dict(zip(names_with_start, casted_values, strict=True))
+        start_data_types: dict[str, str | None] = dict(zip(names_with_start, data_types, strict=True))
+        # Start values that failed to cast keep their raw value. Their data type is derived from the raw value.
+        for failure in failures:
+            start_values[names_with_start[failure.index]] = raw_values[failure.index]
+            start_data_types[names_with_start[failure.index]] = None
+
         for variable_name, variable_properties in properties["initialize"].items():
             variable = ScalarVariable(name=variable_name)
             if "causality" in variable_properties:
                 variable.causality = variable_properties["causality"]
             if "variability" in variable_properties:
                 variable.variability = variable_properties["variability"]
-            if "start" in variable_properties:
-                variable.start = variable_properties["start"]
+            if (start := start_values.get(variable_name)) is not None:
+                if data_type := start_data_types[variable_name]:
+                    variable.data_type = data_type
+                variable.start = start
             self._initial_values[variable.name] = variable
 
     def _read_connectors(self, properties: MutableMapping[Any, Any]) -> None:
@@ -138,18 +172,23 @@ class Component:
             self.name = f"{self.name}-proxy"
 
     def _init_units(self) -> None:
-        self._units = deepcopy(self.fmu.units)
+        # Units are interned and shared with the FMU (and with other FMUs defining identical units).
+        self._units = self.fmu.units
 
     def _init_variables(self) -> None:
-        self._variables = deepcopy(self.fmu.variables)
+        # The component shares the (unmodified) ScalarVariable objects with its FMU.
+        # Only variables with initial values get copied before being modified (copy-on-write).
+        self._variables = self.fmu.variables
 
         for variable_name, variable in self._initial_values.items():
+            component_variable = copy(self._variables[variable_name])
             if variable.causality:
-                self._variables[variable_name].causality = variable.causality
+                component_variable.causality = variable.causality
             if variable.variability:
-                self._variables[variable_name].variability = variable.variability
+                component_variable.variability = variable.variability
             if variable.start:
-                self._variables[variable_name].start = variable.start
+                component_variable.start = variable.start
+            self._variables[variable_name] = component_variable
 
     @property
     def variables_with_start_values(self) -> dict[str, ScalarVariable]:
@@ -198,59 +237,104 @@ class Component:
         """
         return self._connectors
 
+    def with_start_values(self, start_values: Mapping[str, Any]) -> Self:
+        """Return a copy of the component, with the passed in start values applied on top of its own.
+
+        The copy shares all state not affected by the start values (FMU, units, connectors,
+        and all variables without start value) with the original component.
+        Only the variables the passed in start values get applied to are copied (copy-on-write).
+        The original component remains unchanged.
+
+        Parameters
+        ----------
+        start_values : Mapping[str, Any]
+            start values by variable name. Values are expected to be casted to the variables' data types already,
+            e.g. using cast_to_fmi_data_types().
+
+        Returns
+        -------
+        Self
+            the copy of the component
+
+        Raises
+        ------
+        KeyError
+            if a variable does not exist in the component
+        """
+        component = copy(self)
+        component._initial_values = dict(self._initial_values)  # noqa: SLF001
+        component._variables = dict(self._variables)  # noqa: SLF001
+        for variable_name, start in start_values.items():
+            if variable_name not in self._variables:
+                msg = f"component {self.name}: variable {variable_name} not found."
+                raise KeyError(msg)
+            variable = self._variables[variable_name]
+            initial_value = copy(self._initial_values.get(variable_name) or ScalarVariable(name=variable_name))
+            component_variable = copy(variable)
+            for _variable in (initial_value, component_variable):
+                if variable.data_type:
+                    _variable.data_type = variable.data_type
+                _variable.start = start
+            component._initial_values[variable_name] = initial_value  # noqa: SLF001
+            component._variables[variable_name] = component_variable  # noqa: SLF001
+        return component
+
+    @property
+    def osp_model_description_file(self) -> Path:
+        """Returns the path of the <component.name>_OspModelDescription.xml file, located beside the FMU.
+
+        Returns
+        -------
+        Path
+            path of the OspModelDescription.xml file
+        """
+        return self.fmu.file.parent.absolute() / f"{self.name}_OspModelDescription.xml"
+
     def write_osp_model_description_xml(self) -> None:
-        """Write the <component.name>_OspModelDescription.xml file in the current working directory."""
-        # sourcery skip: extract-method, merge-dict-assign
-        osp_model_description_file = self.fmu.file.parent.absolute() / f"{self.name}_OspModelDescription.xml"
+        """Write the <component.name>_OspModelDescription.xml file beside the FMU."""
+        osp_model_description_file = self.osp_model_description_file
         self._clean(osp_model_description_file)
+        write_text_atomic(osp_model_description_file, self.osp_model_description_xml())
 
+    def osp_model_description_xml(self) -> str:
+        """Return the content of the <component.name>_OspModelDescription.xml file.
+
+        Returns
+        -------
+        str
+            the OspModelDescription, formatted as XML string
+        """
+        formatter = XmlFormatter()
+        osp_model_description = self._osp_model_description()
+        # parse values the same way DictWriter.write() does before it formats a dict
+        NativeParser().parse_values(osp_model_description)
+        return formatter.to_string(osp_model_description)
+
+    def _osp_model_description(self) -> dict[str, Any]:
+        # sourcery skip: extract-method, merge-dict-assign
         osp_model_description: dict[str, Any] = {}
 
         # Unit Definitions
         unit_definitions: dict[str, dict[str, dict[str, Any]]] = {}
-        for unit in self.units.values():
-            unit_definition: dict[str, dict[str, Any]] = {"_attributes": {}}
-            unit_definition["_attributes"]["name"] = unit.name
+        for index, unit in enumerate(self.units.values()):
+            unit_definition: dict[str, dict[str, Any]] = {"_attributes": {"name": unit.name}}
             if unit.base_unit:
-                unit_definition["BaseUnit"] = {"_attributes": {}}
-                if unit.base_unit.kg:
-                    unit_definition["BaseUnit"]["_attributes"]["kg"] = unit.base_unit.kg
-                if unit.base_unit.m:
-                    unit_definition["BaseUnit"]["_attributes"]["m"] = unit.base_unit.m
-                if unit.base_unit.s:
-                    unit_definition["BaseUnit"]["_attributes"]["s"] = unit.base_unit.s
-                if unit.base_unit.A:
-                    unit_definition["BaseUnit"]["_attributes"]["A"] = unit.base_unit.A
-                if unit.base_unit.K:
-                    unit_definition["BaseUnit"]["_attributes"]["K"] = unit.base_unit.K
-                if unit.base_unit.mol:
-                    unit_definition["BaseUnit"]["_attributes"]["mol"] = unit.base_unit.mol
-                if unit.base_unit.cd:
-                    unit_definition["BaseUnit"]["_attributes"]["cd"] = unit.base_unit.cd
-                if unit.base_unit.rad:
-                    unit_definition["BaseUnit"]["_attributes"]["rad"] = unit.base_unit.rad
-                if unit.base_unit.factor:
-                    unit_definition["BaseUnit"]["_attributes"]["factor"] = unit.base_unit.factor
-                if unit.base_unit.offset:
-                    unit_definition["BaseUnit"]["_attributes"]["offset"] = unit.base_unit.offset
+                unit_definition["BaseUnit"] = {"_attributes": unit.base_unit.to_attributes()}
             if unit.display_unit:
-                unit_definition["DisplayUnit"] = {"_attributes": {}}
-                unit_definition["DisplayUnit"]["_attributes"]["name"] = unit.display_unit.name
-                unit_definition["DisplayUnit"]["_attributes"]["factor"] = unit.display_unit.factor
-                unit_definition["DisplayUnit"]["_attributes"]["offset"] = unit.display_unit.offset
-            unit_definitions[f"{self.counter():06d}_Unit"] = unit_definition
+                unit_definition["DisplayUnit"] = {"_attributes": unit.display_unit.to_attributes()}
+            unit_definitions[f"{index:06d}_Unit"] = unit_definition
         osp_model_description["UnitDefinitions"] = unit_definitions
 
         # Variable Groups
         variable_groups = {}
-        for variable_name, variable in self.variables.items():
+        for index, (variable_name, variable) in enumerate(self.variables.items()):
             if not variable.quantity:
                 logger.warning(f"component {self.name}: no quantity defined for variable {variable_name}")
             if not variable.unit:
                 logger.warning(f"component {self.name}: no unit defined for variable {variable_name}")
             quantity_name = variable.quantity or "UNKNOWN"
             quantity_unit = variable.unit or "UNKNOWN"
-            variable_groups[f"{self.counter():06d}_Generic"] = {
+            variable_groups[f"{index:06d}_Generic"] = {
                 "_attributes": {"name": quantity_name},
                 quantity_name: {
                     "_attributes": {"name": quantity_name},
@@ -270,7 +354,7 @@ class Component:
             "_rootTag": "ospModelDescription",
         }
 
-        DictWriter.write(source_dict=osp_model_description, target_file=osp_model_description_file)
+        return osp_model_description
 
     def _clean(self, file_to_remove: str | Path) -> None:
         """Clean up single file."""
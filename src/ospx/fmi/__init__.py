@@ -2,10 +2,22 @@ from ospx.fmi.experiment import Experiment as Experiment
 from ospx.fmi.unit import (
     Unit as Unit,
     BaseUnit as BaseUnit,
+    UnitTable as UnitTable,
     DisplayUnit as DisplayUnit,
+    intern_unit as intern_unit,
 )
 from ospx.fmi.variable import (
+    Causality as Causality,
+    DataType as DataType,
     ScalarVariable as ScalarVariable,
+    Variability as Variability,
+    VariableTable as VariableTable,
+    CastFailure as CastFailure,
+    cast_to_fmi_data_types as cast_to_fmi_data_types,
     get_fmi_data_type as get_fmi_data_type,
 )
 from ospx.fmi.fmu import FMU as FMU
+from ospx.fmi.cache import (
+    FMUCache as FMUCache,
+    load_fmu as load_fmu,
+)
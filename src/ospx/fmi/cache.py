@@ -0,0 +1,173 @@
+"""In-memory cache keeping parsed FMUs warm across builds."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+from ospx.fmi.fmu import FMU
+from ospx.utils.profiling import count
+
+if TYPE_CHECKING:
+    import os
+    from types import TracebackType
+
+__all__ = ["FMUCache", "load_fmu"]
+
+logger = logging.getLogger(__name__)
+
+# The FMU cache currently serving load_fmu() (if any).
+_active_fmu_cache: FMUCache | None = None
+
+
+class FMUCache:
+    """Keeps parsed FMUs in memory, so that repeated builds do not re-parse unchanged FMUs.
+
+    An FMUCache gets activated by using it as a context manager.
+    While active, `load_fmu()` serves FMUs from it.
+    Each cache entry is validated against size and modification time of the FMU file when being served.
+    An FMU file that changed on disk hence gets re-parsed automatically.
+    """
+
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+        self._fmus: dict[Path, tuple[tuple[int, int], FMU]] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._key_locks: dict[Path, threading.Lock] = {}
+        self._previous_fmu_cache: FMUCache | None = None
+
+    def __enter__(self) -> Self:
+        global _active_fmu_cache
+        self._previous_fmu_cache = _active_fmu_cache
+        _active_fmu_cache = self
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        global _active_fmu_cache
+        _active_fmu_cache = self._previous_fmu_cache
+        self._previous_fmu_cache = None
+
+    def __len__(self) -> int:
+        return len(self._fmus)
+
+    def get(self, file: str | os.PathLike[str]) -> FMU:
+        """Return the FMU for the passed in file, parsing it only if it is not cached or changed on disk.
+
+        Parameters
+        ----------
+        file : str | os.PathLike[str]
+            the FMU file
+
+        Returns
+        -------
+        FMU
+            the (cached) FMU
+        """
+        file = file if isinstance(file, Path) else Path(file)
+        key = file.resolve()
+        stat = _file_stat(key)
+        with self._lock:
+            if fmu := self._lookup(key, stat):
+                return fmu
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        # Threads requesting the same FMU concurrently wait for the first one to parse it, instead of parsing it again.
+        with key_lock:
+            with self._lock:
+                if fmu := self._lookup(key, stat):
+                    return fmu
+            fmu = FMU(file)
+            with self._lock:
+                self.misses += 1
+                if stat:
+                    self._fmus[key] = (stat, fmu)
+        return fmu
+
+    def _lookup(self, key: Path, stat: tuple[int, int] | None) -> FMU | None:
+        """Return the cached FMU if it is up to date, counting the hit. Must be called holding self._lock."""
+        entry = self._fmus.get(key)
+        if entry and stat and entry[0] == stat:
+            self.hits += 1
+            count("fmuCacheHits")
+            return entry[1]
+        return None
+
+    def invalidate(self, file: str | os.PathLike[str] | None = None) -> int:
+        """Drop the cache entry for the passed in FMU file, or all cache entries if no file is passed in.
+
+        Parameters
+        ----------
+        file : str | os.PathLike[str] | None, optional
+            the FMU file. If None, all cache entries get dropped. By default None
+
+        Returns
+        -------
+        int
+            number of dropped cache entries
+        """
+        with self._lock:
+            if file is None:
+                dropped = len(self._fmus)
+                self._fmus.clear()
+                return dropped
+            return 1 if self._fmus.pop(Path(file).resolve(), None) else 0
+
+    def prune(self) -> int:
+        """Drop all cache entries whose FMU file changed on disk or no longer exists.
+
+        Returns
+        -------
+        int
+            number of dropped cache entries
+        """
+        with self._lock:
+            outdated = [key for key, (stat, _) in self._fmus.items() if _file_stat(key) != stat]
+            for key in outdated:
+                del self._fmus[key]
+        if outdated:
+            logger.debug(f"FMUCache: dropped {len(outdated)} outdated entries.")
+        return len(outdated)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the cache statistics as a (json serializable) dict.
+
+        Returns
+        -------
+        dict[str, Any]
+            dict with number of entries, hits and misses
+        """
+        return {"entries": len(self), "hits": self.hits, "misses": self.misses}
+
+
+def load_fmu(file: str | os.PathLike[str]) -> FMU:
+    """Return the FMU for the passed in file, served from the active FMUCache if there is one.
+
+    Parameters
+    ----------
+    file : str | os.PathLike[str]
+        the FMU file
+
+    Returns
+    -------
+    FMU
+        the FMU
+    """
+    if _active_fmu_cache is None:
+        return FMU(file)
+    return _active_fmu_cache.get(file)
+
+
+def _file_stat(file: Path) -> tuple[int, int] | None:
+    """Return size and modification time (in ns) of the passed in file, or None if the file does not exist."""
+    try:
+        stat = file.stat()
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns)
@@ -4,27 +4,29 @@ import logging
 import os
 import platform
 import re
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy, deepcopy
 from datetime import UTC, datetime
 from pathlib import Path
-from shutil import copyfile
 from typing import TYPE_CHECKING, Any
 from zipfile import ZipFile
 
 from dictIO import SDict, XmlFormatter, XmlParser
 from dictIO.utils.counter import BorgCounter
 
-from ospx.fmi import BaseUnit, DisplayUnit, Experiment, ScalarVariable, Unit
-from ospx.utils.dict import find_key, find_type_identifier_in_keys, shrink_dict
+from ospx.fmi import BaseUnit, DisplayUnit, Experiment, ScalarVariable, Unit, VariableTable, intern_unit
+from ospx.utils.dict import find_key, find_type_identifier_in_keys
+from ospx.utils.file import write_text_atomic
+from ospx.utils.profiling import count
 from ospx.utils.zip import (
     add_file_content_to_zip,
+    copy_zip,
     read_file_content_from_zip,
     remove_files_from_zip,
-    rename_file_in_zip,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, MutableMapping
+    from collections.abc import Mapping, MutableMapping, Sequence
 
 __all__ = ["FMU"]
 
@@ -37,7 +39,23 @@ class FMU:
     See also https://github.com/modelica/fmi-standard/blob/v2.0.x/schema/fmi2ModelDescription.xsd
     """
 
-    def __init__(self, file: str | os.PathLike[str]) -> None:
+    def __init__(
+        self,
+        file: str | os.PathLike[str],
+        *,
+        model_description: SDict[str, Any] | None = None,
+    ) -> None:
+        """Instantiate an FMU.
+
+        Parameters
+        ----------
+        file : str | os.PathLike[str]
+            the FMU file
+        model_description : SDict[str, Any] | None, optional
+            the (already parsed) model description of the FMU. If passed in, the model description
+            is not read from the FMU file. Use this only if the passed in model description
+            is known to match the modelDescription.xml inside the FMU. By default None
+        """
         # Make sure fmu_file argument is of type Path. If not, cast it to Path type.
         file = file if isinstance(file, Path) else Path(file)
         if not file.exists():
@@ -45,7 +63,12 @@ class FMU:
             raise FileNotFoundError(file)
 
         self.file: Path = file
-        self.model_description: SDict[str, Any] = self._read_model_description()
+        # Cache of the units and scalar variables read from the model description.
+        # Invalidated whenever the model description gets read, written or modified.
+        self._units: dict[str, Unit] | None = None
+        self._variables: dict[str, ScalarVariable] | None = None
+        self._variable_table: VariableTable | None = None
+        self.model_description: SDict[str, Any] = model_description or self._read_model_description()
         self.counter = BorgCounter()
 
     def _read_model_description(self) -> SDict[str, Any]:
@@ -60,6 +83,8 @@ class FMU:
         self._clean_solver_internal_variables(model_description)
 
         self.model_description = model_description
+        self._invalidate_caches()
+        count("fmusParsed")
 
         return model_description
 
@@ -72,13 +97,9 @@ class FMU:
         """Save updated model_description both inside FMU as well as separate file in the FMUs directory."""
         if model_description:
             self.model_description = model_description
+            self._invalidate_caches()
 
-        self.model_description["_xmlOpts"]["_nameSpaces"] = {
-            "xs": "file:///C:/Software/OSP/xsd/fmi3ModelDescription.xsd"
-        }
-
-        formatter = XmlFormatter()
-        formatted_xml = formatter.to_string(self.model_description)
+        formatted_xml = _format_model_description(self.model_description)
 
         logger.info(f"{self.file.name}: write modelDescription.xml")
 
@@ -88,74 +109,91 @@ class FMU:
             _ = add_file_content_to_zip(self.file, "modelDescription.xml", formatted_xml)
 
         # Write external modelDescription.xml (separate file, beside FMU)
-        external_file = self.file.parent.absolute() / f"{self.file.stem}_ModelDescription.xml"
-        with Path.open(external_file, "w") as f:
-            _ = f.write(formatted_xml)
+        self._write_external_model_description(formatted_xml)
 
         return
 
+    def _write_external_model_description(self, formatted_xml: str) -> None:
+        """Write the model description as separate file <fmu name>_ModelDescription.xml beside the FMU."""
+        external_file = self.file.parent.absolute() / f"{self.file.stem}_ModelDescription.xml"
+        write_text_atomic(external_file, formatted_xml)
+
     @property
     def units(self) -> dict[str, Unit]:
         """Returns a dict with all units defined in the FMU.
 
+        The units are read from the model description only once and then cached.
+        Units are interned (see intern_unit()), i.e. identical units defined in multiple FMUs share one object.
+        The returned dict is a new dict, but the Unit objects it contains are shared and must not be modified.
+
         Returns
         -------
         Dict[str, Unit]
             dict with all units
         """
+        if self._units is None:
+            self._units = self._read_units()
+        return dict(self._units)
+
+    def _read_units(self) -> dict[str, Unit]:
+        """Read all unit definitions from the model description."""
         model_unit_definitions: MutableMapping[Any, Any] = {}
         if unit_definitions_key := find_key(self.model_description, "UnitDefinitions$"):
             model_unit_definitions = self.model_description[unit_definitions_key]
-            # make sure unit definitions are unique (e.g. to keep XML files clean)
-            model_unit_definitions = shrink_dict(model_unit_definitions, unique_key=["_attributes", "name"])
         unit_definitions: dict[str, Unit] = {}
         for u in model_unit_definitions.values():
-            unit = Unit()
-            unit.name = u["_attributes"]["name"]
-            # BaseUnit
-            if base_unit_key := find_key(u, "BaseUnit$"):
-                unit.base_unit = BaseUnit()
-                if "kg" in u[base_unit_key]["_attributes"]:
-                    unit.base_unit.kg = u[base_unit_key]["_attributes"]["kg"]
-                if "m" in u[base_unit_key]["_attributes"]:
-                    unit.base_unit.m = u[base_unit_key]["_attributes"]["m"]
-                if "s" in u[base_unit_key]["_attributes"]:
-                    unit.base_unit.s = u[base_unit_key]["_attributes"]["s"]
-                if "A" in u[base_unit_key]["_attributes"]:
-                    unit.base_unit.A = u[base_unit_key]["_attributes"]["A"]
-                if "K" in u[base_unit_key]["_attributes"]:
-                    unit.base_unit.K = u[base_unit_key]["_attributes"]["K"]
-                if "mol" in u[base_unit_key]["_attributes"]:
-                    unit.base_unit.mol = u[base_unit_key]["_attributes"]["mol"]
-                if "cd" in u[base_unit_key]["_attributes"]:
-                    unit.base_unit.cd = u[base_unit_key]["_attributes"]["cd"]
-                if "rad" in u[base_unit_key]["_attributes"]:
-                    unit.base_unit.rad = u[base_unit_key]["_attributes"]["rad"]
-                if "factor" in u[base_unit_key]["_attributes"]:
-                    unit.base_unit.factor = u[base_unit_key]["_attributes"]["factor"]
-                if "offset" in u[base_unit_key]["_attributes"]:
-                    unit.base_unit.offset = u[base_unit_key]["_attributes"]["offset"]
-            # DisplayUnit
-            if display_unit_key := find_key(u, "DisplayUnit$"):
-                unit.display_unit = DisplayUnit()
-                if "name" in u[display_unit_key]["_attributes"]:
-                    unit.display_unit.name = u[display_unit_key]["_attributes"]["name"]
-                if "factor" in u[display_unit_key]["_attributes"]:
-                    unit.display_unit.factor = u[display_unit_key]["_attributes"]["factor"]
-                if "offset" in u[display_unit_key]["_attributes"]:
-                    unit.display_unit.offset = u[display_unit_key]["_attributes"]["offset"]
-            unit_definitions[unit.name] = unit
+            name = u["_attributes"]["name"]
+            # make sure unit definitions are unique (e.g. to keep XML files clean). The first definition wins.
+            if name in unit_definitions:
+                continue
+            unit = Unit(name=name)
+            has_display_unit: bool = False
+            for key, element in u.items():
+                # (note: only the first BaseUnit and the first DisplayUnit element are regarded)
+                if key.endswith("BaseUnit"):
+                    if unit.base_unit is None:
+                        unit.base_unit = BaseUnit.from_attributes(element["_attributes"])
+                elif key.endswith("DisplayUnit") and not has_display_unit:
+                    unit.display_unit = DisplayUnit.from_attributes(element["_attributes"])
+                    has_display_unit = True
+            unit_definitions[unit.name] = intern_unit(unit)
         return unit_definitions
 
     @property
     def variables(self) -> dict[str, ScalarVariable]:
         """Returns a dict with all scalar variables defined in the FMU.
 
+        The scalar variables are read from the model description only once and then cached.
+        The returned dict is a new dict, but the ScalarVariable objects it contains are shared.
+        Callers that need to modify a variable shall hence modify a copy of it
+        (as Component does for variables with initial values).
+
         Returns
         -------
         dict[str, ScalarVariable]
             dict with all scalar variables
         """
+        if self._variables is None:
+            self._variables = self._read_variables()
+        return dict(self._variables)
+
+    @property
+    def variable_table(self) -> VariableTable:
+        """Returns a compact, column-oriented table of all scalar variables defined in the FMU.
+
+        Returns
+        -------
+        VariableTable
+            table with all scalar variables
+        """
+        if self._variable_table is None:
+            if self._variables is None:
+                self._variables = self._read_variables()
+            self._variable_table = VariableTable(self._variables)
+        return self._variable_table
+
+    def _read_variables(self) -> dict[str, ScalarVariable]:
+        """Read all scalar variables from the model description."""
         model_variables_key = find_key(self.model_description, "ModelVariables$")
         if not model_variables_key:
             return {}
@@ -194,6 +232,7 @@ class FMU:
                             variable.start = v[type_key]["_attributes"]["start"]
                 variables[variable.name] = variable
 
+        count("variablesProcessed", len(variables))
         return variables
 
     @property
@@ -225,6 +264,11 @@ class FMU:
     def copy(self, new_name: str) -> FMU:
         """Save a copy of the FMU with a new name.
 
+        The copy is written in a single pass: Members of the FMU archive are copied as raw (compressed) bytes,
+        binaries (.dll, .so, .dylib) named after the FMU are renamed to match the new name on the fly,
+        and the updated modelDescription.xml is written into the new FMU right away.
+        The new FMU object is built from the updated model description in memory, without re-reading it.
+
         Parameters
         ----------
         new_name : str
@@ -234,29 +278,101 @@ class FMU:
         -------
         FMU
             The new FMU
+
+        Raises
+        ------
+        ValueError
+            if the new name is identical with the existing name
+        """
+        with ZipFile(self.file, "r") as document:
+            file_names = document.namelist()
+        return self._write_copy(new_name, file_names)
+
+    def clone(
+        self,
+        clones: Sequence[tuple[str, Mapping[str, Any]]],
+        max_workers: int | None = None,
+    ) -> list[FMU]:
+        """Save multiple renamed copies of the FMU, each with its own start values.
+
+        The FMU is used as template: Each clone is a copy of the FMU (see copy()),
+        with the start values of the passed in variables overridden in its modelDescription.xml.
+        The template's archive index and scalar variables are read only once and shared by all clones.
+        The clones are written concurrently, using a pool of worker threads.
+
+        Parameters
+        ----------
+        clones : Sequence[tuple[str, Mapping[str, Any]]]
+            one (new_name, start_values) tuple per clone. start_values maps variable names to their new start values.
+            Start values are casted to the data type of the respective variable.
+        max_workers : int | None, optional
+            maximum number of worker threads. If None, the default of ThreadPoolExecutor is used. By default None
+
+        Returns
+        -------
+        list[FMU]
+            The new FMUs, in the same order as passed in
+
+        Raises
+        ------
+        ValueError
+            if the name of a clone is identical with the name of the FMU
         """
+        with ZipFile(self.file, "r") as document:
+            file_names = document.namelist()
+        template_variables = self.variables
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._write_copy,
+                    new_name,
+                    file_names,
+                    self._start_value_overrides(new_name, start_values, template_variables),
+                )
+                for new_name, start_values in clones
+            ]
+            return [future.result() for future in futures]
+
+    def _start_value_overrides(
+        self,
+        new_name: str,
+        start_values: Mapping[str, Any],
+        template_variables: Mapping[str, ScalarVariable],
+    ) -> dict[str, ScalarVariable]:
+        """Return copies of the template variables, with their start values overridden."""
+        variables_with_start_values: dict[str, ScalarVariable] = {}
+        for variable_name, start in start_values.items():
+            if variable_name not in template_variables:
+                logger.warning(
+                    f"{self.file.name} clone {new_name}: variable {variable_name} does not exist. Start value ignored."
+                )
+                continue
+            variable = copy(template_variables[variable_name])
+            variable.start = start
+            variables_with_start_values[variable_name] = variable
+        return variables_with_start_values
+
+    def _write_copy(
+        self,
+        new_name: str,
+        file_names: list[str],
+        variables_with_start_values: dict[str, ScalarVariable] | None = None,
+    ) -> FMU:
+        """Write a renamed copy of the FMU, optionally with modified start values, and return it as new FMU."""
         # Prepare
         new_name = Path(new_name).stem
         existing_file_name = self.file.stem
         if new_name == existing_file_name:
-            logger.error(f"{self.file.name} copy: new name {new_name} is identical with existing name. copy() aborted.")
+            msg = f"{self.file.name} copy: new name {new_name} is identical with existing name. copy() aborted."
+            logger.error(msg)
+            raise ValueError(msg)
         new_model_description: SDict[str, Any] = deepcopy(self.model_description)
         new_file = self.file.parent.absolute() / f"{new_name}.fmu"
 
-        # Copy FMU
-        _ = copyfile(self.file, new_file)
-
-        # Rename *.dll files in FMU to match new fmu name
-        with ZipFile(new_file, "r") as document:
-            dll_file_names = [
-                file.filename
-                for file in document.infolist()
-                if re.search(r".*\.dll$", file.filename) and existing_file_name in file.filename
-            ]
-        new_dll_file_names = [re.sub(existing_file_name, new_name, dll_file_name) for dll_file_name in dll_file_names]
-        for dll_file_name, new_dll_file_name in zip(dll_file_names, new_dll_file_names, strict=False):
-            logger.info(f"{self.file.name} copy: renaming dll {dll_file_name} to {new_dll_file_name}")
-            _ = rename_file_in_zip(new_file, dll_file_name, new_dll_file_name)
+        # Rename binaries in FMU to match new fmu name
+        binary_renames = _binary_renames(file_names, existing_file_name, new_name)
+        for binary_file_name, new_binary_file_name in binary_renames.items():
+            logger.info(f"{self.file.name} copy: renaming binary {binary_file_name} to {new_binary_file_name}")
 
         # Rename <fmiModelDescription modelName> in modelDescription.xml
         new_model_description["_xmlOpts"]["_rootAttributes"]["modelName"] = new_name
@@ -268,12 +384,25 @@ class FMU:
             co_simulation: MutableMapping[str, Any] = new_model_description[_key]
             co_simulation["_attributes"]["modelIdentifier"] = new_name
 
+        # Modify start values
+        if variables_with_start_values:
+            logger.info(f"{new_name}.fmu: update start values of variables in modelDescription.xml")
+            _set_start_values(new_model_description, variables_with_start_values, f"{new_name}.fmu")
+
         # Log the update in modelDescription.xml
         self._log_update_in_model_description(new_model_description)
 
-        # Write updated modelDescription.xml into new FMU
-        new_fmu = FMU(new_file)
-        new_fmu._write_model_description(new_model_description)
+        # Write the new FMU, with renamed binaries and updated modelDescription.xml
+        formatted_xml = _format_model_description(new_model_description)
+        copy_zip(
+            self.file,
+            new_file,
+            renames=binary_renames,
+            replacements={"modelDescription.xml": formatted_xml},
+        )
+
+        new_fmu = FMU(new_file, model_description=new_model_description)
+        new_fmu._write_external_model_description(formatted_xml)
 
         return new_fmu
 
@@ -310,43 +439,17 @@ class FMU:
         """Modify the start values of variables inside the FMUs modelDescription.xml."""
         logger.info(f"{self.file.name}: update start values of variables in modelDescription.xml")  # 2
 
-        names_of_variables_with_start_values: list[str] = [
-            variable.name for _, variable in variables_with_start_values.items()
-        ]
-
-        if _key := find_key(
-            dict_in=self.model_description,
-            pattern="ModelVariables$",
-        ):
-            model_variables: MutableMapping[Any, Any] = self.model_description[_key]
-
-            for model_variable_key, model_variable_properties in model_variables.items():
-                model_variable_name: str = model_variable_properties["_attributes"]["name"]
-
-                if model_variable_name in names_of_variables_with_start_values:
-                    variable_with_start_values = variables_with_start_values[model_variable_name]
-                    type_identifier = find_type_identifier_in_keys(model_variable_properties)
-                    type_key = find_key(model_variable_properties, f"{type_identifier}$")
-
-                    logger.info(
-                        f"{self.file.name}: update start values for variable {model_variable_name}:\n"
-                        f"\tstart:\t\t{variable_with_start_values.start}\n"
-                        f"\tcausality:\t {variable_with_start_values.causality}\n"
-                        f"\tvariability:\t{variable_with_start_values.variability}"
-                    )
-
-                    model_variables[model_variable_key][type_key]["_attributes"]["start"] = (
-                        variable_with_start_values.start
-                    )
-                    model_variables[model_variable_key]["_attributes"]["causality"] = (
-                        variable_with_start_values.causality
-                    )
-                    model_variables[model_variable_key]["_attributes"]["variability"] = (
-                        variable_with_start_values.variability
-                    )
+        if _set_start_values(self.model_description, variables_with_start_values, self.file.name):
+            self._invalidate_caches()
 
         self._log_update_in_model_description()
 
+    def _invalidate_caches(self) -> None:
+        """Invalidate the cached units and scalar variables, e.g. after the model description was modified."""
+        self._units = None
+        self._variables = None
+        self._variable_table = None
+
     def _log_update_in_model_description(
         self,
         model_description: SDict[str, Any] | None = None,
@@ -381,3 +484,63 @@ class FMU:
             if "_origin" in model_variables[model_variable_key]:
                 model_variables[model_variable_key]["_origin"] = model_name
         return
+
+
+def _format_model_description(model_description: SDict[str, Any]) -> str:
+    """Format the model description as XML string."""
+    model_description["_xmlOpts"]["_nameSpaces"] = {"xs": "file:///C:/Software/OSP/xsd/fmi3ModelDescription.xsd"}
+    formatter = XmlFormatter()
+    return formatter.to_string(model_description)
+
+
+def _binary_renames(file_names: list[str], existing_name: str, new_name: str) -> dict[str, str]:
+    """Return the binaries (.dll, .so, .dylib) named after the FMU, mapped to their names after renaming the FMU."""
+    binary_renames: dict[str, str] = {}
+    for file_name in file_names:
+        folder, _, base_name = file_name.rpartition("/")
+        if re.search(r"\.(dll|so|dylib)$", base_name) and existing_name in base_name:
+            new_base_name = base_name.replace(existing_name, new_name)
+            binary_renames[file_name] = f"{folder}/{new_base_name}" if folder else new_base_name
+    return binary_renames
+
+
+def _set_start_values(
+    model_description: MutableMapping[Any, Any],
+    variables_with_start_values: Mapping[str, ScalarVariable],
+    fmu_name: str,
+) -> bool:
+    """Set start value, causality and variability of the passed in variables in the model description.
+
+    Returns True if the model description contains model variables (and hence might have been modified).
+    """
+    _key = find_key(
+        dict_in=model_description,
+        pattern="ModelVariables$",
+    )
+    if not _key:
+        return False
+    model_variables: MutableMapping[Any, Any] = model_description[_key]
+
+    for model_variable_key, model_variable_properties in model_variables.items():
+        model_variable_name: str = model_variable_properties["_attributes"]["name"]
+
+        if model_variable_name in variables_with_start_values:
+            variable_with_start_values = variables_with_start_values[model_variable_name]
+            type_identifier = find_type_identifier_in_keys(model_variable_properties)
+            type_key = find_key(model_variable_properties, f"{type_identifier}$")
+
+            logger.info(
+                f"{fmu_name}: update start values for variable {model_variable_name}:\n"
+                f"\tstart:\t\t{variable_with_start_values.start}\n"
+                f"\tcausality:\t {variable_with_start_values.causality}\n"
+                f"\tvariability:\t{variable_with_start_values.variability}"
+            )
+
+            model_variables[model_variable_key][type_key]["_attributes"]["start"] = variable_with_start_values.start
+            model_variables[model_variable_key]["_attributes"]["causality"] = variable_with_start_values.causality
+            # (note: variability is optional in fmi 2.0. Do not write it if undefined.)
+            if variable_with_start_values.variability is not None:
+                model_variables[model_variable_key]["_attributes"]["variability"] = (
+                    variable_with_start_values.variability
+                )
+    return True
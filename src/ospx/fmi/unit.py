@@ -1,10 +1,28 @@
+from __future__ import annotations
+
 import logging
+import threading
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from numpy.typing import NDArray
 
-__all__ = ["BaseUnit", "DisplayUnit", "Unit"]
+__all__ = ["BaseUnit", "DisplayUnit", "Unit", "UnitTable", "intern_unit"]
 
 logger = logging.getLogger(__name__)
 
+# Attributes of the BaseUnit and DisplayUnit elements, in the order they get written.
+# (The attribute names are identical in the fmi 2.0 XML schema and in the data classes below.)
+BASE_UNIT_ATTRIBUTES: tuple[str, ...] = ("kg", "m", "s", "A", "K", "mol", "cd", "rad", "factor", "offset")
+DISPLAY_UNIT_ATTRIBUTES: tuple[str, ...] = ("name", "factor", "offset")
+# Exponents of the SI base units (and rad) spanning the dimension of a BaseUnit, in the order of the exponent vectors.
+BASE_UNIT_EXPONENTS: tuple[str, ...] = BASE_UNIT_ATTRIBUTES[:8]
+
 
 @dataclass()
 class BaseUnit:
@@ -26,6 +44,45 @@ class BaseUnit:
     factor: float = 1.0
     offset: float = 0.0
 
+    @classmethod
+    def from_attributes(cls, attributes: Mapping[str, Any]) -> BaseUnit:
+        """Create a BaseUnit from the attributes of a <BaseUnit> element.
+
+        Parameters
+        ----------
+        attributes : Mapping[str, Any]
+            attributes of the <BaseUnit> element. Missing attributes get their default value.
+
+        Returns
+        -------
+        BaseUnit
+            the created BaseUnit
+        """
+        return cls(**{name: attributes[name] for name in BASE_UNIT_ATTRIBUTES if name in attributes})
+
+    def to_attributes(self) -> dict[str, Any]:
+        """Return the attributes of the <BaseUnit> element. Attributes with a value of zero are omitted.
+
+        Returns
+        -------
+        dict[str, Any]
+            attributes of the <BaseUnit> element
+        """
+        return {name: value for name in BASE_UNIT_ATTRIBUTES if (value := getattr(self, name))}
+
+    @property
+    def exponents(self) -> tuple[int, ...]:
+        """Returns the exponents of the SI base units kg, m, s, A, K, mol, cd and rad.
+
+        Two units are dimensionally compatible if their exponents are equal.
+
+        Returns
+        -------
+        tuple[int, ...]
+            the exponents, in the order kg, m, s, A, K, mol, cd, rad
+        """
+        return tuple(int(getattr(self, name)) for name in BASE_UNIT_EXPONENTS)
+
 
 @dataclass()
 class DisplayUnit:
@@ -43,6 +100,32 @@ class DisplayUnit:
     factor: float = 1.0
     offset: float = 0.0
 
+    @classmethod
+    def from_attributes(cls, attributes: Mapping[str, Any]) -> DisplayUnit:
+        """Create a DisplayUnit from the attributes of a <DisplayUnit> element.
+
+        Parameters
+        ----------
+        attributes : Mapping[str, Any]
+            attributes of the <DisplayUnit> element. Missing attributes get their default value.
+
+        Returns
+        -------
+        DisplayUnit
+            the created DisplayUnit
+        """
+        return cls(**{name: attributes[name] for name in DISPLAY_UNIT_ATTRIBUTES if name in attributes})
+
+    def to_attributes(self) -> dict[str, Any]:
+        """Return the attributes of the <DisplayUnit> element.
+
+        Returns
+        -------
+        dict[str, Any]
+            attributes of the <DisplayUnit> element
+        """
+        return {name: getattr(self, name) for name in DISPLAY_UNIT_ATTRIBUTES}
+
 
 @dataclass()
 class Unit:
@@ -56,3 +139,160 @@ class Unit:
     name: str = field(default_factory=lambda: "-")
     base_unit: BaseUnit | None = None
     display_unit: DisplayUnit = field(default_factory=DisplayUnit)
+
+
+# Registry of interned units, see intern_unit()
+_interned_units: dict[tuple[Any, ...], Unit] = {}
+_interned_units_lock: threading.Lock = threading.Lock()
+
+
+def intern_unit(unit: Unit) -> Unit:
+    """Return the interned instance of a unit.
+
+    Units that are identical in name, base unit and display unit are interned into one and the same Unit object,
+    so that identical units defined in multiple FMUs share one object.
+    As interned units are shared, they must not be modified.
+
+    Parameters
+    ----------
+    unit : Unit
+        the unit to be interned
+
+    Returns
+    -------
+    Unit
+        the interned unit. Either a formerly interned unit identical with the passed in unit,
+        or the passed in unit itself, if it is the first of its kind.
+    """
+    key = (
+        unit.name,
+        None if unit.base_unit is None else _key_values(unit.base_unit, BASE_UNIT_ATTRIBUTES),
+        _key_values(unit.display_unit, DISPLAY_UNIT_ATTRIBUTES),
+    )
+    with _interned_units_lock:
+        return _interned_units.setdefault(key, unit)
+
+
+def _key_values(obj: BaseUnit | DisplayUnit, names: tuple[str, ...]) -> tuple[tuple[Any, type], ...]:
+    """Return the values of the named attributes, each paired with its type.
+
+    Pairing with the type keeps e.g. 1 and 1.0 apart, which compare equal but get written differently.
+    """
+    values = [getattr(obj, name) for name in names]
+    return tuple(zip(values, map(type, values), strict=True))
+
+
+class UnitTable:
+    r"""Compact, column-oriented table of distinct base units.
+
+    Each base unit is encoded as integer exponent vector (kg, m, s, A, K, mol, cd, rad)
+    plus the affine transformation to the SI base units (factor, offset): \n
+    base unit value = factor * unit value + offset \n
+    Base units with identical exponents, factor and offset are interned into one row,
+    so that the table holds each distinct base unit only once, however many variables refer to it.
+    The exponents are stored in a NumPy integer array of shape (units, 8), factors and offsets in NumPy float arrays.
+    This allows to compare the units of even large numbers of connections by vectorized operations.
+    """
+
+    def __init__(self, base_units: Iterable[BaseUnit] = ()) -> None:
+        self._index: dict[tuple[tuple[int, ...], float, float], int] = {}
+        for base_unit in base_units:
+            _ = self.add(base_unit)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def add(self, base_unit: BaseUnit) -> int:
+        """Add a base unit to the table, unless an identical base unit is already contained.
+
+        Parameters
+        ----------
+        base_unit : BaseUnit
+            the base unit
+
+        Returns
+        -------
+        int
+            row index of the base unit
+        """
+        key = (base_unit.exponents, float(base_unit.factor), float(base_unit.offset))
+        return self._index.setdefault(key, len(self._index))
+
+    @property
+    def exponents(self) -> NDArray[np.int64]:
+        """Returns the exponent vectors of all base units.
+
+        Returns
+        -------
+        NDArray[np.int64]
+            exponents, one row per base unit and one column per SI base unit (kg, m, s, A, K, mol, cd, rad)
+        """
+        return np.array([key[0] for key in self._index], dtype=np.int64).reshape(-1, len(BASE_UNIT_EXPONENTS))
+
+    @property
+    def factors(self) -> NDArray[np.float64]:
+        """Returns the factors of all base units.
+
+        Returns
+        -------
+        NDArray[np.float64]
+            factors, one element per base unit
+        """
+        return np.fromiter((key[1] for key in self._index), dtype=np.float64, count=len(self._index))
+
+    @property
+    def offsets(self) -> NDArray[np.float64]:
+        """Returns the offsets of all base units.
+
+        Returns
+        -------
+        NDArray[np.float64]
+            offsets, one element per base unit
+        """
+        return np.fromiter((key[2] for key in self._index), dtype=np.float64, count=len(self._index))
+
+    def compatible(self, sources: NDArray[np.int64], targets: NDArray[np.int64]) -> NDArray[np.bool_]:
+        """Return whether the base units in sources are dimensionally compatible with those in targets, pairwise.
+
+        Parameters
+        ----------
+        sources : NDArray[np.int64]
+            row indices of the source base units
+        targets : NDArray[np.int64]
+            row indices of the target base units
+
+        Returns
+        -------
+        NDArray[np.bool_]
+            True where source and target have equal exponents, one element per pair
+        """
+        exponents = self.exponents
+        return np.all(exponents[sources] == exponents[targets], axis=1)
+
+    def linear_transformations(
+        self,
+        sources: NDArray[np.int64],
+        targets: NDArray[np.int64],
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        r"""Return the linear transformations converting values in the source units into the target units, pairwise.
+
+        target value = factor * source value + offset \n
+        The transformations are meaningful only for dimensionally compatible units, see compatible().
+
+        Parameters
+        ----------
+        sources : NDArray[np.int64]
+            row indices of the source base units
+        targets : NDArray[np.int64]
+            row indices of the target base units
+
+        Returns
+        -------
+        tuple[NDArray[np.float64], NDArray[np.float64]]
+            factors and offsets, one element per pair
+        """
+        factors, offsets = self.factors, self.offsets
+        return (
+            factors[sources] / factors[targets],
+            (offsets[sources] - offsets[targets]) / factors[targets],
+        )
@@ -1,23 +1,98 @@
 import logging
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from enum import IntEnum
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from dictIO import Formatter, NativeFormatter, Parser
+from numpy.typing import NDArray
 
 if TYPE_CHECKING:
     from dictIO.types import TSingleValue
 
-__all__ = ["ScalarVariable", "get_fmi_data_type"]
+__all__ = [
+    "CastFailure",
+    "Causality",
+    "DataType",
+    "ScalarVariable",
+    "Variability",
+    "VariableTable",
+    "cast_to_fmi_data_types",
+    "get_fmi_data_type",
+]
 
 logger = logging.getLogger(__name__)
 
 
+class DataType(IntEnum):
+    """fmi 2.0 data type of a ScalarVariable, as integer code.
+
+    The member names are the literals used in the fmi 2.0 modelDescription.
+    """
+
+    Real = 0
+    Integer = 1
+    Boolean = 2
+    String = 3
+    Enumeration = 4
+
+
+class Causality(IntEnum):
+    """fmi 2.0 causality of a ScalarVariable, as integer code.
+
+    The member names are the literals used in the fmi 2.0 modelDescription.
+    """
+
+    parameter = 0
+    calculatedParameter = 1  # noqa: N815
+    input = 2
+    output = 3
+    local = 4
+    independent = 5
+    structuralParameter = 6  # noqa: N815
+
+
+class Variability(IntEnum):
+    """fmi 2.0 variability of a ScalarVariable, as integer code.
+
+    The member names are the literals used in the fmi 2.0 modelDescription.
+    """
+
+    constant = 0
+    fixed = 1
+    tunable = 2
+    discrete = 3
+    continuous = 4
+
+
+# Lookup tables from integer code to literal.
+# (Faster than accessing Enum.name, which is a descriptor.)
+_DATA_TYPE_NAMES: tuple[str, ...] = tuple(member.name for member in DataType)
+_CAUSALITY_NAMES: tuple[str, ...] = tuple(member.name for member in Causality)
+_VARIABILITY_NAMES: tuple[str, ...] = tuple(member.name for member in Variability)
+
+
 class ScalarVariable:
     """fmi 2.0 ScalarVariable.
 
     See https://github.com/modelica/fmi-standard/blob/v2.0.x/schema/fmi2ScalarVariable.xsd
     """
 
+    # ScalarVariables exist in large numbers. Slots keep their memory footprint small.
+    __slots__ = (
+        "_causality",
+        "_data_type",
+        "_start",
+        "_variability",
+        "description",
+        "display_unit",
+        "name",
+        "quantity",
+        "unit",
+        "value_reference",
+    )
+
     def __init__(  # noqa: PLR0913
         self,
         name: str,
@@ -33,9 +108,9 @@ class ScalarVariable:
     ) -> None:
         # Attributes
         self.name: str
-        self._data_type: str | None = None
-        self._causality: str = "local"
-        self._variability: str | None = None
+        self._data_type: DataType | None = None
+        self._causality: Causality = Causality.local
+        self._variability: Variability | None = None
         self._start: int | float | bool | str | None = None
         self.value_reference: int = 0
         self.description: str | None = None
@@ -61,7 +136,7 @@ class ScalarVariable:
     @property
     def data_type(self) -> str | None:
         """Returns the FMI data type of the scalar Variable."""
-        return self._data_type
+        return None if self._data_type is None else _DATA_TYPE_NAMES[self._data_type]
 
     @data_type.setter
     def data_type(self, value: str) -> None:
@@ -74,23 +149,21 @@ class ScalarVariable:
             "String"
             "Enumeration"
         """
-        valid_types: list[str] = [
-            "Real",
-            "Integer",
-            "Boolean",
-            "String",
-            "Enumeration",
-        ]
-        if value not in valid_types:
+        if (code := DataType.__members__.get(value)) is None:
             logger.error(f"variable {self.name}: value for data_type '{value}' is invalid.")
             return
-        self._data_type = value
+        self._data_type = code
         return
 
+    @property
+    def data_type_code(self) -> DataType | None:
+        """Returns the FMI data type of the scalar Variable as integer code."""
+        return self._data_type
+
     @property
     def causality(self) -> str:
         """Returns the causality of the scalar Variable."""
-        return self._causality
+        return _CAUSALITY_NAMES[self._causality]
 
     @causality.setter
     def causality(self, value: str) -> None:
@@ -105,25 +178,21 @@ class ScalarVariable:
             "independent"
             "structuralParameter"
         """
-        valid_values: list[str] = [
-            "parameter",
-            "calculatedParameter",
-            "input",
-            "output",
-            "local",
-            "independent",
-            "structuralParameter",
-        ]
-        if value not in valid_values:
+        if (code := Causality.__members__.get(value)) is None:
             logger.error(f"variable {self.name}: causality value '{value}' is invalid.")
             return
-        self._causality = value
+        self._causality = code
         return
 
+    @property
+    def causality_code(self) -> Causality:
+        """Returns the causality of the scalar Variable as integer code."""
+        return self._causality
+
     @property
     def variability(self) -> str | None:
         """Returns the variability of the scalar Variable."""
-        return self._variability
+        return None if self._variability is None else _VARIABILITY_NAMES[self._variability]
 
     @variability.setter
     def variability(self, value: str) -> None:
@@ -136,19 +205,17 @@ class ScalarVariable:
             "discrete"
             "continuous"
         """
-        valid_values: list[str] = [
-            "constant",
-            "fixed",
-            "tunable",
-            "discrete",
-            "continuous",
-        ]
-        if value not in valid_values:
+        if (code := Variability.__members__.get(value)) is None:
             logger.error(f"variable {self.name}: value for variability '{value}' is invalid.")
             return
-        self._variability = value
+        self._variability = code
         return
 
+    @property
+    def variability_code(self) -> Variability | None:
+        """Returns the variability of the scalar Variable as integer code."""
+        return self._variability
+
     @property
     def start(self) -> int | float | bool | str | None:
         """Returns the start value (initial value) of the scalar Variable."""
@@ -186,6 +253,143 @@ class ScalarVariable:
             self.data_type = get_fmi_data_type(self.start)
 
 
+class VariableTable:
+    """Compact, column-oriented (struct-of-arrays) table of the scalar variables of an FMU.
+
+    Each attribute of the scalar variables is held in one column.
+    Value references are stored in a NumPy integer array.
+    Data type, causality and variability are stored as their integer codes
+    (see DataType, Causality and Variability) in NumPy arrays. An undefined data type or variability is coded as -1.
+    This allows to filter even large numbers of variables by vectorized operations,
+    e.g. "all outputs of type Real": `table.select(causality="output", data_type="Real")`.
+    """
+
+    def __init__(self, variables: Mapping[str, ScalarVariable]) -> None:
+        self.names: list[str] = list(variables)
+        self._index: dict[str, int] = {name: index for index, name in enumerate(self.names)}
+        count = len(self.names)
+        self.value_references: NDArray[np.int64] = np.fromiter(
+            (variable.value_reference for variable in variables.values()),
+            dtype=np.int64,
+            count=count,
+        )
+        self.data_types: NDArray[np.int8] = np.fromiter(
+            (_code_or_undefined(variable.data_type_code) for variable in variables.values()),
+            dtype=np.int8,
+            count=count,
+        )
+        self.causalities: NDArray[np.int8] = np.fromiter(
+            (variable.causality_code for variable in variables.values()),
+            dtype=np.int8,
+            count=count,
+        )
+        self.variabilities: NDArray[np.int8] = np.fromiter(
+            (_code_or_undefined(variable.variability_code) for variable in variables.values()),
+            dtype=np.int8,
+            count=count,
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def index(self, name: str) -> int:
+        """Return the row index of the variable with the passed in name.
+
+        Parameters
+        ----------
+        name : str
+            name of the variable
+
+        Returns
+        -------
+        int
+            row index of the variable
+
+        Raises
+        ------
+        KeyError
+            if no variable with the passed in name exists in the table
+        """
+        return self._index[name]
+
+    def mask(
+        self,
+        *,
+        data_type: str | DataType | None = None,
+        causality: str | Causality | None = None,
+        variability: str | Variability | None = None,
+    ) -> NDArray[np.bool_]:
+        """Return a boolean mask selecting all variables that match the passed in attribute values.
+
+        Attribute values can be passed in either as literal or as integer code.
+        Attributes passed in as None are not filtered on.
+
+        Parameters
+        ----------
+        data_type : str | DataType | None, optional
+            data type to select, by default None
+        causality : str | Causality | None, optional
+            causality to select, by default None
+        variability : str | Variability | None, optional
+            variability to select, by default None
+
+        Returns
+        -------
+        NDArray[np.bool_]
+            boolean mask, one element per variable
+
+        Raises
+        ------
+        KeyError
+            if an attribute value is passed in that is not a valid literal
+        """
+        mask: NDArray[np.bool_] = np.ones(len(self.names), dtype=np.bool_)
+        if data_type is not None:
+            mask &= self.data_types == (DataType[data_type] if isinstance(data_type, str) else data_type)
+        if causality is not None:
+            mask &= self.causalities == (Causality[causality] if isinstance(causality, str) else causality)
+        if variability is not None:
+            mask &= self.variabilities == (Variability[variability] if isinstance(variability, str) else variability)
+        return mask
+
+    def select(
+        self,
+        *,
+        data_type: str | DataType | None = None,
+        causality: str | Causality | None = None,
+        variability: str | Variability | None = None,
+    ) -> list[str]:
+        """Return the names of all variables that match the passed in attribute values.
+
+        Attribute values can be passed in either as literal or as integer code.
+        Attributes passed in as None are not filtered on.
+
+        Parameters
+        ----------
+        data_type : str | DataType | None, optional
+            data type to select, by default None
+        causality : str | Causality | None, optional
+            causality to select, by default None
+        variability : str | Variability | None, optional
+            variability to select, by default None
+
+        Returns
+        -------
+        list[str]
+            names of the selected variables
+        """
+        mask = self.mask(data_type=data_type, causality=causality, variability=variability)
+        return [self.names[index] for index in np.flatnonzero(mask)]
+
+
+def _code_or_undefined(code: IntEnum | None) -> int:
+    """Return the passed in integer code, or -1 if it is undefined."""
+    return -1 if code is None else int(code)
+
+
 def get_fmi_data_type(arg: object) -> str:
     r"""Return the fmi 2.0 data type corresponding to Python type of the passed in argument.
 
@@ -203,12 +407,13 @@ def get_fmi_data_type(arg: object) -> str:
         valid fmi 2.0 data types are 'Integer', 'Real', 'Boolean', 'String' and 'Enumeration'
     """
     # sourcery skip: assign-if-exp, reintroduce-else
+    # (note: bool needs to be checked before int, as bool is a subclass of int)
+    if isinstance(arg, bool):
+        return "Boolean"
     if isinstance(arg, int):
         return "Integer"
     if isinstance(arg, float):
         return "Real"
-    if isinstance(arg, bool):
-        return "Boolean"
     # not regarding the content, sequence is always returned if not int or float, e.g. string.
     # requires a solution, if xs:enumeration is required.
     # elif isinstance(arg, Sequence):  # noqa: ERA001
@@ -261,3 +466,152 @@ def _cast_to_fmi_data_type(
         # cast to list
         return list(arg) if isinstance(arg, Iterable) else [arg]
     return None
+
+
+@dataclass()
+class CastFailure:
+    """Data class describing a value that could not be casted to its fmi data type."""
+
+    index: int
+    value: Any
+    data_type: str | None
+    reason: str
+
+
+def cast_to_fmi_data_types(
+    values: Sequence[Any],
+    data_types: Sequence[str | DataType | None],
+) -> tuple[list[int | float | bool | str | None], list[CastFailure]]:
+    r"""Cast a batch of values to Python data types matching the requested fmi data types.
+
+    Batch counterpart to the casting the ScalarVariable.start setter does for a single value.
+    Values are grouped by their target data type, and each group is converted in one vectorized step.
+    Only if a group fails to convert as a whole, its values are converted one by one, to pinpoint the failures.
+    Boolean values are converted one by one, accepting only booleans, the integers 0 and 1, and 'true' / 'false'.
+    None, and non-integral values for data type 'Integer', fail to convert.
+    Failures do not raise. Instead, all failures are collected and returned together.
+
+    Parameters
+    ----------
+    values : Sequence[Any]
+        The raw values to be casted, e.g. start values as read from a dict file.
+        Strings get parsed, i.e. 'true' is read as True and '1.5' as 1.5.
+    data_types : Sequence[str | DataType | None]
+        The fmi data type each value shall be casted to, one per value.\n
+        valid fmi 2.0 data types are 'Integer', 'Real', 'Boolean' and 'String'.
+        If None, the data type is derived from the Python type of the value.
+
+    Returns
+    -------
+    tuple[list[int | float | bool | str | None], list[CastFailure]]
+        The casted values (None for values which failed to cast), and the list of failures.
+
+    Raises
+    ------
+    ValueError
+        if values and data_types differ in length
+    """
+    if len(values) != len(data_types):
+        msg = f"cast_to_fmi_data_types(): got {len(values)} values but {len(data_types)} data types."
+        raise ValueError(msg)
+
+    casted_values: list[int | float | bool | str | None] = [None] * len(values)
+    failures: list[CastFailure] = []
+
+    # Group value indices by target data type
+    groups: dict[str, list[int]] = {}
+    for index, (value, data_type) in enumerate(zip(values, data_types, strict=True)):
+        if data_type is None:
+            data_type_name = get_fmi_data_type(value)
+        elif isinstance(data_type, DataType):
+            data_type_name = _DATA_TYPE_NAMES[data_type]
+        else:
+            data_type_name = data_type
+        groups.setdefault(data_type_name, []).append(index)
+
+    parser = Parser()
+    for data_type_name, indices in groups.items():
+        if data_type_name == "String":
+            for index in indices:
+                value = values[index]
+                casted_values[index] = (
+                    NativeFormatter().format_dict(value)
+                    if isinstance(value, Sequence) and not isinstance(value, str)
+                    else Formatter().format_value(value)
+                )
+            continue
+        if data_type_name == "Boolean":
+            for index in indices:
+                value = values[index]
+                casted_value = _cast_to_boolean(parser.parse_value(value) if isinstance(value, str) else value)
+                if casted_value is None:
+                    reason = "only booleans, 0, 1, 'true' and 'false' can be casted to Boolean."
+                    failures.append(CastFailure(index, value, data_type_name, reason))
+                casted_values[index] = casted_value
+            continue
+        if data_type_name not in _NUMPY_TYPES:
+            reason = (
+                "fmi data type 'Enumeration' is invalid for start."
+                if data_type_name == "Enumeration"
+                else f"'{data_type_name}' is not a valid fmi data type."
+            )
+            failures.extend(CastFailure(index, values[index], data_type_name, reason) for index in indices)
+            continue
+
+        # Parse strings, and sort out sequences, which cannot be casted to a scalar type
+        group_indices: list[int] = []
+        parsed_values: list[Any] = []
+        for index in indices:
+            value = values[index]
+            if isinstance(value, str):
+                value = parser.parse_value(value)
+            elif isinstance(value, Sequence):
+                failures.append(
+                    CastFailure(index, value, data_type_name, "a sequence cannot be casted to a scalar data type.")
+                )
+                continue
+            if value is None:
+                failures.append(CastFailure(index, values[index], data_type_name, "None cannot be casted."))
+                continue
+            if data_type_name == "Integer" and isinstance(value, float) and not value.is_integer():
+                failures.append(
+                    CastFailure(index, values[index], data_type_name, f"{value} is not an integral number.")
+                )
+                continue
+            group_indices.append(index)
+            parsed_values.append(value)
+
+        # Vectorized cast of the whole group
+        numpy_type, python_type = _NUMPY_TYPES[data_type_name]
+        try:
+            group_casted_values: list[Any] = np.asarray(parsed_values, dtype=numpy_type).tolist()
+        except (TypeError, ValueError, OverflowError):
+            # Fallback: cast one by one, to find out which values fail
+            group_casted_values = []
+            for index, value in zip(group_indices, parsed_values, strict=True):
+                try:
+                    group_casted_values.append(python_type(value))
+                except (TypeError, ValueError, OverflowError) as e:
+                    failures.append(CastFailure(index, values[index], data_type_name, str(e)))
+                    group_casted_values.append(None)
+        for index, casted_value in zip(group_indices, group_casted_values, strict=True):
+            casted_values[index] = casted_value
+
+    failures.sort(key=lambda failure: failure.index)
+    return casted_values, failures
+
+
+# numpy dtype used for the vectorized cast, and Python type used for the element-wise fallback
+_NUMPY_TYPES: dict[str, tuple[type[np.generic], type]] = {
+    "Real": (np.float64, float),
+    "Integer": (np.int64, int),
+}
+
+
+def _cast_to_boolean(value: Any) -> bool | None:  # noqa: ANN401
+    """Cast a (parsed) value to bool, if it is a boolean or the integer 0 or 1. Else, return None."""
+    if isinstance(value, bool | np.bool_):
+        return bool(value)
+    if isinstance(value, int | np.integer) and value in {0, 1}:
+        return bool(value)
+    return None
@@ -3,34 +3,165 @@
 # pyright: reportUnnecessaryTypeIgnoreComment=false
 
 import functools
+import hashlib
 import logging
+import math
+import os
 import re
+import subprocess
+import sys
+from pathlib import Path
 from typing import Any
 
 from graphviz import Digraph
 from graphviz.graphs import BaseGraph
 
 from ospx import Component, Connection, OspSimulationCase
+from ospx.utils.profiling import count
 
 __all__ = ["Graph"]
 
 logger = logging.getLogger(__name__)
 
+# Systems with more components than this are laid out with a force-directed engine and drawn in a compact style.
+LARGE_GRAPH_THRESHOLD: int = 100
+# Number of variable connections up to which a collapsed edge still lists the individual connections in its label.
+MAX_EDGE_LABEL_LINES: int = 3
+# Seconds graphviz is given to lay out and render the dependency graph.
+DEFAULT_RENDER_TIMEOUT: float = 300.0
+
+_ENGINES: tuple[str, ...] = ("dot", "sfdp", "neato", "fdp")
+_RENDER_MODES: tuple[str, ...] = ("foreground", "background", "none")
+# Tag of the comment line in the graph source that holds the hash of the graph
+_GRAPH_HASH_TAG: str = "ospx graph hash:"
+
+_GRAPHVIZ_NOT_FOUND_ERROR_MESSAGE: str = (
+    "OspSimulationCase.generate_dependency_graph(): failed to run graphviz. \n"
+    "To generate the system structure dependency graph, graphviz needs to be installed on the local machine. \n"
+    "Kindly check your local installation of graphviz."
+)
+
 
 class Graph:
     """Class providing methods to generate a visual dependency graph of a system's components and its connections."""
 
     @staticmethod
-    def generate_dependency_graph(case: OspSimulationCase) -> None:
-        """Generate a dependency graph of the system structure as pdf, for documentation.
+    def generate_dependency_graph(
+        case: OspSimulationCase,
+        *,
+        engine: str | None = None,
+        cluster_separator: str | None = None,
+        timeout: float | None = DEFAULT_RENDER_TIMEOUT,
+        render: str = "foreground",
+    ) -> None:
+        r"""Generate a dependency graph of the system structure as pdf, for documentation.
+
+        All connections between the same pair of components are drawn as one edge, weighted by their count.
+        Systems with more than LARGE_GRAPH_THRESHOLD components are laid out with the force-directed engine sfdp
+        (unless another engine is chosen explicitly) and drawn in a compact style.
+
+        The graph source (DOT) is saved as <simulation name>_callGraph, tagged with a hash of the graph.
+        If the hash matches the one of an existing graph source, i.e. neither components, FMUs, connections,
+        styles nor layout engine changed, the existing rendering is reused and graphviz is not run.
 
         Note: This requires graphviz to be installed on the local machine
+
+        Parameters
+        ----------
+        case : OspSimulationCase
+            the simulation case
+        engine : str | None, optional
+            graphviz layout engine, one of 'dot', 'sfdp', 'neato' or 'fdp'.
+            If None, 'dot' is used for small systems and 'sfdp' for large systems. By default None
+        cluster_separator : str | None, optional
+            if set, components sharing the same name prefix (the part of their name before the first occurrence
+            of cluster_separator) are grouped into a cluster. By default None
+        timeout : float | None, optional
+            time in seconds after which rendering gets aborted. If None, rendering is not aborted.
+            By default DEFAULT_RENDER_TIMEOUT
+        render : str, optional
+            how the pdf gets rendered:\n
+            'foreground': render and wait for graphviz to finish,\n
+            'background': render in a background process, without waiting for it to finish,\n
+            'none': do not render, only save the graph source (DOT).\n
+            By default 'foreground'
+
+        Raises
+        ------
+        ValueError
+            if render is not one of 'foreground', 'background' or 'none'
         """
-        graphiz_not_found_error_mesage: str = (
-            "OspSimulationCase.generate_dependency_graph(): failed to run graphviz. \n"
-            "To generate the system structure dependency graph, graphviz needs to be installed on the local machine. \n"
-            "Kindly check your local installation of graphviz."
-        )
+        if render not in _RENDER_MODES:
+            msg = f"Graph: render mode '{render}' is not supported. Supported modes are: {', '.join(_RENDER_MODES)}"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        callgraph = Graph.build_dependency_graph(case, engine=engine, cluster_separator=cluster_separator)
+        if callgraph is None:
+            return
+
+        source_file = Path(f"{case.simulation.name}_callGraph")
+        pdf_file = source_file.with_name(f"{source_file.name}.pdf")
+
+        # Tag the graph source with a hash of the graph, to detect whether a former rendering can be reused
+        graph_hash = hashlib.sha256(f"{callgraph.engine}\n{callgraph.source}".encode()).hexdigest()
+        callgraph.comment = f"{_GRAPH_HASH_TAG} {graph_hash}"
+        if _read_first_line(source_file) == f"// {callgraph.comment}":
+            if render == "none" or (
+                pdf_file.exists() and pdf_file.stat().st_mtime_ns >= source_file.stat().st_mtime_ns
+            ):
+                logger.info(f"Dependency graph unchanged. Reuse {source_file} and {pdf_file}.")
+                count("graphRendersSkipped")
+                return
+        else:
+            _ = callgraph.save(source_file)
+
+        # Create callGraph pdf
+        if render == "foreground":
+            _render(callgraph.engine, source_file, pdf_file, timeout)
+        elif render == "background":
+            _render_in_background(callgraph.engine, source_file, pdf_file, timeout)
+
+        return
+
+    @staticmethod
+    def build_dependency_graph(
+        case: OspSimulationCase,
+        *,
+        engine: str | None = None,
+        cluster_separator: str | None = None,
+    ) -> BaseGraph | None:
+        """Build the dependency graph of the system structure, without rendering it.
+
+        Parameters
+        ----------
+        case : OspSimulationCase
+            the simulation case
+        engine : str | None, optional
+            graphviz layout engine, one of 'dot', 'sfdp', 'neato' or 'fdp'.
+            If None, 'dot' is used for small systems and 'sfdp' for large systems. By default None
+        cluster_separator : str | None, optional
+            if set, components sharing the same name prefix (the part of their name before the first occurrence
+            of cluster_separator) are grouped into a cluster. By default None
+
+        Returns
+        -------
+        BaseGraph | None
+            the dependency graph, or None if it could not be created
+
+        Raises
+        ------
+        ValueError
+            if engine is not supported
+        """
+        if engine is not None and engine not in _ENGINES:
+            msg = f"Graph: layout engine '{engine}' is not supported. Supported engines are: {', '.join(_ENGINES)}"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        components = case.system_structure.components
+        large: bool = len(components) > LARGE_GRAPH_THRESHOLD
+        engine = engine or ("sfdp" if large else "dot")
 
         label: str
         shape: str
@@ -38,8 +169,8 @@ class Graph:
         color: str
         fontcolor: str
         fillcolor: str
-        penwidth: tuple[str]
-        weight: tuple[str]
+        penwidth: float
+        weight: float
 
         # Default styles
         text_size: str = "11"
@@ -77,30 +208,45 @@ class Graph:
                 "fontcolor": "magenta",
             },
         }
+        if large:
+            # Let the graph grow with the system instead of squeezing it into a fixed size,
+            # and remove node overlaps with the (fast) prism algorithm.
+            styles["graph"] |= {"overlap": "prism", "sep": "+10", "ratio": "auto", "outputorder": "edgesfirst"}
+            del styles["graph"]["size"]
 
         basic_op_names: str = "(power|dot|sum|diff|prod|div|quotient)"
         input_names: str = "^(INP|inp)"
 
         callgraph: BaseGraph
         try:
-            digraph = functools.partial(Digraph, format="png")
+            digraph = functools.partial(Digraph, format="png", engine=engine)
             callgraph = digraph()
             callgraph = _apply_styles(callgraph, styles)
         except Exception:
-            logger.exception(graphiz_not_found_error_mesage)
-            return
+            logger.exception(_GRAPHVIZ_NOT_FOUND_ERROR_MESSAGE)
+            return None
+
+        # Clusters
+        clusters: dict[str, BaseGraph] = {}
+        if cluster_separator:
+            prefixes = [_get_cluster_prefix(name, cluster_separator) for name in components]
+            for prefix in {prefix for prefix in prefixes if prefix and prefixes.count(prefix) > 1}:
+                cluster = Digraph(name=f"cluster_{prefix}")
+                cluster.attr(label=prefix, style="rounded", color="grey")
+                clusters[prefix] = cluster
 
         # Components
-        for component in case.system_structure.components.values():
+        for component in components.values():
             label_key, label = _get_node_label(component)
-            label = _create_table(
-                label_key,
-                {
-                    "source:": component.fmu.file.name,
-                    "stepsize:": component.step_size,
-                    "variables:": "",
-                },
-            )
+            if not large:
+                label = _create_table(
+                    label_key,
+                    {
+                        "source:": component.fmu.file.name,
+                        "stepsize:": component.step_size,
+                        "variables:": "",
+                    },
+                )
 
             if re.search(input_names, component.name):
                 shape = "diamond"
@@ -115,51 +261,58 @@ class Graph:
                 style = "filled"
                 fillcolor = "#DDDDEE"
 
-            callgraph.node(
+            prefix = _get_cluster_prefix(component.name, cluster_separator) if cluster_separator else None
+            clusters.get(prefix or "", callgraph).node(
                 label_key,
                 label=label,
                 fontname="Verdana",
                 fontsize=text_size,
                 fontcolor="black",
-                shape=shape,
+                shape="box" if large and shape == "square" else shape,
                 color="black",
                 style=style,
                 fillcolor=fillcolor,
             )
 
-        # Connections
+        for cluster in clusters.values():
+            callgraph.subgraph(cluster)
 
+        # Connections
+        # All connections between the same pair of components get collapsed into one (weighted) edge.
+        edges: dict[tuple[str, str], list[str]] = {}
         for connection in case.system_structure.connections.values():
             if not (connection.source_endpoint and connection.target_endpoint):
-                return
+                continue
             if not (connection.source_endpoint.component and connection.target_endpoint.component):
-                return
+                continue
             from_key: str = connection.source_endpoint.component.name
             to_key: str = connection.target_endpoint.component.name
+            edges.setdefault((from_key, to_key), []).append(_get_edge_label(connection))
 
-            label = _get_edge_label(connection)
+        for (from_key, to_key), labels in edges.items():
+            label = _get_collapsed_edge_label(labels, compact=large)
 
             if re.search(input_names, from_key, re.IGNORECASE):
                 label = f"input\n{label}"
                 style = "dashed"
                 color = "#003399"
                 fontcolor = "#003399"
-                penwidth = (f"{1:d}",)
-                weight = (f"{1:d}",)
+                penwidth = 1
+                weight = 1
 
             elif re.search(basic_op_names, from_key, re.IGNORECASE):
                 style = "filled"
                 color = "#995566"
                 fontcolor = "#663344"
-                penwidth = (f"{3:d}",)
-                weight = (f"{0.66:.2f}",)
+                penwidth = 3
+                weight = 0.66
 
             else:
                 style = "bold"
                 color = "black"
                 fontcolor = "black"
-                penwidth = (f"{int(round((2) ** 1.5, 0))}",)
-                weight = (f"{int(round((2) ** 1.5, 0))}",)
+                penwidth = round(2**1.5)
+                weight = round(2**1.5)
 
             callgraph.edge(
                 from_key,
@@ -170,21 +323,83 @@ class Graph:
                 fontname="Verdana",
                 fontsize=text_size,
                 fontcolor=fontcolor,
-                penwidth=str(penwidth),
-                weight=str(weight),
+                penwidth=f"{penwidth + math.log2(len(labels)):.2f}",
+                weight=f"{weight * len(labels):.2f}",
                 label=label,
                 overlap="false",
                 splines="true",
             )
 
-        # Create callGraph pdf
+        return callgraph
 
-        try:
-            _ = callgraph.render(f"{case.simulation.name}_callGraph", format="pdf")
-        except Exception:
-            logger.exception(graphiz_not_found_error_mesage)
 
-        return
+def _render(engine: str, source_file: Path, pdf_file: Path, timeout: float | None) -> bool:
+    """Render the graph source file as pdf, aborting graphviz after timeout seconds.
+
+    The pdf is rendered into a temporary file first, so that an aborted rendering does not leave a partial pdf.
+    """
+    temp_file = pdf_file.with_name(f".{pdf_file.name}.{os.getpid()}.tmp")
+    try:
+        _ = subprocess.run(  # noqa: S603
+            [engine, "-Tpdf", "-o", str(temp_file), str(source_file)],
+            check=True,
+            capture_output=True,
+            timeout=timeout,
+        )
+        _ = temp_file.replace(pdf_file)
+    except subprocess.TimeoutExpired:
+        logger.error(  # noqa: TRY400
+            f"OspSimulationCase.generate_dependency_graph(): graphviz ({engine}) did not finish "
+            f"rendering {pdf_file} within {timeout} seconds and got aborted. \n"
+            "For large systems, consider a faster layout engine (sfdp) or clustering components by name prefix."
+        )
+    except subprocess.CalledProcessError as e:
+        logger.error(  # noqa: TRY400
+            f"OspSimulationCase.generate_dependency_graph(): graphviz ({engine}) failed to render "
+            f"{pdf_file}: {e.stderr.decode(errors='replace').strip()}"
+        )
+    except OSError:
+        logger.exception(_GRAPHVIZ_NOT_FOUND_ERROR_MESSAGE)
+    else:
+        return True
+    finally:
+        temp_file.unlink(missing_ok=True)
+    return False
+
+
+def _render_in_background(engine: str, source_file: Path, pdf_file: Path, timeout: float | None) -> None:
+    """Start a detached Python process running _render(), and return without waiting for it."""
+    logger.info(f"Render {pdf_file} in background.")
+    command = (
+        "import logging, sys; from pathlib import Path; from ospx.graph import _render; "
+        "logging.basicConfig(format='%(levelname)s: %(message)s'); "
+        "sys.exit(not _render(sys.argv[1], Path(sys.argv[2]), Path(sys.argv[3]), float(sys.argv[4]) or None))"
+    )
+    try:
+        _ = subprocess.Popen(  # noqa: S603
+            [
+                sys.executable,
+                "-c",
+                command,
+                engine,
+                str(source_file.resolve()),
+                str(pdf_file.resolve()),
+                str(timeout or 0),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        logger.exception("OspSimulationCase.generate_dependency_graph(): failed to start background rendering.")
+
+
+def _read_first_line(file: Path) -> str | None:
+    try:
+        with file.open(encoding="utf-8") as f:
+            return f.readline().rstrip("\n")
+    except OSError:
+        return None
 
 
 def _apply_styles(digraph: BaseGraph, styles: dict[str, Any]) -> BaseGraph:
@@ -194,6 +409,11 @@ def _apply_styles(digraph: BaseGraph, styles: dict[str, Any]) -> BaseGraph:
     return digraph
 
 
+def _get_cluster_prefix(name: str, separator: str) -> str | None:
+    prefix, found, _ = name.partition(separator)
+    return prefix if found and prefix else None
+
+
 def _get_node_label(component: Component) -> tuple[str, str]:
     label = f"{component.name}\n___________\n\nfmu\n"
     label += re.sub(r"(^.*/|^.*\\|\.fmu.*$)", "", component.fmu.file.name)
@@ -210,6 +430,15 @@ def _get_edge_label(connection: Connection) -> str:
     )
 
 
+def _get_collapsed_edge_label(labels: list[str], *, compact: bool = False) -> str:
+    if len(labels) == 1:
+        return "" if compact else labels[0]
+    count_label = f"{len(labels)} connections"
+    if compact or len(labels) > MAX_EDGE_LABEL_LINES:
+        return count_label
+    return "\n".join([count_label, *labels])
+
+
 def _create_table(name: str, child: dict[str, Any] | None = None) -> str:
     _child: dict[str, Any] = child or {" ": " "}
     n_child = len(_child)
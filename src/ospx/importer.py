@@ -1,37 +1,79 @@
+import json
 import logging
 import os
-import re
+import posixpath
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from types import TracebackType
+from typing import IO, Any, Self
+from urllib.parse import unquote
+from zipfile import ZipFile
 
-from dictIO import DictReader, DictWriter
-from dictIO.utils.counter import BorgCounter
+from dictIO import DictWriter
 from dictIO.utils.path import highest_common_root_folder, relative_path
+from lxml import etree
 
-from ospx.utils.dict import find_key, find_keys, find_type_identifier_in_keys
+from ospx.fmi import FMUCache, cast_to_fmi_data_types
+from ospx.utils.dict import LinearNativeFormatter
+from ospx.utils.file import write_text_atomic
+from ospx.utils.xml import iter_elements, local_name
+from ospx.utils.zip import extract_member
 
 __all__ = ["OspSystemStructureImporter"]
 
 logger = logging.getLogger(__name__)
 
+_CONNECTION_TYPES: frozenset[str] = frozenset({"VariableConnection", "VariableGroupConnection"})
+_ENDPOINT_TYPES: frozenset[str] = frozenset({"Variable", "VariableGroup"})
+_DATA_TYPES: frozenset[str] = frozenset({"Integer", "Real", "Boolean", "Enumeration", "String"})
+# Global settings read from the OspSystemStructure: element name -> (key in simulation dict, data type)
+_SETTINGS: dict[str, tuple[str, type]] = {
+    "StartTime": ("startTime", float),
+    "BaseStepSize": ("baseStepSize", float),
+    "Algorithm": ("algorithm", str),
+}
+# File types of system structures that can be imported
+_SUPPORTED_SUFFIXES: frozenset[str] = frozenset({".xml", ".ssd", ".ssp"})
+# Name of the system structure description inside an SSP archive
+_SSP_SYSTEM_STRUCTURE_FILE_NAME: str = "SystemStructure.ssd"
+# The only component type of a system structure description supported in ospx
+_FMU_COMPONENT_TYPE: str = "application/x-fmu-sharedlibrary"
+
 
 class OspSystemStructureImporter:
-    """Class providing methods to convert an existing OspSystemStructure.xml file to an ospx case dict file."""
+    """Class providing methods to convert an existing system structure to an ospx case dict file.
+
+    Supported are OspSystemStructure.xml files (OSP-IS), SystemStructure.ssd files and SSP archives (.ssp).
+    """
 
     @staticmethod
     def import_system_structure(
         system_structure_file: str | os.PathLike[str],
         *,
         enter_lib_source_as_relative_path: bool = False,
-    ) -> None:
-        """Import an OspSystemStructure.xml file and save it as an ospx case dict file.
+        target_folder: str | os.PathLike[str] | None = None,
+    ) -> Path | None:
+        """Import an OspSystemStructure.xml, SystemStructure.ssd or SSP file and save it as an ospx case dict file.
+
+        The SystemStructure.ssd inside an SSP archive is read directly from the archive.
+        The FMUs inside the archive get extracted into a folder inside target_folder, named as the SSP file.
+        Only FMUs referenced by a component are extracted, and only if not already extracted with the same content.
 
         Parameters
         ----------
         system_structure_file : Union[str, os.PathLike[str]]
-            the OspSystemStructure.xml file to be imported
+            the OspSystemStructure.xml, SystemStructure.ssd or SSP file to be imported
         enter_lib_source_as_relative_path : bool, optional
             whether lib_source shall be entered as relative path in the case dict file, by default False
+        target_folder : str | os.PathLike[str] | None, optional
+            folder the case dict file gets saved in. If None, the current working directory is used.
+            By default None
+
+        Returns
+        -------
+        Path | None
+            the case dict file, or None if the file type of system_structure_file is not supported
 
         Raises
         ------
@@ -46,6 +88,10 @@ class OspSystemStructureImporter:
             if the OspSystemStructure contains connections with OSP-IS endpoint type 'Signal' or 'SignalGroup'.
             These endpoint types are not implemented yet in ospx.
 
+        NotImplementedError
+            if the SystemStructure.ssd contains elements other than FMU components, e.g. nested systems.
+            These element types are not implemented yet in ospx.
+
         TypeError
             if the OspSystemStructure contains connections of an unknown type.
 
@@ -62,241 +108,737 @@ class OspSystemStructureImporter:
             logger.error(f"OspSystemStructureImporter: File {system_structure_file} not found.")
             raise FileNotFoundError(system_structure_file)
 
-        if system_structure_file.suffix != ".xml":
+        if system_structure_file.suffix not in _SUPPORTED_SUFFIXES:
             logger.error(f"OspSystemStructureImporter: File type {system_structure_file} not implemented yet.")
-            return
-
-        counter = BorgCounter()
-
-        source_dict = DictReader.read(system_structure_file, comments=False)
-        source_folder: Path = system_structure_file.resolve().parent.absolute()
-        lib_source_folder: Path = source_folder  # setting to source_folder acts as fallback / default
-        target_folder: Path = Path.cwd().absolute()
-
-        # Main subdicts contained in systemStructure
-        connections: dict[str, dict[Any, Any]] = {}
-        components: dict[str, dict[Any, Any]] = {}
-
-        # Connections
-        # iterate over the connections first as they contain the variable and component names
-        temp_connectors = {}
-        msg: str
-        if connections_key := find_key(source_dict, "Connections$"):
-            for _connection_type, connection_properties in source_dict[connections_key].items():
-                connection_type: str = re.sub(r"(^\d{1,6}_)", "", _connection_type)
-
-                if connection_type not in {
-                    "VariableConnection",
-                    "VariableGroupConnection",
-                }:
-                    if connection_type in {"SignalConnection", "SignalGroupConnection"}:
-                        msg = (
-                            f"Import failed: {system_structure_file.name} contains a connection "
-                            f"with OSP-IS connection type '{connection_type}'\n"
-                            f"The support for connection type '{connection_type}' is not yet implemented in ospx."
-                        )
-                        logger.error(msg)
-                        raise NotImplementedError(msg)
-                    msg = (
-                        f"Import failed: {system_structure_file.name} contains a connection with "
-                        f"unknown connection type '{connection_type}'\n"
-                    )
-                    logger.error(msg)
-                    raise TypeError(msg)
-
-                connection: dict[str, dict[Any, Any]] = {}
-                connection_name: str = ""
-                # following loop has range {0,1}
-                for index, (_endpoint_type, endpoint_properties) in enumerate(connection_properties.items()):
-                    endpoint_type: str = re.sub(r"(^\d{1,6}_)", "", _endpoint_type)
-
-                    if endpoint_type not in {"Variable", "VariableGroup"}:
-                        if endpoint_type in {"Signal", "SignalGroup"}:
-                            msg = (
-                                f"Import failed: {system_structure_file.name} contains a connection "
-                                f"with OSP-IS endpoint type '{endpoint_type}'\n"
-                                f"The support for endpoint type '{endpoint_type}' is not yet implemented in ospx."
-                            )
-                            logger.error(msg)
-                            raise NotImplementedError(msg)
-                        msg = (
-                            f"Import failed: {system_structure_file.name} contains a connection "
-                            f"with unknown endpoint type '{endpoint_type}'\n"
-                        )
-                        logger.error(msg)
-                        raise TypeError(msg)
-
-                    component_name: str = endpoint_properties["_attributes"]["simulator"]
-                    referenced_name: str = endpoint_properties["_attributes"]["name"]
-                    # alternator for source <--> target
-                    # (because there are always 2 entries in VariableConnection in always the same sequence)
-                    endpoint_name: str = "source" if index % 2 == 0 else "target"
-                    endpoint: dict[str, str] = {}
-                    _connector_type: str = "output" if endpoint_name == "source" else "input"
-                    _connector: dict[str, str] = {}
-                    _connector_name: str = f"{component_name}_{referenced_name}"
-                    if endpoint_type == "Variable":
-                        endpoint = {
-                            "component": component_name,
-                            "variable": referenced_name,
-                        }
-                        _connector = {
-                            "variable": referenced_name,
-                            "type": _connector_type,
-                        }
-                    elif endpoint_type == "VariableGroup":
-                        endpoint = {
-                            "component": component_name,
-                            "connector": _connector_name,
-                        }
-                        _connector = {
-                            "variableGroup": referenced_name,
-                            "type": _connector_type,
-                        }
-                    connection[endpoint_name] = endpoint
-                    if not connection_name:
-                        connection_name = component_name
-                    else:
-                        connection_name += f"_to_{component_name}"
-
-                    # Save _connector in temp_connectors dict.
-                    # (The variable and component information stored in these connectors
-                    #  is later used to complete component properties)
-                    temp_connectors[f"{counter():06d}_{component_name}"] = {_connector_name: _connector}
-                # Save in connections dict
-                if connection_name in connections:
-                    suffix_number: int = 2
-                    _connection_name: str = f"{connection_name}_{suffix_number:02d}"
-                    while _connection_name in connections:
-                        suffix_number += 1
-                        _connection_name = f"{connection_name}_{suffix_number:02d}"
-                    connection_name = _connection_name
-                connections[connection_name] = connection
-        # Simulators (=Components)
-        if simulators_key := find_key(source_dict, "Simulators$"):
-            # Determine the highest common root folder among all FMU's.
-            # This will be used as libSource folder.
-            fmu_folders: list[Path] = []
-            fmu_name: str
-            fmu_file: Path
-            fmu_folder: Path
-            for simulator_properties in source_dict[simulators_key].values():
-                fmu_name = simulator_properties["_attributes"]["source"]
-                fmu_file = Path(fmu_name)
-                if fmu_file.is_absolute():
-                    fmu_folder = fmu_file.resolve().parent.absolute()
-                else:
-                    fmu_folder = (source_folder / fmu_file).resolve().parent.absolute()
-                fmu_folders.append(fmu_folder)
-            if fmu_folders:
-                lib_source_folder = highest_common_root_folder(fmu_folders)
-
-            for simulator_properties in source_dict[simulators_key].values():
-                # Component
-                component_name = simulator_properties["_attributes"]["name"]
-                # Connectors
-                component_connectors: dict[str, dict[Any, Any]] = {}
-                for temp_connector_key, connector in temp_connectors.items():
-                    if component_name in temp_connector_key:
-                        component_connectors |= connector
-                # FMU
-                fmu_name = simulator_properties["_attributes"]["source"]
-                fmu_file = Path(fmu_name)
-                fmu_file = fmu_file.resolve() if fmu_file.is_absolute() else (source_folder / fmu_file).resolve()
-                fmu_file_relative_to_lib_source: Path = relative_path(lib_source_folder, fmu_file)
-                # Step Size
-                step_size: float | None = None
-                if "stepSize" in simulator_properties["_attributes"]:
-                    step_size = float(simulator_properties["_attributes"]["stepSize"])
-                    # Initial values
-                component_initial_values: dict[str, dict[Any, Any]] = {}
-                if initial_values_key := find_key(simulator_properties, "InitialValues$"):
-                    initial_values = simulator_properties[initial_values_key]
-                    if initial_value_keys := find_keys(initial_values, "InitialValue$"):
-                        for initial_value_key in initial_value_keys:
-                            initial_value = initial_values[initial_value_key]
-                            if data_type := find_type_identifier_in_keys(initial_value):
-                                type_key = find_key(initial_value, f"{data_type}$")
-                                if not type_key:
-                                    continue
-                                _type: str = re.sub(r"(^\d{1,6}_)", "", type_key)
-                                referenced_name = initial_value["_attributes"]["variable"]
-                                value: float | int | bool | str
-                                if _type == "Boolean":
-                                    value = bool(initial_value[type_key]["_attributes"]["value"])
-                                elif _type == "Integer":
-                                    value = int(initial_value[type_key]["_attributes"]["value"])
-                                elif _type == "Real":
-                                    value = float(initial_value[type_key]["_attributes"]["value"])
-                                else:
-                                    value = initial_value[type_key]["_attributes"]["value"]
-                                component_initial_values |= {referenced_name: {"start": value}}
-                                # Assemble component
-                component: dict[str, dict[Any, Any] | str | float | Path] = {
-                    "connectors": component_connectors,
-                    "fmu": fmu_file_relative_to_lib_source,
-                }
-                if step_size:
-                    component["stepSize"] = step_size
-                if component_initial_values:
-                    component["initialize"] = component_initial_values
-                    # Save in components dict
-                components[component_name] = component
+            return None
 
-        # System Structure
-        system_structure: dict[str, dict[str, Any]] = {
-            "connections": connections,
-            "components": components,
-        }
-
-        # Global Settings
-        # 1: Defaults
-        simulation: dict[str, Any] = {
-            "name": system_structure_file.stem,
-            "startTime": 0.0,
-            "baseStepSize": 0.01,
-            "algorithm": "fixedStep",
-        }
-        # 2: Overwrite defaults with values from source dict, where existing
-        if "_attributes" in source_dict:
-            attributes = source_dict["_attributes"]
-            if "StartTime" in attributes:
-                simulation["startTime"] = attributes["StartTime"]
-            if "BaseStepSize" in attributes:
-                simulation["baseStepSize"] = attributes["BaseStepSize"]
-            if "Algorithm" in attributes:
-                simulation["algorithm"] = attributes["Algorithm"]
-
-        # Environment
-        environment: dict[str, Path] = {}
-        if enter_lib_source_as_relative_path:
-            try:
-                environment["libSource"] = relative_path(
-                    from_path=target_folder,
-                    to_path=lib_source_folder,
+        target_file, _, _ = _import_system_structure(
+            system_structure_file,
+            Path(target_folder).absolute() if target_folder else Path.cwd().absolute(),
+            enter_lib_source_as_relative_path=enter_lib_source_as_relative_path,
+        )
+        return target_file
+
+    @staticmethod
+    def import_system_structures(
+        folder: str | os.PathLike[str],
+        *,
+        pattern: str = "*OspSystemStructure*.xml",
+        max_workers: int | None = None,
+        enter_lib_source_as_relative_path: bool = False,
+    ) -> dict[str, Any]:
+        """Import all system structure files found in a directory tree, in parallel.
+
+        Each system structure gets imported into a case dict file saved beside it, named as with
+        import_system_structure(). libSource gets resolved for each system structure separately.
+        The FMUs referenced by the system structures are parsed once, in an FMU cache shared by all imports,
+        and checked whether they exist and contain the variables referenced in connections and initial values.
+        A summary of all imports, failures and warnings is saved as importSummary.json in folder.
+
+        Parameters
+        ----------
+        folder : str | os.PathLike[str]
+            root folder of the directory tree to be searched for system structure files
+        pattern : str, optional
+            glob pattern the system structure file names need to match, by default "*OspSystemStructure*.xml".
+            Use e.g. "*.ssp" to import SSP archives.
+        max_workers : int | None, optional
+            maximum number of worker threads. If None, the default of ThreadPoolExecutor is used. By default None
+        enter_lib_source_as_relative_path : bool, optional
+            whether lib_source shall be entered as relative path in the case dict files, by default False
+
+        Returns
+        -------
+        dict[str, Any]
+            the import summary, with the imported case dict files ('imported'),
+            the error of each failed import ('failed') and the warnings of each import ('warnings'),
+            by system structure file (relative to folder)
+
+        Raises
+        ------
+        FileNotFoundError
+            if folder does not exist
+        """
+        folder = Path(folder)
+        if not folder.is_dir():
+            logger.error(f"OspSystemStructureImporter: Folder {folder} not found.")
+            raise FileNotFoundError(folder)
+
+        system_structure_files = sorted(folder.rglob(pattern))
+        logger.info(f"Import {len(system_structure_files)} system structures found in {folder}")
+
+        summary: dict[str, Any] = {"imported": {}, "failed": {}, "warnings": {}}
+        with FMUCache() as fmu_cache, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                file: executor.submit(
+                    _import_and_check_system_structure,
+                    file,
+                    fmu_cache,
+                    enter_lib_source_as_relative_path=enter_lib_source_as_relative_path,
                 )
+                for file in system_structure_files
+            }
+            for file, future in futures.items():
+                key = file.relative_to(folder).as_posix()
+                try:
+                    target_file, warnings = future.result()
+                except Exception as e:  # noqa: BLE001
+                    logger.error(f"OspSystemStructureImporter: Import of {file} failed: {e}")  # noqa: TRY400
+                    summary["failed"][key] = f"{type(e).__name__}: {e}".strip()
+                    continue
+                summary["imported"][key] = target_file.relative_to(folder).as_posix()
+                if warnings:
+                    summary["warnings"][key] = warnings
+        summary["fmuCache"] = fmu_cache.to_dict()
+
+        logger.info(
+            f"Imported {len(summary['imported'])} of {len(system_structure_files)} system structures "
+            f"({len(summary['failed'])} failed, {len(summary['warnings'])} with warnings)."
+        )
+        write_text_atomic(folder / "importSummary.json", json.dumps(summary, indent=4))
+
+        return summary
+
+
+def _import_system_structure(
+    system_structure_file: Path,
+    target_folder: Path,
+    *,
+    enter_lib_source_as_relative_path: bool,
+) -> tuple[Path, dict[str, dict[Any, Any]], Path]:
+    """Import a system structure file and save it as case dict file in target folder.
+
+    Returns the case dict file, the components (by component name) and the libSource folder.
+    """
+    source_folder: Path = system_structure_file.resolve().parent.absolute()
+
+    # Global Settings
+    # 1: Defaults
+    simulation: dict[str, Any] = {
+        "name": system_structure_file.stem,
+        "startTime": 0.0,
+        "baseStepSize": 0.01,
+        "algorithm": "fixedStep",
+    }
+
+    # Read the system structure element by element.
+    # 2: Overwrite defaults with values from the system structure file, where existing
+    if system_structure_file.suffix == ".xml":
+        settings, connections, components, lib_source_folder = _read_system_structure(
+            system_structure_file,
+            source_folder,
+        )
+    else:
+        settings, connections, components, lib_source_folder = _read_system_structure_description(
+            system_structure_file,
+            target_folder / system_structure_file.stem,
+        )
+    simulation |= settings
+
+    # System Structure
+    system_structure: dict[str, dict[str, Any]] = {
+        "connections": connections,
+        "components": components,
+    }
+
+    # Environment
+    environment: dict[str, Path] = {}
+    if enter_lib_source_as_relative_path:
+        try:
+            environment["libSource"] = relative_path(
+                from_path=target_folder,
+                to_path=lib_source_folder,
+            )
+        except ValueError:
+            msg = (
+                "Resolving relative path from target folder to libSource folder failed.\n"
+                "Absolute path for libSource is used instead."
+            )
+            logger.warning(msg)
+            environment["libSource"] = lib_source_folder
+    else:
+        environment["libSource"] = lib_source_folder
+
+    # Assemble case dict
+    case_dict = {
+        "_environment": environment,
+        "systemStructure": system_structure,
+        "run": {
+            "simulation": simulation,
+        },
+    }
+
+    source_file_name = system_structure_file.name.replace(".", "_")
+    target_file = target_folder / f"caseDict_imported_from_{source_file_name}"
+
+    DictWriter.write(case_dict, target_file, mode="w", formatter=LinearNativeFormatter())
+
+    return target_file, components, lib_source_folder
+
+
+def _import_and_check_system_structure(
+    system_structure_file: Path,
+    fmu_cache: FMUCache,
+    *,
+    enter_lib_source_as_relative_path: bool,
+) -> tuple[Path, list[str]]:
+    """Import a system structure into a case dict file beside it, and check the FMUs it references.
+
+    Returns the case dict file and the warnings found when checking the FMUs.
+    """
+    target_file, components, lib_source_folder = _import_system_structure(
+        system_structure_file,
+        system_structure_file.parent.absolute(),
+        enter_lib_source_as_relative_path=enter_lib_source_as_relative_path,
+    )
+    return target_file, _check_fmus(components, lib_source_folder, fmu_cache)
+
+
+def _check_fmus(
+    components: dict[str, dict[Any, Any]],
+    lib_source_folder: Path,
+    fmu_cache: FMUCache,
+) -> list[str]:
+    """Check whether the FMUs of all components exist and contain the variables the component refers to.
+
+    Returns the warnings found.
+    """
+    warnings: list[str] = []
+    for component_name, component in components.items():
+        fmu_file: Path = lib_source_folder / component["fmu"]
+        if not fmu_file.is_file():
+            warnings.append(f"component {component_name}: FMU {fmu_file} not found.")
+            continue
+        try:
+            variables = fmu_cache.get(fmu_file).variables
+        except Exception as e:  # noqa: BLE001
+            warnings.append(f"component {component_name}: FMU {fmu_file} could not be read ({type(e).__name__}: {e}).")
+            continue
+        referenced_names: list[str] = [
+            connector["variable"] for connector in component["connectors"].values() if "variable" in connector
+        ]
+        referenced_names.extend(component.get("initialize", {}))
+        warnings.extend(
+            f"component {component_name}: variable {name} not found in FMU {fmu_file.name}."
+            for name in dict.fromkeys(referenced_names)
+            if name not in variables
+        )
+    return warnings
+
+
+def _read_system_structure(
+    system_structure_file: Path,
+    source_folder: Path,
+) -> tuple[dict[str, Any], dict[str, dict[Any, Any]], dict[str, dict[Any, Any]], Path]:
+    """Read an OspSystemStructure.xml file incrementally, processing simulators and connections as they arrive.
+
+    Returns the global settings, the connections (by connection name), the components (by component name),
+    and the libSource folder (highest common root folder of all FMUs).
+    """
+    settings: dict[str, Any] = {}
+    connections: dict[str, dict[Any, Any]] = {}
+    components: dict[str, dict[Any, Any]] = {}
+    fmu_files: dict[str, Path] = {}
+    # The connectors the connections refer to, collected per component.
+    # A component shares the dict holding its connectors,
+    # so connections can refer to simulators defined before as well as after them.
+    connectors_by_component: dict[str, dict[str, dict[str, str]]] = {}
+    # next suffix to try for each connection name that occurred more than once
+    next_suffix_numbers: dict[str, int] = {}
+
+    for element in iter_elements(system_structure_file, max_depth=2):
+        parent = element.getparent()
+        if parent is None:
+            continue
+        tag: str = local_name(element)
+        parent_tag: str = local_name(parent)
+        if parent_tag == "Connections":
+            _import_connection(
+                element,
+                system_structure_file.name,
+                connections,
+                connectors_by_component,
+                next_suffix_numbers,
+            )
+        elif parent_tag == "Simulators" and tag == "Simulator":
+            component_name, component, fmu_file = _import_simulator(element, source_folder, connectors_by_component)
+            components[component_name] = component
+            fmu_files[component_name] = fmu_file
+        elif parent.getparent() is None and tag in _SETTINGS:
+            key, data_type = _SETTINGS[tag]
+            text = (element.text or "").strip()
+            try:
+                settings[key] = data_type(text)
             except ValueError:
+                logger.warning(
+                    f"{system_structure_file.name}: value '{text}' of {tag} is not a valid {data_type.__name__}. "
+                    f"The default is kept."
+                )
+
+    lib_source_folder = _enter_fmus_relative_to_lib_source(components, fmu_files, source_folder)
+
+    return settings, connections, components, lib_source_folder
+
+
+def _enter_fmus_relative_to_lib_source(
+    components: dict[str, dict[Any, Any]],
+    fmu_files: dict[str, Path],
+    default_folder: Path,
+) -> Path:
+    """Enter the FMU of each component relative to the libSource folder. Returns the libSource folder."""
+    # Determine the highest common root folder among all FMU's.
+    # This will be used as libSource folder.
+    lib_source_folder: Path = default_folder  # acts as fallback / default
+    if fmu_files:
+        lib_source_folder = highest_common_root_folder(list({fmu_file.parent for fmu_file in fmu_files.values()}))
+    for component_name, fmu_file in fmu_files.items():
+        components[component_name]["fmu"] = relative_path(lib_source_folder, fmu_file)
+    return lib_source_folder
+
+
+def _import_connection(
+    element: etree._Element,
+    file_name: str,
+    connections: dict[str, dict[Any, Any]],
+    connectors_by_component: dict[str, dict[str, dict[str, str]]],
+    next_suffix_numbers: dict[str, int],
+) -> None:
+    """Import a connection element, and save the connectors it refers to by component."""
+    msg: str
+    connection_type: str = local_name(element)
+
+    if connection_type not in _CONNECTION_TYPES:
+        if connection_type in {"SignalConnection", "SignalGroupConnection"}:
+            msg = (
+                f"Import failed: {file_name} contains a connection "
+                f"with OSP-IS connection type '{connection_type}'\n"
+                f"The support for connection type '{connection_type}' is not yet implemented in ospx."
+            )
+            logger.error(msg)
+            raise NotImplementedError(msg)
+        msg = f"Import failed: {file_name} contains a connection with unknown connection type '{connection_type}'\n"
+        logger.error(msg)
+        raise TypeError(msg)
+
+    connection: dict[str, dict[Any, Any]] = {}
+    component_names: list[str] = []
+    # following loop has range {0,1}
+    for index, endpoint_element in enumerate(element):
+        endpoint_type: str = local_name(endpoint_element)
+
+        if endpoint_type not in _ENDPOINT_TYPES:
+            if endpoint_type in {"Signal", "SignalGroup"}:
                 msg = (
-                    "Resolving relative path from target folder to libSource folder failed.\n"
-                    "Absolute path for libSource is used instead."
+                    f"Import failed: {file_name} contains a connection "
+                    f"with OSP-IS endpoint type '{endpoint_type}'\n"
+                    f"The support for endpoint type '{endpoint_type}' is not yet implemented in ospx."
                 )
-                logger.warning(msg)
-                environment["libSource"] = lib_source_folder
+                logger.error(msg)
+                raise NotImplementedError(msg)
+            msg = f"Import failed: {file_name} contains a connection with unknown endpoint type '{endpoint_type}'\n"
+            logger.error(msg)
+            raise TypeError(msg)
+
+        component_name: str = endpoint_element.get("simulator", "")
+        referenced_name: str = endpoint_element.get("name", "")
+        # alternator for source <--> target
+        # (because there are always 2 entries in VariableConnection in always the same sequence)
+        is_source: bool = index % 2 == 0
+        connector_type: str = "output" if is_source else "input"
+        connector_name: str = f"{component_name}_{referenced_name}"
+        if endpoint_type == "Variable":
+            endpoint = {"component": component_name, "variable": referenced_name}
+            connector = {"variable": referenced_name, "type": connector_type}
         else:
-            environment["libSource"] = lib_source_folder
+            endpoint = {"component": component_name, "connector": connector_name}
+            connector = {"variableGroup": referenced_name, "type": connector_type}
+        connection["source" if is_source else "target"] = endpoint
+        component_names.append(component_name)
+
+        # Save connector, indexed by component.
+        # (The variable information stored in these connectors is later used to complete component properties)
+        if (component_connectors := connectors_by_component.get(component_name)) is None:
+            component_connectors = connectors_by_component[component_name] = {}
+        component_connectors[connector_name] = connector
+
+    _add_connection(connection, component_names, connections, next_suffix_numbers)
+
+
+def _add_connection(
+    connection: dict[str, dict[Any, Any]],
+    component_names: list[str],
+    connections: dict[str, dict[Any, Any]],
+    next_suffix_numbers: dict[str, int],
+) -> None:
+    """Save a connection, named after the components it connects. Recurring names get a numbered suffix."""
+    connection_name: str = "_to_".join(component_names)
+    if connection_name in connections:
+        suffix_number: int = next_suffix_numbers.get(connection_name, 2)
+        _connection_name: str = f"{connection_name}_{suffix_number:02d}"
+        while _connection_name in connections:
+            suffix_number += 1
+            _connection_name = f"{connection_name}_{suffix_number:02d}"
+        next_suffix_numbers[connection_name] = suffix_number + 1
+        connection_name = _connection_name
+    connections[connection_name] = connection
+
+
+def _import_simulator(
+    element: etree._Element,
+    source_folder: Path,
+    connectors_by_component: dict[str, dict[str, dict[str, str]]],
+) -> tuple[str, dict[Any, Any], Path]:
+    """Import a simulator element as component.
+
+    Returns the component name, the component and the (absolute) FMU file.
+    The component's FMU gets entered relative to the libSource folder once all simulators are read.
+    """
+    # Component
+    component_name: str = element.get("name", "")
+    # Connectors
+    if (component_connectors := connectors_by_component.get(component_name)) is None:
+        component_connectors = connectors_by_component[component_name] = {}
+    # FMU
+    fmu_file = Path(element.get("source", ""))
+    fmu_file = fmu_file.resolve() if fmu_file.is_absolute() else (source_folder / fmu_file).resolve()
+    # Step Size
+    step_size: float | None = None
+    if (_step_size := element.get("stepSize")) is not None:
+        step_size = float(_step_size)
+    # Initial values
+    component_initial_values: dict[str, dict[Any, Any]] = _import_initial_values(element, component_name)
+    # Assemble component
+    component: dict[str, dict[Any, Any] | str | float | Path] = {
+        "connectors": component_connectors,
+        "fmu": fmu_file,
+    }
+    if step_size:
+        component["stepSize"] = step_size
+    if component_initial_values:
+        component["initialize"] = component_initial_values
+
+    return component_name, component, fmu_file
+
+
+def _import_initial_values(element: etree._Element, component_name: str) -> dict[str, dict[Any, Any]]:
+    """Import the initial values of a simulator element, casting them in one batch."""
+    # Collect all initial values first, then cast them in one batch
+    referenced_names: list[str] = []
+    raw_values: list[Any] = []
+    data_types: list[str] = []
+    for initial_values_element in element:
+        if local_name(initial_values_element) != "InitialValues":
+            continue
+        for initial_value_element in initial_values_element:
+            if local_name(initial_value_element) != "InitialValue":
+                continue
+            for typed_value_element in initial_value_element:
+                if (data_type := local_name(typed_value_element)) in _DATA_TYPES:
+                    referenced_names.append(initial_value_element.get("variable", ""))
+                    raw_values.append(typed_value_element.get("value"))
+                    data_types.append(data_type)
+                    break
+        break
+
+    return _cast_initial_values(component_name, referenced_names, raw_values, data_types)
+
+
+def _cast_initial_values(
+    component_name: str,
+    referenced_names: list[str],
+    raw_values: list[Any],
+    data_types: list[str],
+) -> dict[str, dict[Any, Any]]:
+    """Cast the initial values of a component in one batch. Values that cannot be casted are dropped."""
+    component_initial_values: dict[str, dict[Any, Any]] = {}
+    if not raw_values:
+        return component_initial_values
+    casted_values, failures = cast_to_fmi_data_types(raw_values, data_types)
+    for failure in failures:
+        logger.error(
+            f"component {component_name}: initial value {failure.value!r} "
+            f"of variable {referenced_names[failure.index]} cannot be casted "
+            f"to {failure.data_type} ({failure.reason})"
+        )
+    for referenced_name, value in zip(referenced_names, casted_values, strict=True):
+        if value is not None:
+            component_initial_values[referenced_name] = {"start": value}
+    return component_initial_values
+
+
+def _read_system_structure_description(
+    system_structure_file: Path,
+    extraction_folder: Path,
+) -> tuple[dict[str, Any], dict[str, dict[Any, Any]], dict[str, dict[Any, Any]], Path]:
+    """Read a SystemStructure.ssd file, or the SystemStructure.ssd inside an SSP archive, incrementally.
+
+    Components and connections are processed as they arrive, as in _read_system_structure().
+    FMUs inside an SSP archive get extracted into extraction_folder when the first component referencing them is read.
+
+    Returns the global settings, the connections (by connection name), the components (by component name),
+    and the libSource folder (highest common root folder of all FMUs).
+    """
+    settings: dict[str, Any] = {}
+    connections: dict[str, dict[Any, Any]] = {}
+    components: dict[str, dict[Any, Any]] = {}
+    fmu_files: dict[str, Path] = {}
+    connectors_by_component: dict[str, dict[str, dict[str, str]]] = {}
+    next_suffix_numbers: dict[str, int] = {}
+
+    with (
+        _SystemStructureResources(system_structure_file, extraction_folder) as resources,
+        resources.open_system_structure() as stream,
+    ):
+        for element in iter_elements(stream, max_depth=3):
+            parent = element.getparent()
+            if parent is None:
+                continue
+            tag: str = local_name(element)
+            parent_tag: str = local_name(parent)
+            grandparent = parent.getparent()
+            if parent_tag == "Elements":
+                component_name, component, fmu_file = _import_component(
+                    element,
+                    system_structure_file.name,
+                    resources,
+                    connectors_by_component,
+                )
+                components[component_name] = component
+                fmu_files[component_name] = fmu_file
+            elif parent_tag == "Connections" and tag == "Connection":
+                _import_ssd_connection(element, connections, connectors_by_component, next_suffix_numbers)
+            elif tag == "Annotation" and grandparent is not None and local_name(grandparent) == "DefaultExperiment":
+                _import_osp_annotation(element, settings)
+            elif grandparent is None and tag == "DefaultExperiment":
+                # Settings in the OSP annotation take precedence
+                for key, value in _float_attributes(element, ("startTime", "stopTime")).items():
+                    _ = settings.setdefault(key, value)
+            elif grandparent is None and tag == "System" and (system_name := element.get("name")):
+                settings["name"] = system_name
+
+    lib_source_folder = _enter_fmus_relative_to_lib_source(
+        components,
+        fmu_files,
+        system_structure_file.resolve().parent.absolute(),
+    )
+
+    return settings, connections, components, lib_source_folder
+
+
+def _import_component(
+    element: etree._Element,
+    file_name: str,
+    resources: "_SystemStructureResources",
+    connectors_by_component: dict[str, dict[str, dict[str, str]]],
+) -> tuple[str, dict[Any, Any], Path]:
+    """Import a component element of a system structure description.
+
+    Returns the component name, the component and the (absolute) FMU file.
+    The parameter values bound to the component are imported as its initial values.
+    """
+    element_type: str = local_name(element)
+    component_name: str = element.get("name", "")
+    component_type: str = element.get("type", _FMU_COMPONENT_TYPE)
+    if element_type != "Component" or component_type != _FMU_COMPONENT_TYPE:
+        kind = f"component of type '{component_type}'" if element_type == "Component" else f"element '{element_type}'"
+        msg = (
+            f"Import failed: {file_name} contains {kind} ('{component_name}')\n"
+            f"The support for {kind} is not yet implemented in ospx."
+        )
+        logger.error(msg)
+        raise NotImplementedError(msg)
+
+    # Connectors
+    if (component_connectors := connectors_by_component.get(component_name)) is None:
+        component_connectors = connectors_by_component[component_name] = {}
+    # FMU
+    fmu_file = resources.file(element.get("source", ""))
+    # Initial values
+    referenced_names: list[str] = []
+    raw_values: list[Any] = []
+    data_types: list[str] = []
+    for binding_element in element.iterfind("{*}ParameterBindings/{*}ParameterBinding"):
+        for referenced_name, raw_value, data_type in _iter_parameters(binding_element, component_name, resources):
+            referenced_names.append(referenced_name)
+            raw_values.append(raw_value)
+            data_types.append(data_type)
+    component_initial_values = _cast_initial_values(component_name, referenced_names, raw_values, data_types)
+    # Assemble component
+    component: dict[str, dict[Any, Any] | str | float | Path] = {
+        "connectors": component_connectors,
+        "fmu": fmu_file,
+    }
+    if component_initial_values:
+        component["initialize"] = component_initial_values
+
+    return component_name, component, fmu_file
+
+
+def _iter_parameters(
+    binding_element: etree._Element,
+    component_name: str,
+    resources: "_SystemStructureResources",
+) -> Iterator[tuple[str, Any, str]]:
+    """Yield name, raw value and data type of each parameter of a parameter binding.
+
+    The parameter values are either contained in the binding, or read from the parameter values file (.ssv)
+    the binding refers to.
+    """
+    if binding_element.find("{*}ParameterMapping") is not None:
+        logger.warning(
+            f"component {component_name}: parameter mappings are not yet implemented in ospx. "
+            "Parameter binding ignored."
+        )
+        return
+    prefix: str = binding_element.get("prefix", "")
+    source: str | None = binding_element.get("source")
+    if source is None:
+        parameter_elements = binding_element.iterfind("{*}ParameterValues/{*}ParameterSet/{*}Parameters/{*}Parameter")
+        yield from _parse_parameters(parameter_elements, prefix)
+        return
+    if source.startswith("#"):
+        logger.warning(
+            f"component {component_name}: parameter values referenced by fragment ('{source}') "
+            "are not yet implemented in ospx. Parameter binding ignored."
+        )
+        return
+    with resources.open(source) as stream:
+        parameter_elements = (
+            element for element in iter_elements(stream, max_depth=2) if local_name(element) == "Parameter"
+        )
+        yield from _parse_parameters(parameter_elements, prefix)
+
+
+def _parse_parameters(
+    parameter_elements: Iterator[etree._Element],
+    prefix: str,
+) -> Iterator[tuple[str, Any, str]]:
+    for parameter_element in parameter_elements:
+        for typed_value_element in parameter_element:
+            if (data_type := local_name(typed_value_element)) in _DATA_TYPES:
+                yield prefix + parameter_element.get("name", ""), typed_value_element.get("value"), data_type
+                break
+
+
+def _import_ssd_connection(
+    element: etree._Element,
+    connections: dict[str, dict[Any, Any]],
+    connectors_by_component: dict[str, dict[str, dict[str, str]]],
+    next_suffix_numbers: dict[str, int],
+) -> None:
+    """Import a connection element of a system structure description, and save its connectors by component."""
+    start_element: str = element.get("startElement", "")
+    start_connector: str = element.get("startConnector", "")
+    end_element: str = element.get("endElement", "")
+    end_connector: str = element.get("endConnector", "")
+    description = (
+        f"connection {start_element or '<system>'}.{start_connector} -> {end_element or '<system>'}.{end_connector}"
+    )
+    if not start_element or not end_element:
+        logger.warning(
+            f"{description}: connections to connectors of the system itself are not yet implemented in ospx. "
+            "Connection ignored."
+        )
+        return
+    if any(local_name(child).endswith("Transformation") for child in element):
+        logger.warning(f"{description}: transformations are not yet implemented in ospx. Transformation ignored.")
 
-        # Assemble case dict
-        case_dict = {
-            "_environment": environment,
-            "systemStructure": system_structure,
-            "run": {
-                "simulation": simulation,
-            },
-        }
+    connection: dict[str, dict[Any, Any]] = {}
+    for key, component_name, variable_name, connector_type in (
+        ("source", start_element, start_connector, "output"),
+        ("target", end_element, end_connector, "input"),
+    ):
+        connection[key] = {"component": component_name, "variable": variable_name}
+        if (component_connectors := connectors_by_component.get(component_name)) is None:
+            component_connectors = connectors_by_component[component_name] = {}
+        component_connectors[f"{component_name}_{variable_name}"] = {"variable": variable_name, "type": connector_type}
 
-        source_file_name = source_dict.name.replace(".", "_")
-        target_file = Path.cwd() / f"caseDict_imported_from_{source_file_name}"
+    _add_connection(connection, [start_element, end_element], connections, next_suffix_numbers)
 
-        DictWriter.write(case_dict, target_file, mode="w")
 
+def _import_osp_annotation(element: etree._Element, settings: dict[str, Any]) -> None:
+    """Import the global settings from the OSP annotation of the default experiment, as written by ospx."""
+    if element.get("type") != "com.opensimulationplatform":
         return
+    for algorithm_element in element.iterfind("{*}Algorithm/{*}FixedStepAlgorithm"):
+        settings["algorithm"] = "fixedStep"
+        settings |= _float_attributes(algorithm_element, ("baseStepSize", "startTime", "stopTime"))
+
+
+def _float_attributes(element: etree._Element, names: tuple[str, ...]) -> dict[str, float]:
+    """Return the values of the passed in attributes as float. Missing and non-numeric values are left out."""
+    values: dict[str, float] = {}
+    for name in names:
+        try:
+            values[name] = float(element.get(name, ""))
+        except ValueError:
+            continue
+    return values
+
+
+class _SystemStructureResources:
+    """Files a system structure description refers to, located beside the .ssd file or inside an SSP archive.
+
+    Members of an SSP archive are read directly from the archive.
+    Only members which are needed as files (FMUs) get extracted into the extraction folder,
+    once per member and only if not already extracted with the same content.
+    """
+
+    def __init__(self, system_structure_file: Path, extraction_folder: Path) -> None:
+        self.system_structure_file: Path = system_structure_file
+        self.extraction_folder: Path = extraction_folder
+        self._archive: ZipFile | None = (
+            ZipFile(system_structure_file) if system_structure_file.suffix == ".ssp" else None
+        )
+        self._files: dict[str, Path] = {}
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._archive is not None:
+            self._archive.close()
+
+    def open_system_structure(self) -> IO[bytes]:
+        """Open the system structure description for reading."""
+        if self._archive is None:
+            return self.system_structure_file.open("rb")
+        return self._archive.open(_SSP_SYSTEM_STRUCTURE_FILE_NAME)
+
+    def open(self, source: str) -> IO[bytes]:
+        """Open the file the passed in source refers to for reading."""
+        if self._archive is None:
+            return self._path(source).open("rb")
+        return self._archive.open(self._member_name(source))
+
+    def file(self, source: str) -> Path:
+        """Return the file the passed in source refers to. Members of an SSP archive get extracted first."""
+        if self._archive is None:
+            return self._path(source)
+        if (file := self._files.get(source)) is None:
+            member_name = self._member_name(source)
+            file = (self.extraction_folder / member_name).absolute()
+            try:
+                if extract_member(self._archive, member_name, file):
+                    logger.info(f"Extracted {member_name} from {self.system_structure_file.name} to {file}")
+            except KeyError:
+                logger.warning(f"{member_name} not found in {self.system_structure_file}")
+            self._files[source] = file
+        return file
+
+    def _path(self, source: str) -> Path:
+        path = Path(unquote(source))
+        return path.resolve() if path.is_absolute() else (self.system_structure_file.resolve().parent / path).resolve()
+
+    def _member_name(self, source: str) -> str:
+        member_name = posixpath.normpath(unquote(source))
+        if member_name.startswith(("/", "../")) or member_name == "..":
+            msg = f"{source} refers to a file outside of {self.system_structure_file}"
+            logger.error(msg)
+            raise ValueError(msg)
+        return member_name
@@ -1,3 +1,4 @@
+import json
 import logging
 import os
 from pathlib import Path
@@ -5,7 +6,9 @@ from typing import Any
 
 from dictIO import DictReader, SDict
 
-from ospx import Graph, OspSimulationCase
+from ospx import Graph, OspSimulationCase, ValidationReport
+from ospx.utils.file import write_text_atomic
+from ospx.utils.profiling import BuildProfiler, phase
 
 __all__ = ["OspCaseBuilder"]
 
@@ -19,12 +22,21 @@ class OspCaseBuilder:
         return
 
     @staticmethod
-    def build(
+    def build(  # noqa: PLR0913
         case_dict_file: str | os.PathLike[str],
         *,
         inspect: bool = False,
         graph: bool = False,
+        graph_engine: str | None = None,
+        graph_cluster: str | None = None,
+        graph_render: str = "foreground",
         clean: bool = False,
+        profile: bool = False,
+        profiler: str | None = None,
+        cache: bool = False,
+        osp_model_descriptions: bool = False,
+        workers: int | None = None,
+        dedupe: bool = False,
     ) -> None:
         """Build the OSP-specific configuration files needed to run an OSP (co-)simulation case.
 
@@ -34,6 +46,7 @@ class OspCaseBuilder:
             - Plot.json
             - statisticsDict
             - watchDict
+            - <component.name>_OspModelDescription.xml (optional)
 
         Parameters
         ----------
@@ -44,9 +57,39 @@ class OspCaseBuilder:
             but does not actually create the OSP case files, by default False
         graph : bool, optional
             if True, creates a dependency graph image using graphviz, by default False
+        graph_engine : str | None, optional
+            graphviz layout engine used for the dependency graph, one of 'dot', 'sfdp', 'neato' or 'fdp'.
+            If None, 'dot' is used for small systems and 'sfdp' for large systems. By default None
+        graph_cluster : str | None, optional
+            separator of component name prefixes. If set, components sharing the same name prefix
+            are grouped into a cluster in the dependency graph. By default None
+        graph_render : str, optional
+            how the dependency graph gets rendered: 'foreground', 'background' (without waiting for graphviz
+            to finish) or 'none' (only the graph source in DOT format is saved). An unchanged dependency graph
+            is not rendered again. By default 'foreground'
         clean : bool, optional
             if True, cleans up case folder and deletes any formerly created ospx files,
             e.g. OspSystemStructure.xml .fmu .csv etc.
+        profile : bool, optional
+            if True, times the individual build phases and writes a timing report (buildProfile.json)
+            into the case folder, by default False
+        profiler : str | None, optional
+            code profiler to run alongside the build, either "cProfile" or "pyinstrument".
+            Its output is saved beside the timing report. Implies profile=True. By default None
+        cache : bool, optional
+            if True, the resolved system structure is saved as snapshot (systemSnapshot.pickle) in the case folder
+            and reused by subsequent builds of the same case, as long as the case dict and the referenced FMUs
+            are unchanged. This speeds up running inspect, build and graph in sequence. By default False
+        osp_model_descriptions : bool, optional
+            if True, writes a <component.name>_OspModelDescription.xml file for each component.
+            Each file is written beside the FMU of its component, i.e. into the libSource folder for FMUs
+            located there, not into the case folder. The files are written concurrently, once per FMU. By default False
+        workers : int | None, optional
+            maximum number of worker threads writing the OspModelDescription.xml files.
+            If None, the default of ThreadPoolExecutor is used. By default None
+        dedupe : bool, optional
+            if True, the OspModelDescription.xml files of components sharing an FMU are hardlinked to one shared file,
+            which is only rewritten if its content changed. Implies osp_model_descriptions=True. By default False
 
         Raises
         ------
@@ -59,40 +102,137 @@ class OspCaseBuilder:
             logger.error(f"OspCaseBuilder: File {case_dict_file} not found.")
             raise FileNotFoundError(case_dict_file)
 
+        case_folder: Path = case_dict_file.resolve().parent
         if clean:
-            case_folder: Path = case_dict_file.resolve().parent
             _clean_case_folder(case_folder)
 
-        logger.info(f"reading {case_dict_file}")  # 0
+        build_profiler = BuildProfiler(code_profiler=profiler)
+        try:
+            with build_profiler:
+                _build(
+                    case_dict_file,
+                    inspect=inspect,
+                    graph=graph,
+                    graph_engine=graph_engine,
+                    graph_cluster=graph_cluster,
+                    graph_render=graph_render,
+                    cache=cache,
+                    osp_model_descriptions=osp_model_descriptions or dedupe,
+                    workers=workers,
+                    dedupe=dedupe,
+                )
+        finally:
+            if profile or profiler:
+                _ = build_profiler.write_report(case_folder)
+
+        return
+
+    @staticmethod
+    def validate(
+        case_dict_file: str | os.PathLike[str],
+        *,
+        cache: bool = False,
+    ) -> ValidationReport:
+        """Validate all connections of an OSP (co-)simulation case against the FMUs, without building the case.
+
+        Checks all connectors, variables and variable groups the connections refer to,
+        the causalities of the connected variables (output -> input) and matching data types, in one pass.
+        The validation report is saved as validationReport.json in the case folder.
+
+        Parameters
+        ----------
+        case_dict_file : Union[str, os.PathLike[str]]
+            case dict file. Contains all case-specific information OspCaseBuilder needs to generate the OSP files.
+        cache : bool, optional
+            if True, the resolved system structure is saved as snapshot (systemSnapshot.pickle) in the case folder
+            and reused by subsequent builds of the same case, by default False
+
+        Returns
+        -------
+        ValidationReport
+            the report, listing all issues found
+
+        Raises
+        ------
+        FileNotFoundError
+            if case_dict_file does not exist
+        """
+        case_dict_file = case_dict_file if isinstance(case_dict_file, Path) else Path(case_dict_file)
+        if not case_dict_file.exists():
+            logger.error(f"OspCaseBuilder: File {case_dict_file} not found.")
+            raise FileNotFoundError(case_dict_file)
 
         case_dict: SDict[str, Any] = DictReader.read(case_dict_file, comments=False)
+        case = OspSimulationCase(case_dict)
+        case.setup(cache=cache)
+        report = case.validate_connections()
+        write_text_atomic(case.case_folder / "validationReport.json", json.dumps(report.to_dict(), indent=4))
+
+        return report
+
 
+def _build(  # noqa: PLR0913
+    case_dict_file: Path,
+    *,
+    inspect: bool,
+    graph: bool,
+    graph_engine: str | None,
+    graph_cluster: str | None,
+    graph_render: str,
+    cache: bool,
+    osp_model_descriptions: bool,
+    workers: int | None,
+    dedupe: bool,
+) -> None:
+    """Run the individual phases of OspCaseBuilder.build(), each timed as a separate build phase."""
+    logger.info(f"reading {case_dict_file}")  # 0
+
+    with phase("read"):
+        case_dict: SDict[str, Any] = DictReader.read(case_dict_file, comments=False)
         case = OspSimulationCase(case_dict)
-        try:
-            case.setup()
-        except Exception:
-            logger.exception("Error during setup of OspSimulationCase.")
-            return
 
-        if inspect:
-            # inspect and return
+    try:
+        with phase("setup"):
+            case.setup(cache=cache)
+    except Exception:
+        logger.exception("Error during setup of OspSimulationCase.")
+        return
+
+    if inspect:
+        # inspect and return
+        with phase("inspect"):
             case._inspect()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
-            return
+        return
 
+    with phase("writeOspSystemStructureXml"):
         case.write_osp_system_structure_xml()
+    with phase("writeSystemStructureSsd"):
         case.write_system_structure_ssd()
 
-        if "postProcessing" in case_dict:
+    if osp_model_descriptions:
+        with phase("writeOspModelDescriptionXmls"):
+            case.write_osp_model_description_xmls(max_workers=workers, dedupe=dedupe)
+
+    if "postProcessing" in case_dict:
+        with phase("writePlotConfigJson"):
             case._write_plot_config_json()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
 
+    with phase("writeStatisticsDict"):
         case.write_statistics_dict()
 
-        if graph:
-            Graph.generate_dependency_graph(case)
+    if graph:
+        with phase("generateDependencyGraph"):
+            Graph.generate_dependency_graph(
+                case,
+                engine=graph_engine,
+                cluster_separator=graph_cluster,
+                render=graph_render,
+            )
 
+    with phase("writeWatchDict"):
         case.write_watch_dict()
 
-        return
+    return
 
 
 def _clean_case_folder(case_folder: Path) -> None:
@@ -112,6 +252,9 @@ def _clean_case_folder(case_folder: Path) -> None:
         "*.png",  # 'protect results/*.png'
         "watchDict",
         "statisticsDict",  # 'results',
+        "buildProfile.*",
+        "validationReport.json",
+        "systemSnapshot.pickle",
         "zip",
     ]
     except_list = ["src", "^test_", "_OspModelDescription.xml"]
@@ -1,20 +1,49 @@
+import hashlib
+import json
 import logging
-import re
+import pickle
+import sys
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from copy import copy
+from importlib import metadata
 from pathlib import Path
-from shutil import copy2
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from dictIO import DictWriter, SDict, XmlFormatter
+from dictIO import DictWriter, SDict
 from dictIO.utils.counter import BorgCounter
 from dictIO.utils.path import relative_path
 
-from ospx import Simulation, System
+from ospx import (
+    Component,
+    Connection,
+    ConnectionValidator,
+    Simulation,
+    System,
+    Topology,
+    UnitCompatibility,
+    ValidationReport,
+)
 from ospx.utils.dict import find_key
+from ospx.utils.file import file_digest, link_or_copy_atomic, write_bytes_atomic
+from ospx.utils.profiling import count, phase
+from ospx.utils.store import FileStore
+from ospx.utils.xml import XmlStreamWriter
 
-__all__ = ["OspSimulationCase"]
+if TYPE_CHECKING:
+    from ospx.fmi import ScalarVariable
+
+__all__ = ["OspSimulationCase", "clear_system_snapshots"]
 
 logger = logging.getLogger(__name__)
 
+# Name of the file in the case folder the System snapshot gets saved to (see OspSimulationCase.setup())
+SYSTEM_SNAPSHOT_FILE_NAME: str = "systemSnapshot.pickle"
+
+# System snapshots kept in memory as well, keyed by snapshot file.
+# Long-running processes, e.g. the build server, thereby reuse system structures without unpickling them.
+_system_snapshots: dict[Path, tuple[dict[str, Any], System]] = {}
+
 
 class OspSimulationCase:
     """OSP Simulation Case."""
@@ -46,9 +75,19 @@ class OspSimulationCase:
         self.lib_source: Path
         self._resolve_lib_source_folder()
 
-    def setup(self) -> None:
+        # Content-addressed store FMUs get copied into the case folder through (created on first use)
+        self.fmu_store: FileStore | None = None
+
+    def setup(self, *, cache: bool = False) -> None:
         """Set up the OSP simulation case folder.
 
+        Parameters
+        ----------
+        cache : bool, optional
+            if True, the resolved system structure is saved as snapshot (systemSnapshot.pickle) in the case folder,
+            and reloaded from there in subsequent calls as long as the case dict, the referenced FMU files
+            and the ospx version are unchanged, by default False
+
         Raises
         ------
         ValueError
@@ -72,15 +111,91 @@ class OspSimulationCase:
             msg = f"no 'systemStructure' section found in {self.case_dict.name}. Cannot set up OSP simulation case."
             logger.exception(msg)
             raise ValueError(msg)
+        case_dict_digest: str = self._case_dict_digest() if cache else ""
+        if cache and (system_structure := self._load_system_snapshot(case_dict_digest)):
+            self.system_structure = system_structure
+            return
         self.system_structure = System(self.case_dict["systemStructure"])
 
         # Make sure all components have a step size defined
         self._check_components_step_size()
 
-    def _write_osp_model_description_xmls(self) -> None:
+        if cache:
+            self._save_system_snapshot(case_dict_digest)
+
+    def variant(
+        self,
+        case_folder: Path,
+        start_values: Mapping[str, Mapping[str, Any]] | None = None,
+        base_step_size: float | None = None,
+    ) -> "OspSimulationCase":
+        """Return a variant of the (set up) simulation case, located in another case folder.
+
+        The variant shares the system structure with this case, except for the components
+        start values get applied to, which are copied (see Component.with_start_values()).
+        FMUs are not copied: The variant references the very same FMU files, via paths relative to its case folder.
+        This case remains unchanged.
+
+        Parameters
+        ----------
+        case_folder : Path
+            case folder of the variant
+        start_values : Mapping[str, Mapping[str, Any]] | None, optional
+            start values by component name and variable name, by default None
+        base_step_size : float | None, optional
+            base step size of the variant. If None, the base step size of this case is kept. By default None
+
+        Returns
+        -------
+        OspSimulationCase
+            the variant
+        """
+        variant = copy(self)
+        variant.case_folder = case_folder
+        components = dict(self.system_structure.components)
+        for component_name, component_start_values in (start_values or {}).items():
+            components[component_name] = components[component_name].with_start_values(component_start_values)
+        if base_step_size is not None and self.simulation:
+            variant.simulation = copy(self.simulation)
+            variant.simulation.base_step_size = base_step_size
+            # Components which got the base step size assigned (as neither the case dict
+            # nor their FMU define a step size) follow the base step size of the variant.
+            case_dict_components = self.case_dict["systemStructure"]["components"]
+            for component_name, component in components.items():
+                if "stepSize" in case_dict_components.get(component_name, {}):
+                    continue
+                if component.fmu.default_experiment and component.fmu.default_experiment.step_size:
+                    continue
+                components[component_name] = copy(component)
+                components[component_name].step_size = base_step_size
+        variant.system_structure = self.system_structure.with_components(components)
+        return variant
+
+    def write_osp_model_description_xmls(
+        self,
+        max_workers: int | None = None,
+        *,
+        dedupe: bool = False,
+    ) -> None:
         """Write the <component.name>_OspModelDescription.xml files for all components.
 
         Writes the <component.name>_OspModelDescription.xml files for all components defined in the system structure.
+        The files are written concurrently, using a pool of worker threads.
+        Components which are instances of the same FMU share one and the same OspModelDescription,
+        which is hence generated only once per FMU. Each file is written atomically.
+
+        In dedupe mode, the files are content-addressed:
+        Only the file of the first component of an FMU gets written, and only if its content changed.
+        The files of all further components of the same FMU become hardlinks to that file
+        (or copies, where the file system does not support hardlinks).
+        Note that, as a consequence, editing one of the hardlinked files changes them all.
+
+        Parameters
+        ----------
+        max_workers : int | None, optional
+            maximum number of worker threads. If None, the default of ThreadPoolExecutor is used. By default None
+        dedupe : bool, optional
+            if True, files with identical content are hardlinked instead of written repeatedly, by default False
         """
         logger.info(
             f"Write OspModelDescription.xml files for OSP simulation case '{self.name}' "
@@ -88,14 +203,56 @@ class OspSimulationCase:
         )
         if not self.system_structure or not self.system_structure.components:
             return
+        components_by_fmu: dict[Path, list[Component]] = {}
         for component in self.system_structure.components.values():
-            component.write_osp_model_description_xml()
+            components_by_fmu.setdefault(component.fmu.file.resolve(), []).append(component)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_write_osp_model_description_xmls, components, dedupe=dedupe)
+                for components in components_by_fmu.values()
+            ]
+            for future in as_completed(futures):
+                future.result()
         return
 
-    def write_osp_system_structure_xml(self) -> None:
-        """Write the OspSystemStructure.xml file."""
-        # sourcery skip: class-extract-method, merge-dict-assign
+    def validate_connections(self) -> ValidationReport:
+        """Validate all connections defined in the case dict against the variables and variable groups of the FMUs.
+
+        Also connections the system structure could not resolve are validated, see ConnectionValidator.
+        All issues found are logged as one error.
+
+        Returns
+        -------
+        ValidationReport
+            the report, listing all issues found
+        """
+        connections = self.case_dict["systemStructure"].get("connections") or {}
+        report = ConnectionValidator(self.system_structure.components).validate(connections)
+        if report.is_valid:
+            logger.info(f"All {report.connections} connections of OSP simulation case '{self.name}' are valid.")
+        else:
+            details = "\n".join(f"\t{issue.connection}: {issue.message}" for issue in report.issues)
+            logger.error(
+                f"Validation of OSP simulation case '{self.name}' found {len(report.issues)} issue(s) "
+                f"in {report.invalid_connections} of {report.connections} connections:\n{details}"
+            )
+        return report
+
+    def write_osp_system_structure_xml(self, *, convert_units: bool = True) -> None:
+        """Write the OspSystemStructure.xml file.
+
+        Simulators, initial values and connections are streamed into the file element by element.
 
+        Variable connections between compatible, but not identical units (e.g. kN -> N) get routed through
+        an OSP LinearTransformation function converting the source unit into the target unit.
+        The conversion hence happens inside the co-simulation engine.
+
+        Parameters
+        ----------
+        convert_units : bool, optional
+            whether to convert between the units of connected variables using LinearTransformation functions.
+            If False, all variable connections are written as plain VariableConnection. By default True
+        """
         osp_system_structure_file = self.case_folder / "OspSystemStructure.xml"
         self._clean(osp_system_structure_file)
 
@@ -104,206 +261,166 @@ class OspSimulationCase:
             f"in case folder: {self.case_folder}"
         )
 
-        osp_system_structure: dict[str, Any] = {}
-        osp_system_structure["_xmlOpts"] = {
-            "_nameSpaces": {"osp": "https://opensimulationplatform.com/xsd/OspModelDescription-1.0.0.xsd"},
-            "_rootTag": "OspSystemStructure",
-        }
+        with osp_system_structure_file.open(mode="w") as f:
+            xml = XmlStreamWriter(f)
+            xml.declaration()
+            with xml.block(
+                "OspSystemStructure",
+                {"xmlns": "http://opensimulationplatform.com/MSMI/OSPSystemStructure", "version": "0.1"},
+            ):
+                # Global Settings
+                if self.simulation:
+                    if self.simulation.start_time is not None:
+                        xml.element("StartTime", text=self.simulation.start_time)
+                    if self.simulation.base_step_size is not None:
+                        xml.element("BaseStepSize", text=self.simulation.base_step_size)
+                    if self.simulation.algorithm:
+                        xml.element("Algorithm", text=self.simulation.algorithm)
+
+                # Simulators (=Components)
+                with xml.block("Simulators"):
+                    for component in self.system_structure.components.values():
+                        self._write_simulator(xml, component)
+
+                # Functions (=Unit conversions)
+                conversions: dict[str, tuple[float, float]] = {}
+                if convert_units:
+                    conversions = UnitCompatibility(self.system_structure).conversions()
+                    conversions = {
+                        connection_name: transformation
+                        for connection_name, transformation in conversions.items()
+                        if self.system_structure.connections[connection_name].is_valid
+                    }
+                if conversions:
+                    logger.info(
+                        f"Convert units of {len(conversions)} connection(s) using LinearTransformation functions"
+                    )
+                    with xml.block("Functions"):
+                        for connection_name, (factor, offset) in conversions.items():
+                            xml.element(
+                                "LinearTransformation",
+                                {"name": _function_name(connection_name), "factor": factor, "offset": offset},
+                            )
+
+                # Connections
+                with xml.block("Connections"):
+                    for connection in self.system_structure.connections.values():
+                        if not connection.is_valid:
+                            continue
+                        if connection.name in conversions:
+                            _write_signal_connections(xml, connection, _function_name(connection.name))
+                        elif connection.is_variable_connection:
+                            _write_connection(xml, "VariableConnection", "Variable", connection)
+                        if connection.is_variable_group_connection:
+                            _write_connection(xml, "VariableGroupConnection", "VariableGroup", connection)
 
-        # Global Settings
-        if self.simulation:
-            if self.simulation.start_time is not None:
-                osp_system_structure["StartTime"] = self.simulation.start_time
-            if self.simulation.base_step_size is not None:
-                osp_system_structure["BaseStepSize"] = self.simulation.base_step_size
-            if self.simulation.algorithm:
-                osp_system_structure["Algorithm"] = self.simulation.algorithm
-
-        # Simulators (=Components)
-        simulators: dict[str, Any] = {}
-        for i, (_, component) in enumerate(self.system_structure.components.items()):
-            simulator_key = f"{i:06d}_Simulator"
-            simulator_properties: dict[str, dict[str, str | float | dict[str, Any] | Path]] = {
-                "_attributes": {
-                    "name": component.name,
-                    "source": relative_path(self.case_folder, component.fmu.file),
-                }
-            }
-            if component.step_size:
-                write_step_size_to_osp_system_structure: bool = True
-                if (
-                    component.fmu.default_experiment
-                    and component.fmu.default_experiment.step_size
-                    and component.step_size == component.fmu.default_experiment.step_size
-                ):
-                    write_step_size_to_osp_system_structure = False
-                if write_step_size_to_osp_system_structure:
-                    simulator_properties["_attributes"]["stepSize"] = component.step_size
-
-            if component.variables_with_start_values:
-                simulator_properties["InitialValues"] = {}
-                for ii, (_, variable) in enumerate(component.variables_with_start_values.items()):
-                    if variable.start is not None and variable.data_type is None:
-                        logger.error(
-                            f"component {component.name}: An initial value is defined for variable {variable.name}, "
-                            "but its data type is not defined.\n"
-                            f"The initial value for variable {variable.name} will not be written "
-                            "into OspSystemStructure.xml.\n"
-                            "OspSystemStructure.xml will be potentially wrong or incomplete."
-                        )
-                    else:
-                        initial_value_key = f"{ii:06d}_InitialValue"
-                        initial_value_properties: dict[str, Any] = {}
-                        initial_value_properties["_attributes"] = {"variable": variable.name}
-                        if variable.data_type:
-                            initial_value_properties[variable.data_type] = {"_attributes": {"value": variable.start}}
-
-                        simulator_properties["InitialValues"][initial_value_key] = initial_value_properties
-            simulators[simulator_key] = simulator_properties
-
-        osp_system_structure["Simulators"] = simulators
-
-        # Connections
-        connections: dict[str, dict[str, Any]] = {}
-        for connection in self.system_structure.connections.values():
-            if not connection.is_valid:
+        return
+
+    def _write_simulator(self, xml: XmlStreamWriter, component: Component) -> None:
+        """Write the <Simulator> element of the passed in component into OspSystemStructure.xml."""
+        attributes: dict[str, Any] = {
+            "name": component.name,
+            "source": relative_path(self.case_folder, component.fmu.file),
+        }
+        if component.step_size:
+            write_step_size_to_osp_system_structure: bool = True
+            if (
+                component.fmu.default_experiment
+                and component.fmu.default_experiment.step_size
+                and component.step_size == component.fmu.default_experiment.step_size
+            ):
+                write_step_size_to_osp_system_structure = False
+            if write_step_size_to_osp_system_structure:
+                attributes["stepSize"] = component.step_size
+
+        initial_values: list[ScalarVariable] = []
+        for variable in component.variables_with_start_values.values():
+            if variable.start is None:
                 continue
-            if connection.is_variable_connection:
-                connection_key = f"{self.counter():06d}_VariableConnection"
-                # (note: the order 000000, 000001 is essential here!)
-                connections[connection_key] = {
-                    "000000_Variable": {
-                        "_attributes": {
-                            "simulator": connection.source_endpoint.component.name,
-                            "name": connection.source_endpoint.variable_name,
-                        }
-                    },
-                    "000001_Variable": {
-                        "_attributes": {
-                            "simulator": connection.target_endpoint.component.name,
-                            "name": connection.target_endpoint.variable_name,
-                        }
-                    },
-                }
-            if connection.is_variable_group_connection:
-                connection_key = f"{self.counter():06d}_VariableGroupConnection"
-                # (note: the order 000000, 000001 is essential here!)
-                connections[connection_key] = {
-                    "000000_VariableGroup": {
-                        "_attributes": {
-                            "simulator": connection.source_endpoint.component.name,
-                            "name": connection.source_endpoint.variable_name,
-                        }
-                    },
-                    "000001_VariableGroup": {
-                        "_attributes": {
-                            "simulator": connection.target_endpoint.component.name,
-                            "name": connection.target_endpoint.variable_name,
-                        }
-                    },
-                }
-        osp_system_structure["Connections"] = connections
-
-        # Write OspSystemStructure.xml
-        formatter = XmlFormatter()
-        DictWriter.write(osp_system_structure, osp_system_structure_file, formatter=formatter)
-
-        self._correct_wrong_xml_namespace(
-            "OspSystemStructure.xml",
-            "<OspSystemStructure.*>?",
-            """<OspSystemStructure xmlns="http://opensimulationplatform.com/MSMI/OSPSystemStructure" version="0.1">""",
-        )
+            if variable.data_type is None:
+                logger.error(
+                    f"component {component.name}: An initial value is defined for variable {variable.name}, "
+                    "but its data type is not defined.\n"
+                    f"The initial value for variable {variable.name} will not be written "
+                    "into OspSystemStructure.xml.\n"
+                    "OspSystemStructure.xml will be potentially wrong or incomplete."
+                )
+                continue
+            initial_values.append(variable)
 
-        return
+        with xml.block("Simulator", attributes):
+            if not initial_values:
+                return
+            with xml.block("InitialValues"):
+                for variable in initial_values:
+                    with xml.block("InitialValue", {"variable": variable.name}):
+                        xml.element(str(variable.data_type), {"value": variable.start})
 
     def write_system_structure_ssd(self) -> None:
-        """Write the SystemStructure.ssd file."""
+        """Write the SystemStructure.ssd file.
+
+        Components, connectors and connections are streamed into the file element by element.
+        """
         system_structure_ssd_file = self.case_folder / "SystemStructure.ssd"
         self._clean(system_structure_ssd_file)
 
-        # sourcery skip: merge-dict-assign
         logger.info(
             f"Write SystemStructure.ssd file for OSP simulation case '{self.name}' in case folder: {self.case_folder}"
         )
 
-        system_structure_ssd: dict[str, Any] = {}
-        system_structure_ssd["_xmlOpts"] = {
-            "_nameSpaces": {
-                "ssd": "file:///C:/Software/OSP/xsd/SystemStructureDescription",
-                "ssv": "file:///C:/Software/OSP/xsd/SystemStructureParameterValues",
-                "ssc": "file:///C:/Software/OSP/xsd/SystemStructureCommon",
-            },
-            "_rootTag": "SystemStructureDescription",
-        }
-        system_structure_ssd["System"] = {
-            "_attributes": {
-                "name": self.name,
-                "description": self.name,
-            }
-        }
-
-        # Global settings
-        default_experiment = {
-            "Annotations": {
-                "Annotation": {
-                    "_attributes": {"type": "com.opensimulationplatform"},
-                    "Algorithm": {
-                        "FixedStepAlgorithm": {
-                            "_attributes": {
-                                "baseStepSize": str(self.simulation.base_step_size),
-                                "startTime": str(self.simulation.start_time),
-                                "stopTime": str(self.simulation.stop_time),
+        with system_structure_ssd_file.open(mode="w") as f:
+            xml = XmlStreamWriter(f)
+            xml.declaration()
+            with xml.block(
+                "ssd:SystemStructureDescription",
+                {"xmlns:ssd": "file:///C:/Software/OSP/xsd/SystemStructureDescription"},
+            ):
+                with xml.block("ssd:System", {"name": self.name, "description": self.name}):
+                    # Components
+                    with xml.block("ssd:Elements"):
+                        for component_name, component in self.system_structure.components.items():
+                            component_attributes = {
+                                "name": component_name,
+                                "source": relative_path(self.case_folder, component.fmu.file),
                             }
-                        }
-                    },
-                }
-            }
-        }
-        system_structure_ssd["DefaultExperiment"] = default_experiment
-
-        # Components
-        components: dict[str, Any] = {}
-        for component_name, component in self.system_structure.components.items():
-            connectors: dict[str, dict[str, Any]] = {}
-            for connector in component.connectors.values():
-                if connector.variable and connector.type:
-                    connector_key = f"{self.counter():06d}_Connector"
-                    # (note: the order 000000, 000001 is essential here!)
-                    connectors[connector_key] = {
-                        "_attributes": {
-                            "name": connector.variable,
-                            "kind": connector.type,
+                            with xml.block("ssd:Component", component_attributes), xml.block("ssd:Connectors"):
+                                for connector in component.connectors.values():
+                                    if connector.variable and connector.type:
+                                        with xml.block(
+                                            "ssd:Connector",
+                                            {"name": connector.variable, "kind": connector.type},
+                                        ):
+                                            xml.element("ssd:Real")
+
+                    # Connections
+                    with xml.block("ssd:Connections"):
+                        for connection in self.system_structure.connections.values():
+                            if connection.source_endpoint and connection.target_endpoint:
+                                xml.element(
+                                    "ssd:Connection",
+                                    {
+                                        "startElement": connection.source_endpoint.component.name,
+                                        "startConnector": connection.source_endpoint.variable_name,
+                                        "endElement": connection.target_endpoint.component.name,
+                                        "endConnector": connection.target_endpoint.variable_name,
+                                    },
+                                )
+
+                # Global settings
+                with (
+                    xml.block("ssd:DefaultExperiment"),
+                    xml.block("ssd:Annotations"),
+                    xml.block("ssd:Annotation", {"type": "com.opensimulationplatform"}),
+                    xml.block("ssd:Algorithm"),
+                ):
+                    xml.element(
+                        "ssd:FixedStepAlgorithm",
+                        {
+                            "baseStepSize": self.simulation.base_step_size,
+                            "startTime": self.simulation.start_time,
+                            "stopTime": self.simulation.stop_time,
                         },
-                        "Real": {},
-                    }
-            element_key = f"{self.counter():06d}_Component"
-            components[element_key] = {
-                "_attributes": {
-                    "name": component_name,
-                    "source": relative_path(self.case_folder, component.fmu.file),
-                },
-                "Connectors": connectors,
-            }
-        system_structure_ssd["System"]["Elements"] = components
-
-        # Connections
-        connections: dict[str, Any] = {}
-        for connection in self.system_structure.connections.values():
-            if connection.source_endpoint and connection.target_endpoint:
-                connection_key = f"{self.counter():06d}_Connection"
-                connections[connection_key] = {
-                    "_attributes": {
-                        "startElement": connection.source_endpoint.component.name,
-                        "startConnector": connection.source_endpoint.variable_name,
-                        "endElement": connection.target_endpoint.component.name,
-                        "endConnector": connection.target_endpoint.variable_name,
-                    }
-                }
-        system_structure_ssd["System"]["Connections"] = connections
-
-        # Write SystemStructure.ssd
-        formatter = XmlFormatter(omit_prefix=False)
-        DictWriter.write(system_structure_ssd, system_structure_ssd_file, formatter=formatter)
+                    )
 
         return
 
@@ -359,6 +476,18 @@ class OspSimulationCase:
             "names": list(self.system_structure.variables.keys()),
         }
 
+        with phase("analyzeTopology"):
+            statistics_dict["topology"] = Topology(self.system_structure).to_dict()
+
+        with phase("checkUnits"):
+            unit_compatibility = UnitCompatibility(self.system_structure)
+            if incompatible := unit_compatibility.incompatible_connections():
+                logger.warning(
+                    f"OSP simulation case '{self.name}': units of {len(incompatible)} connection(s) "
+                    f"are dimensionally incompatible: {', '.join(incompatible)}"
+                )
+            statistics_dict["unitCompatibility"] = unit_compatibility.to_dict()
+
         DictWriter.write(statistics_dict, statistics_dict_file, mode="w")
 
     def write_watch_dict(self) -> None:
@@ -479,6 +608,11 @@ class OspSimulationCase:
         If also an accompanying <fmu_name>_OspModelDescription.xml file exists in the same folder as the FMU file,
         then also that OspModelDescription.xml file will be copied into the case folder.
 
+        Files are not copied directly but via a content-addressed file store (see FileStore):
+        The case folder gets a hardlink to the stored file, where the file system supports it.
+        FMUs shared by many case folders are hence stored only once,
+        and repeated builds do not copy any data, as long as the FMU is unchanged.
+
         Parameters
         ----------
         fmu_file : Path
@@ -490,17 +624,100 @@ class OspSimulationCase:
             FMU file copied into the case folder.
         """
         fmu_file_in_case_folder: Path = (self.case_folder / fmu_file.name).resolve().absolute()
-        if not fmu_file_in_case_folder.exists():
-            logger.info(f"Copy FMU {fmu_file} --> {fmu_file_in_case_folder}")
-            _ = copy2(fmu_file, self.case_folder)
-            # Check whether also an <fmu_name>_OspModelDescription.xml file exists.
-            # If so, copy also that one.
-            osp_model_description_file = fmu_file.with_name(f"{fmu_file.stem}_OspModelDescription.xml")
-            if osp_model_description_file.exists():
-                logger.info(f"Copy OspModelDescription {osp_model_description_file} --> {fmu_file_in_case_folder}")
-                _ = copy2(osp_model_description_file, self.case_folder)
+        if fmu_file_in_case_folder.exists():
+            # An FMU existing in the case folder is kept as is, also if it differs from the FMU in the library
+            # (it might have been modified deliberately).
+            logger.debug(f"FMU {fmu_file_in_case_folder} exists already in case folder. Not copied again.")
+            return fmu_file_in_case_folder
+        if self.fmu_store is None:
+            self.fmu_store = FileStore()
+        logger.info(f"Link FMU {fmu_file} --> {fmu_file_in_case_folder}")
+        _ = self.fmu_store.link(fmu_file, fmu_file_in_case_folder)
+        # Check whether also an <fmu_name>_OspModelDescription.xml file exists.
+        # If so, copy also that one.
+        osp_model_description_file = fmu_file.with_name(f"{fmu_file.stem}_OspModelDescription.xml")
+        if osp_model_description_file.exists():
+            logger.info(f"Link OspModelDescription {osp_model_description_file} --> {self.case_folder}")
+            _ = self.fmu_store.link(osp_model_description_file, self.case_folder / osp_model_description_file.name)
         return fmu_file_in_case_folder
 
+    def _case_dict_digest(self) -> str:
+        """Return a digest of all case dict content the system structure depends on.
+
+        These are the (resolved) 'systemStructure' section and the base step size,
+        complemented by the ospx and the Python version.
+        Other case dict content, e.g. the placeholder keys dictIO inserts for includes, is deliberately left out
+        as it can differ between two reads of the same case dict file.
+        """
+        fingerprint = {
+            "systemStructure": self.case_dict["systemStructure"],
+            "baseStepSize": self.simulation.base_step_size if self.simulation else None,
+            "ospx": _get_version(),
+            "python": sys.version,
+        }
+        return hashlib.sha256(json.dumps(fingerprint, default=str).encode()).hexdigest()
+
+    def _load_system_snapshot(self, case_dict_digest: str) -> System | None:
+        """Load the system structure from the snapshot of the case folder, if the snapshot is still valid.
+
+        The snapshot is valid if it was saved for the same case dict digest,
+        and if none of the FMU files it references changed in the meantime (path, size and modification time).
+        A snapshot held in memory is preferred over the snapshot file.
+        Note: Only load snapshots from case folders you trust, as unpickling can execute arbitrary code.
+
+        Returns
+        -------
+        System | None
+            the system structure, or None if no valid snapshot exists
+        """
+        snapshot_file = self.case_folder / SYSTEM_SNAPSHOT_FILE_NAME
+        if snapshot_file in _system_snapshots:
+            header, system_structure = _system_snapshots[snapshot_file]
+            if _is_valid_snapshot(header, case_dict_digest, f"in-memory {snapshot_file.name}"):
+                logger.info(f"Reused system structure from in-memory snapshot {snapshot_file}")
+                count("systemSnapshotsLoaded")
+                return system_structure
+            del _system_snapshots[snapshot_file]
+        if not snapshot_file.exists():
+            return None
+        try:
+            with snapshot_file.open("rb") as f:
+                header = pickle.load(f)  # noqa: S301
+                if not _is_valid_snapshot(header, case_dict_digest, snapshot_file.name):
+                    return None
+                system_structure = pickle.load(f)  # noqa: S301
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Could not load {snapshot_file.name} ({e}). System structure gets read from case dict.")
+            return None
+        _system_snapshots[snapshot_file] = (header, system_structure)
+        logger.info(f"Loaded system structure from snapshot {snapshot_file}")
+        count("systemSnapshotsLoaded")
+        return system_structure
+
+    def _save_system_snapshot(self, case_dict_digest: str) -> None:
+        """Save the system structure as snapshot in the case folder.
+
+        The snapshot file contains two pickles: A header with the case dict digest and the stats
+        of all FMU files the system structure references, followed by the system structure itself.
+        This allows to validate the snapshot without unpickling the system structure.
+        """
+        snapshot_file = self.case_folder / SYSTEM_SNAPSHOT_FILE_NAME
+        fmu_files = {component.fmu.file.resolve() for component in self.system_structure.components.values()}
+        header: dict[str, Any] = {
+            "caseDict": case_dict_digest,
+            "fmus": _fmu_file_stats(fmu_files),
+        }
+        try:
+            content = pickle.dumps(header, protocol=pickle.HIGHEST_PROTOCOL) + pickle.dumps(
+                self.system_structure, protocol=pickle.HIGHEST_PROTOCOL
+            )
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"System structure could not be pickled ({e}). No snapshot is saved.")
+            return
+        write_bytes_atomic(snapshot_file, content)
+        _system_snapshots[snapshot_file] = (header, self.system_structure)
+        logger.info(f"Saved system structure snapshot {snapshot_file}")
+
     def _check_components_step_size(self) -> None:
         """Ensure that all components have a step size defined.
 
@@ -630,22 +847,127 @@ class OspSimulationCase:
 
         return
 
-    def _correct_wrong_xml_namespace(self, file_name: str, pattern: str, replace: str) -> None:
-        """Substitute namespace.
-
-        (may be obsolete in future)
-        """
-        buffer = ""
-        with Path(file_name).open() as f:
-            buffer = re.sub(pattern, replace, f.read())
-
-        with Path(file_name).open(mode="w") as f:
-            _ = f.write(buffer)
-
-        return
-
     def _clean(self, file_to_remove: str | Path) -> None:
         """Clean up single file."""
         if isinstance(file_to_remove, str):
             file_to_remove = self.case_folder / file_to_remove
         file_to_remove.unlink(missing_ok=True)
+
+
+def clear_system_snapshots() -> int:
+    """Drop all system snapshots held in memory. Snapshot files in case folders are kept.
+
+    Returns
+    -------
+    int
+        number of dropped snapshots
+    """
+    dropped = len(_system_snapshots)
+    _system_snapshots.clear()
+    return dropped
+
+
+def _is_valid_snapshot(header: dict[str, Any], case_dict_digest: str, snapshot_name: str) -> bool:
+    """Check whether a snapshot header matches the case dict digest and the current state of the FMU files."""
+    if header.get("caseDict") != case_dict_digest:
+        logger.debug(f"{snapshot_name} is outdated: case dict changed.")
+        return False
+    if header.get("fmus") != _fmu_file_stats(header.get("fmus", {}).keys()):
+        logger.debug(f"{snapshot_name} is outdated: FMU files changed.")
+        return False
+    return True
+
+
+def _get_version() -> str:
+    """Return the installed ospx version, or a safe fallback if unavailable."""
+    try:
+        return metadata.version("ospx")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _fmu_file_stats(fmu_files: Iterable[Path]) -> dict[Path, tuple[int, int] | None]:
+    """Return size and modification time (in ns) of the passed in FMU files, or None for FMU files not existing."""
+    stats: dict[Path, tuple[int, int] | None] = {}
+    for fmu_file in sorted(fmu_files):
+        try:
+            stat = fmu_file.stat()
+        except OSError:
+            stats[fmu_file] = None
+        else:
+            stats[fmu_file] = (stat.st_size, stat.st_mtime_ns)
+    return stats
+
+
+def _write_connection(xml: XmlStreamWriter, connection_type: str, endpoint_type: str, connection: Connection) -> None:
+    """Write a connection element, e.g. <VariableConnection>, into OspSystemStructure.xml."""
+    # (note: the order source, target is essential here!)
+    with xml.block(connection_type):
+        xml.element(
+            endpoint_type,
+            {
+                "simulator": connection.source_endpoint.component.name,
+                "name": connection.source_endpoint.variable_name,
+            },
+        )
+        xml.element(
+            endpoint_type,
+            {
+                "simulator": connection.target_endpoint.component.name,
+                "name": connection.target_endpoint.variable_name,
+            },
+        )
+
+
+def _write_signal_connections(xml: XmlStreamWriter, connection: Connection, function_name: str) -> None:
+    """Write a variable connection routed through a function as two <SignalConnection> elements."""
+    # (note: the order of the endpoints is essential here! It defines the direction of each signal connection)
+    with xml.block("SignalConnection"):
+        xml.element(
+            "Variable",
+            {
+                "simulator": connection.source_endpoint.component.name,
+                "name": connection.source_endpoint.variable_name,
+            },
+        )
+        xml.element("Signal", {"function": function_name, "name": "in"})
+    with xml.block("SignalConnection"):
+        xml.element("Signal", {"function": function_name, "name": "out"})
+        xml.element(
+            "Variable",
+            {
+                "simulator": connection.target_endpoint.component.name,
+                "name": connection.target_endpoint.variable_name,
+            },
+        )
+
+
+def _function_name(connection_name: str) -> str:
+    """Return the name of the LinearTransformation function converting the units of a connection."""
+    return f"{connection_name}_unitConversion"
+
+
+def _write_osp_model_description_xmls(components: list[Component], *, dedupe: bool = False) -> None:
+    """Write the OspModelDescription.xml files for a list of components sharing the same FMU.
+
+    The OspModelDescription is generated only once, from the first component, and then written for all components.
+    In dedupe mode, the files of all but the first component are hardlinked to the file of the first component.
+    """
+    # Encoded once, so the bytes written are exactly the bytes the digest is computed from
+    osp_model_description_xml = components[0].osp_model_description_xml().encode("utf-8")
+    if not dedupe:
+        for component in components:
+            write_bytes_atomic(component.osp_model_description_file, osp_model_description_xml)
+        return
+
+    shared_file = components[0].osp_model_description_file
+    digest = hashlib.sha256(osp_model_description_xml).hexdigest()
+    if shared_file.exists() and file_digest(shared_file) == digest:
+        logger.debug(f"{shared_file} is up to date.")
+    else:
+        write_bytes_atomic(shared_file, osp_model_description_xml)
+    for component in components[1:]:
+        osp_model_description_file = component.osp_model_description_file
+        if osp_model_description_file.exists() and osp_model_description_file.samefile(shared_file):
+            continue
+        _ = link_or_copy_atomic(shared_file, osp_model_description_file)
@@ -0,0 +1,154 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+from pathlib import Path
+from typing import Any
+
+from dictIO import DictReader, DictWriter, SDict
+
+from ospx import OspSimulationCase
+from ospx.fmi import cast_to_fmi_data_types
+from ospx.utils.profiling import phase
+
+__all__ = ["OspSweepBuilder"]
+
+logger = logging.getLogger(__name__)
+
+
+class OspSweepBuilder:
+    """Builder for parameter sweeps, i.e. many variants of one OSP simulation case differing only in parameter values.
+
+    The base case gets set up once (FMUs parsed, system structure resolved).
+    The variants are derived from it and written in parallel, each into its own case folder.
+    """
+
+    def __init__(self) -> None:
+        return
+
+    @staticmethod
+    def build(
+        case_dict_file: str | os.PathLike[str],
+        parameters: dict[str, list[Any]],
+        *,
+        sweep_folder: str | os.PathLike[str] | None = None,
+        max_workers: int | None = None,
+    ) -> list[Path]:
+        r"""Build the OSP-specific configuration files for all variants of a parameter sweep.
+
+        The variants span the full factorial grid of the passed in parameter values.
+        Each variant gets its own case folder inside the sweep folder, named case_<index>, containing:
+            - OspSystemStructure.xml
+            - SystemStructure.ssd
+            - statisticsDict
+            - watchDict
+        FMUs are not copied: All variants reference the FMUs of the base case via relative paths.
+        A summary of all variants and their parameter values is written into the sweep folder (sweepSummary).
+
+        Parameters
+        ----------
+        case_dict_file : str | os.PathLike[str]
+            case dict file of the base case
+        parameters : dict[str, list[Any]]
+            parameter values to sweep, by parameter name. Valid parameter names are\n
+            'baseStepSize', and\n
+            '<component>.<variable>' for the start value of a variable of a component
+        sweep_folder : str | os.PathLike[str] | None, optional
+            folder the variant case folders get created in. If None, 'sweep' inside the base case folder is used.
+            By default None
+        max_workers : int | None, optional
+            maximum number of worker threads. If None, the default of ThreadPoolExecutor is used. By default None
+
+        Returns
+        -------
+        list[Path]
+            the case folders of all variants
+
+        Raises
+        ------
+        FileNotFoundError
+            if case_dict_file does not exist
+        ValueError
+            if a parameter is invalid, or a parameter value cannot be casted to the data type of its variable
+        """
+        case_dict_file = case_dict_file if isinstance(case_dict_file, Path) else Path(case_dict_file)
+        if not case_dict_file.exists():
+            logger.error(f"OspSweepBuilder: File {case_dict_file} not found.")
+            raise FileNotFoundError(case_dict_file)
+
+        with phase("setup"):
+            case_dict: SDict[str, Any] = DictReader.read(case_dict_file, comments=False)
+            case = OspSimulationCase(case_dict)
+            case.setup()
+
+        parameter_values = _cast_parameter_values(case, parameters)
+        variants: list[dict[str, Any]] = [
+            dict(zip(parameter_values, values, strict=True)) for values in product(*parameter_values.values())
+        ]
+        sweep_folder = Path(sweep_folder) if sweep_folder else case.case_folder / "sweep"
+        width = len(str(max(len(variants) - 1, 0)))
+        case_folders = [sweep_folder / f"case_{index:0{width}d}" for index in range(len(variants))]
+        logger.info(f"Build {len(variants)} variants of OSP simulation case '{case.name}' in folder: {sweep_folder}")
+
+        with phase("writeVariants"), ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_write_variant, case, case_folder, variant)
+                for case_folder, variant in zip(case_folders, variants, strict=True)
+            ]
+            for future in futures:
+                future.result()
+
+        sweep_summary: dict[str, Any] = {
+            "baseCase": str(case_dict_file.resolve()),
+            "parameters": list(parameter_values),
+            "cases": {
+                case_folder.name: dict(variant) for case_folder, variant in zip(case_folders, variants, strict=True)
+            },
+        }
+        DictWriter.write(sweep_summary, sweep_folder / "sweepSummary", mode="w")
+
+        return case_folders
+
+
+def _cast_parameter_values(case: OspSimulationCase, parameters: dict[str, list[Any]]) -> dict[str, list[Any]]:
+    """Check all parameters and cast their values, each parameter in one batch."""
+    parameter_values: dict[str, list[Any]] = {}
+    for parameter_name, values in parameters.items():
+        values = list(values) if isinstance(values, list | tuple) else [values]  # noqa: PLW2901
+        if parameter_name == "baseStepSize":
+            parameter_values[parameter_name] = [float(value) for value in values]
+            continue
+        component_name, _, variable_name = parameter_name.partition(".")
+        component = case.system_structure.components.get(component_name)
+        if not component or variable_name not in component.variables:
+            msg = (
+                f"OspSweepBuilder: parameter '{parameter_name}' is invalid. "
+                "Valid parameters are 'baseStepSize' and '<component>.<variable>'."
+            )
+            logger.error(msg)
+            raise ValueError(msg)
+        data_type = component.variables[variable_name].data_type
+        casted_values, failures = cast_to_fmi_data_types(values, [data_type] * len(values))
+        if failures:
+            details = ", ".join(f"{failure.value!r} ({failure.reason})" for failure in failures)
+            msg = f"OspSweepBuilder: values of parameter '{parameter_name}' cannot be casted to {data_type}: {details}"
+            logger.error(msg)
+            raise ValueError(msg)
+        parameter_values[parameter_name] = casted_values
+    return parameter_values
+
+
+def _write_variant(case: OspSimulationCase, case_folder: Path, variant: dict[str, Any]) -> None:
+    """Derive a variant from the base case and write its OSP-specific configuration files."""
+    start_values: dict[str, dict[str, Any]] = {}
+    for parameter_name, value in variant.items():
+        if parameter_name == "baseStepSize":
+            continue
+        component_name, _, variable_name = parameter_name.partition(".")
+        start_values.setdefault(component_name, {})[variable_name] = value
+    case_folder.mkdir(parents=True, exist_ok=True)
+    variant_case = case.variant(case_folder, start_values, variant.get("baseStepSize"))
+    variant_case.write_osp_system_structure_xml()
+    variant_case.write_system_structure_ssd()
+    variant_case.write_statistics_dict()
+    variant_case.write_watch_dict()
@@ -1,9 +1,11 @@
 import logging
-from collections.abc import MutableMapping
-from typing import Any
+from collections.abc import Mapping, MutableMapping
+from copy import copy
+from typing import Any, Self
 
 from ospx import Component, Connection, Connector, Endpoint
 from ospx.fmi import FMU, ScalarVariable, Unit
+from ospx.utils.profiling import count
 
 __all__ = ["System"]
 
@@ -103,6 +105,26 @@ class System:
                 variables |= component.variables
         return variables
 
+    def with_components(self, components: Mapping[str, Component]) -> Self:
+        """Return a copy of the system, with its components replaced by the passed in ones.
+
+        The connections are shared with the original system.
+        Components are hence expected to keep their names, as connections refer to them.
+
+        Parameters
+        ----------
+        components : Mapping[str, Component]
+            the components of the copy, by component name
+
+        Returns
+        -------
+        Self
+            the copy of the system
+        """
+        system = copy(self)
+        system._components = dict(components)  # noqa: SLF001
+        return system
+
     def _read_components(self, properties: MutableMapping[Any, Any]) -> None:
         """Read components from (case dict) properties."""
         logger.info("read components from case dict")
@@ -112,6 +134,7 @@ class System:
         for component_name, component_properties in properties["components"].items():
             component = Component(component_name, component_properties)
             self._components[component.name] = component
+        count("componentsRead", len(self._components))
 
     def _read_connections(self, properties: MutableMapping[Any, Any]) -> None:
         """Read connections from (case dict) properties."""
@@ -138,6 +161,7 @@ class System:
                     f"connection {connection_name}: connection could not be resolved. "
                     "Please recheck connection properties in case dict."
                 )
+        count("connectionsRead", len(self._connections))
         return
 
     def _read_endpoint(self, properties: MutableMapping[Any, Any]) -> Endpoint | None:
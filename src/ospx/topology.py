@@ -0,0 +1,204 @@
+"""Topology analysis of a system's connection graph: feedback loops, execution order and fan-in / fan-out."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from ospx.system import System
+
+__all__ = ["Topology"]
+
+logger = logging.getLogger(__name__)
+
+
+class Topology:
+    """Directed dependency graph of a system, with components as nodes and connections as edges (source -> target).
+
+    The graph is held in compressed sparse row (CSR) form:
+    The targets of all connections starting at component i are targets[offsets[i]:offsets[i + 1]].
+    Components are indexed in the order they are defined in the system.
+    All analyses run in linear time in the number of components and connections.
+    """
+
+    def __init__(self, system: System) -> None:
+        """Build the topology of the passed in system.
+
+        Connections with an endpoint that does not refer to a component of the system are ignored.
+
+        Parameters
+        ----------
+        system : System
+            the system
+        """
+        self.names: list[str] = list(system.components)
+        index: dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        sources: list[int] = []
+        targets: list[int] = []
+        for connection in system.connections.values():
+            source = connection.source_endpoint.component if connection.source_endpoint else None
+            target = connection.target_endpoint.component if connection.target_endpoint else None
+            if source is None or target is None or source.name not in index or target.name not in index:
+                continue
+            sources.append(index[source.name])
+            targets.append(index[target.name])
+
+        n = len(self.names)
+        source_array = np.asarray(sources, dtype=np.int64)
+        target_array = np.asarray(targets, dtype=np.int64)
+        self.fan_out: NDArray[np.int64] = np.bincount(source_array, minlength=n)
+        self.fan_in: NDArray[np.int64] = np.bincount(target_array, minlength=n)
+        self.offsets: NDArray[np.int64] = np.zeros(n + 1, dtype=np.int64)
+        self.offsets[1:] = np.cumsum(self.fan_out)
+        self.targets: NDArray[np.int64] = target_array[np.argsort(source_array, kind="stable")]
+        self._components: list[list[int]] | None = None
+
+    @property
+    def strongly_connected_components(self) -> list[list[int]]:
+        """Returns the strongly connected components of the graph, in topological order.
+
+        Uses an iterative variant of Tarjan's algorithm.
+        Each strongly connected component is a list of component indices, in the order of definition.
+        For each connection between two different strongly connected components,
+        the source's strongly connected component comes first.
+
+        Returns
+        -------
+        list[list[int]]
+            the strongly connected components
+        """
+        if self._components is None:
+            self._components = _tarjan(self.offsets.tolist(), self.targets.tolist())
+        return self._components
+
+    def loops(self) -> list[list[str]]:
+        """Return all feedback loops, i.e. groups of components depending on each other via their connections.
+
+        A loop is a strongly connected component with more than one component,
+        or a single component with a connection to itself.
+        Loops are candidates for algebraic loops, which need to be resolved by the co-simulation master.
+
+        Returns
+        -------
+        list[list[str]]
+            names of the components in each loop
+        """
+        return [
+            [self.names[i] for i in component]
+            for component in self.strongly_connected_components
+            if len(component) > 1 or self._has_self_loop(component[0])
+        ]
+
+    def execution_order(self) -> list[str]:
+        """Return a suggested execution order of the components.
+
+        Components come after all components they depend on, except for dependencies within a loop.
+        Components in a loop are ordered by their definition in the system.
+
+        Returns
+        -------
+        list[str]
+            component names in execution order
+        """
+        return [self.names[i] for component in self.strongly_connected_components for i in component]
+
+    def hot_spots(self, max_count: int = 10) -> dict[str, dict[str, int]]:
+        """Return the components with the highest fan-in and fan-out, i.e. the most incoming / outgoing connections.
+
+        Parameters
+        ----------
+        max_count : int, optional
+            maximum number of components returned for fan-in and fan-out each, by default 10
+
+        Returns
+        -------
+        dict[str, dict[str, int]]
+            number of connections by component name, for 'fanIn' and 'fanOut', in descending order
+        """
+        hot_spots: dict[str, dict[str, int]] = {}
+        for key, degrees in (("fanIn", self.fan_in), ("fanOut", self.fan_out)):
+            top = np.argsort(-degrees, kind="stable")[:max_count]
+            hot_spots[key] = {self.names[i]: int(degrees[i]) for i in top.tolist() if degrees[i] > 0}
+        return hot_spots
+
+    def _has_self_loop(self, i: int) -> bool:
+        return bool(np.any(self.targets[self.offsets[i] : self.offsets[i + 1]] == i))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the results of the topology analysis as dict, e.g. to be written into statisticsDict.
+
+        Returns
+        -------
+        dict[str, Any]
+            dict with loops, execution order and fan-in / fan-out hot spots
+        """
+        loops = self.loops()
+        return {
+            "loops": {
+                "count": len(loops),
+                "components": loops,
+            },
+            "executionOrder": self.execution_order(),
+            "hotSpots": self.hot_spots(),
+        }
+
+
+def _tarjan(offsets: list[int], targets: list[int]) -> list[list[int]]:
+    """Return the strongly connected components of a graph in CSR form, in topological order.
+
+    Iterative implementation of Tarjan's algorithm, to not run into Python's recursion limit on large graphs.
+    """
+    n = len(offsets) - 1
+    unvisited = -1
+    indices: list[int] = [unvisited] * n
+    low_links: list[int] = [0] * n
+    on_stack: list[bool] = [False] * n
+    stack: list[int] = []
+    components: list[list[int]] = []
+    next_index = 0
+
+    for root in range(n):
+        if indices[root] != unvisited:
+            continue
+        # Call stack of (node, position of the next edge to follow)
+        call_stack: list[tuple[int, int]] = [(root, offsets[root])]
+        indices[root] = low_links[root] = next_index
+        next_index += 1
+        stack.append(root)
+        on_stack[root] = True
+        while call_stack:
+            node, edge = call_stack[-1]
+            if edge < offsets[node + 1]:
+                call_stack[-1] = (node, edge + 1)
+                target = targets[edge]
+                if indices[target] == unvisited:
+                    indices[target] = low_links[target] = next_index
+                    next_index += 1
+                    stack.append(target)
+                    on_stack[target] = True
+                    call_stack.append((target, offsets[target]))
+                elif on_stack[target]:
+                    low_links[node] = min(low_links[node], indices[target])
+                continue
+            _ = call_stack.pop()
+            if call_stack:
+                parent = call_stack[-1][0]
+                low_links[parent] = min(low_links[parent], low_links[node])
+            if low_links[node] == indices[node]:
+                component: list[int] = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(sorted(component))
+
+    # Tarjan's algorithm finds the strongly connected components in reverse topological order.
+    components.reverse()
+    return components
@@ -0,0 +1,145 @@
+"""Unit compatibility of a system's connections: dimensional checks and the linear transformations needed."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from ospx.fmi import UnitTable
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from ospx.connection import Connection, Endpoint
+    from ospx.fmi import BaseUnit
+    from ospx.system import System
+
+__all__ = ["UnitCompatibility"]
+
+logger = logging.getLogger(__name__)
+
+# Tolerances when comparing the factors and offsets of linear transformations against identity
+_FACTOR_TOLERANCE: float = 1e-12
+_OFFSET_TOLERANCE: float = 1e-12
+
+
+class UnitCompatibility:
+    """Unit compatibility of all variable connections of a system, checked in one pass.
+
+    The unit of each connected variable is resolved to its base unit, and all distinct base units
+    are interned into one UnitTable. The connections are then compared in vectorized form:
+    Connections whose source and target units differ in dimension are incompatible.
+    Connections with compatible, but not identical units need a linear transformation
+    (target value = factor * source value + offset), e.g. kN -> N or degC -> K.
+    Connections where the unit of either variable, or its base unit, is not defined cannot be checked.
+    Variable group connections are not checked.
+    """
+
+    def __init__(self, system: System) -> None:
+        """Check the unit compatibility of all variable connections of the passed in system.
+
+        Parameters
+        ----------
+        system : System
+            the system
+        """
+        self.table: UnitTable = UnitTable()
+        connections: list[Connection] = [
+            connection for connection in system.connections.values() if connection.is_variable_connection
+        ]
+        self.names: list[str] = [connection.name for connection in connections]
+        count = len(connections)
+        self.sources: NDArray[np.int64] = np.fromiter(
+            (self._row(connection.source_endpoint) for connection in connections),
+            dtype=np.int64,
+            count=count,
+        )
+        self.targets: NDArray[np.int64] = np.fromiter(
+            (self._row(connection.target_endpoint) for connection in connections),
+            dtype=np.int64,
+            count=count,
+        )
+
+        # Connections with an undefined unit are coded as -1 and not compared
+        self.checked: NDArray[np.bool_] = (self.sources >= 0) & (self.targets >= 0)
+        self.compatible: NDArray[np.bool_] = np.zeros(count, dtype=np.bool_)
+        self.factors: NDArray[np.float64] = np.ones(count, dtype=np.float64)
+        self.offsets: NDArray[np.float64] = np.zeros(count, dtype=np.float64)
+        if np.any(self.checked):
+            sources, targets = self.sources[self.checked], self.targets[self.checked]
+            self.compatible[self.checked] = self.table.compatible(sources, targets)
+            self.factors[self.checked], self.offsets[self.checked] = self.table.linear_transformations(sources, targets)
+        self.needs_conversion: NDArray[np.bool_] = self.compatible & ~(
+            np.isclose(self.factors, 1.0, rtol=_FACTOR_TOLERANCE, atol=0.0)
+            & np.isclose(self.offsets, 0.0, rtol=0.0, atol=_OFFSET_TOLERANCE)
+        )
+
+    def incompatible_connections(self) -> list[str]:
+        """Return the connections whose source and target units differ in dimension.
+
+        Returns
+        -------
+        list[str]
+            names of the incompatible connections
+        """
+        return [self.names[i] for i in np.flatnonzero(self.checked & ~self.compatible).tolist()]
+
+    def conversions(self) -> dict[str, tuple[float, float]]:
+        """Return the linear transformations needed to convert between compatible, but not identical units.
+
+        Returns
+        -------
+        dict[str, tuple[float, float]]
+            factor and offset (target value = factor * source value + offset), by connection name
+        """
+        return {
+            self.names[i]: (float(self.factors[i]), float(self.offsets[i]))
+            for i in np.flatnonzero(self.needs_conversion).tolist()
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the results of the unit compatibility check as dict, e.g. to be written into statisticsDict.
+
+        Returns
+        -------
+        dict[str, Any]
+            dict with the number of connections checked, the incompatible connections,
+            and the connections needing conversion together with their linear transformations
+        """
+        incompatible = self.incompatible_connections()
+        conversions = self.conversions()
+        return {
+            "distinctUnits": len(self.table),
+            "connections": {
+                "count": len(self.names),
+                "checked": int(np.count_nonzero(self.checked)),
+            },
+            "incompatible": {
+                "count": len(incompatible),
+                "names": incompatible,
+            },
+            "conversions": {
+                "count": len(conversions),
+                "transformations": {
+                    name: {"factor": factor, "offset": offset} for name, (factor, offset) in conversions.items()
+                },
+            },
+        }
+
+    def _row(self, endpoint: Endpoint) -> int:
+        """Return the row index of the base unit of the variable an endpoint refers to, or -1 if undefined."""
+        base_unit = _base_unit(endpoint)
+        return -1 if base_unit is None else self.table.add(base_unit)
+
+
+def _base_unit(endpoint: Endpoint) -> BaseUnit | None:
+    """Return the base unit of the variable an endpoint refers to, if defined."""
+    component = endpoint.component
+    variable = endpoint.variable
+    if variable is None and endpoint.connector and endpoint.connector.variable:
+        variable = component.variables.get(endpoint.connector.variable)
+    if variable is None or not variable.unit or (unit := component.units.get(variable.unit)) is None:
+        return None
+    return unit.base_unit
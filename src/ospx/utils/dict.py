@@ -3,6 +3,8 @@ from collections import OrderedDict
 from collections.abc import MutableMapping
 from typing import Any
 
+from dictIO.formatter import NativeFormatter
+
 
 def find_key(dict_in: MutableMapping[Any, Any], pattern: str) -> str | None:
     """Find the first key in dict that matches the given pattern."""
@@ -57,3 +59,27 @@ def shrink_dict(dict_in: MutableMapping[Any, Any], unique_key: list[str] | None
             seen.add(eval(f"value{unique_keys_string}"))  # noqa: S307
 
     return {key: dict_in[key] for key in dict_in if key not in remove_key}
+
+
+class LinearNativeFormatter(NativeFormatter):
+    """Formatter to serialize a dict into a string in dictIO native file format, in linear time.
+
+    Produces the same output as dictIO's NativeFormatter.
+    NativeFormatter removes trailing spaces by concatenating the output line by line,
+    which takes quadratic time and dominates writing large dicts (e.g. case dicts with thousands of connections).
+    """
+
+    def remove_trailing_spaces(self, s: str) -> str:
+        """Remove trailing spaces from all lines.
+
+        Parameters
+        ----------
+        s : str
+            the string
+
+        Returns
+        -------
+        str
+            the string with trailing spaces removed from all lines
+        """
+        return "\n".join(line.rstrip() for line in s.replace("\r\n", "\n").replace("\r", "\n").split("\n"))
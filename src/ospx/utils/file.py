@@ -0,0 +1,210 @@
+import hashlib
+import logging
+import os
+import shutil
+import sys
+from pathlib import Path
+from tempfile import mkstemp
+
+__all__ = [
+    "clone_or_copy",
+    "file_digest",
+    "link_or_copy_atomic",
+    "unshare_file",
+    "write_bytes_atomic",
+    "write_text_atomic",
+]
+
+logger = logging.getLogger(__name__)
+
+# Umask assumed where the current umask cannot be read without changing it
+_DEFAULT_UMASK: int = 0o022
+
+# ioctl request code to clone a file on Linux file systems supporting reflinks (btrfs, xfs, ...)
+_FICLONE: int = 0x40049409
+
+
+def write_text_atomic(file: Path, content: str) -> None:
+    """Write a text file atomically.
+
+    The content is first written into a temporary file in the same folder,
+    which then replaces the target file in one step.
+    Readers of the target file hence never see a partially written file.
+
+    Parameters
+    ----------
+    file : Path
+        the file to be written
+    content : str
+        the text content to be written into the file
+    """
+    _write_atomic(file, content, "w")
+
+
+def write_bytes_atomic(file: Path, content: bytes) -> None:
+    """Write a binary file atomically.
+
+    Binary counterpart of write_text_atomic().
+
+    Parameters
+    ----------
+    file : Path
+        the file to be written
+    content : bytes
+        the binary content to be written into the file
+    """
+    _write_atomic(file, content, "wb")
+
+
+def _write_atomic(file: Path, content: str | bytes, mode: str) -> None:
+    file.parent.mkdir(parents=True, exist_ok=True)
+    file_handle, temp_name = mkstemp(dir=file.parent, prefix=f".{file.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(file_handle, mode) as f:
+            _ = f.write(content)
+        # Temporary files are created with restrictive permissions (0600).
+        # An existing file keeps its permissions; a new file gets the permissions a regular write would give it.
+        if file.exists():
+            shutil.copymode(file, temp_name)
+        else:
+            Path(temp_name).chmod(0o666 & ~_umask())
+        _ = Path(temp_name).replace(file)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def _umask() -> int:
+    """Return the umask of the current process.
+
+    The umask is read from /proc/self/status where available (Linux),
+    as os.umask() can only read the umask by temporarily changing it for the whole process.
+    Elsewhere, the common default umask 022 is assumed.
+    """
+    try:
+        with Path("/proc/self/status").open() as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    return _DEFAULT_UMASK
+
+
+def file_digest(file: Path) -> str:
+    """Return the SHA-256 digest of a file's content.
+
+    Parameters
+    ----------
+    file : Path
+        the file to be hashed
+
+    Returns
+    -------
+    str
+        the SHA-256 digest, as hex string
+    """
+    with file.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def link_or_copy_atomic(source: Path, target: Path) -> bool:
+    """Make target a hardlink to source, falling back to a copy where hardlinks are not supported.
+
+    As with write_text_atomic(), a temporary file in the target folder is created first,
+    which then replaces the target file in one step.
+
+    Parameters
+    ----------
+    source : Path
+        the existing file to be linked
+    target : Path
+        the file to be created (or replaced)
+
+    Returns
+    -------
+    bool
+        True if a hardlink was created, False if the file was copied
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    file_handle, temp_name = mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    os.close(file_handle)
+    temp_file = Path(temp_name)
+    temp_file.unlink()
+    try:
+        try:
+            temp_file.hardlink_to(source)
+            linked = True
+        except OSError as e:
+            logger.debug(f"Hardlink {source} --> {target} failed ({e}). File gets cloned or copied instead.")
+            clone_or_copy(source, temp_file)
+            linked = False
+        _ = temp_file.replace(target)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+    return linked
+
+
+def clone_or_copy(source: Path, target: Path) -> bool:
+    """Clone source to target where the file system supports reflinks, falling back to a regular copy.
+
+    A clone (reflink) shares the data blocks of the source until either of the files gets modified,
+    hence does not copy any data. Reflinks are supported on Linux by file systems like btrfs and xfs.
+
+    Parameters
+    ----------
+    source : Path
+        the existing file to be cloned
+    target : Path
+        the file to be created (or overwritten)
+
+    Returns
+    -------
+    bool
+        True if a clone was created, False if the file was copied
+    """
+    if sys.platform == "linux":
+        import fcntl  # noqa: PLC0415
+
+        try:
+            with source.open("rb") as f_source, target.open("wb") as f_target:
+                _ = fcntl.ioctl(f_target.fileno(), _FICLONE, f_source.fileno())
+        except OSError as e:
+            logger.debug(f"Reflink {source} --> {target} failed ({e}). File gets copied instead.")
+        else:
+            _ = shutil.copystat(source, target)
+            return True
+    _ = shutil.copy2(source, target)
+    return False
+
+
+def unshare_file(file: Path) -> bool:
+    """Give a hardlinked file a content of its own, before it gets modified in place.
+
+    If the file has further hardlinks, it gets replaced by a copy (or clone) of itself.
+    Modifying the file thereafter leaves all other hardlinks of the former file untouched (copy-on-write).
+
+    Parameters
+    ----------
+    file : Path
+        the file about to be modified
+
+    Returns
+    -------
+    bool
+        True if the file was hardlinked and got replaced, False if the file was not hardlinked
+    """
+    if not file.exists() or file.stat().st_nlink < 2:  # noqa: PLR2004
+        return False
+    file_handle, temp_name = mkstemp(dir=file.parent, prefix=f".{file.name}.", suffix=".tmp")
+    os.close(file_handle)
+    temp_file = Path(temp_name)
+    try:
+        _ = clone_or_copy(file, temp_file)
+        _ = temp_file.replace(file)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+    logger.debug(f"{file} was hardlinked and got replaced by a copy of its own.")
+    return True
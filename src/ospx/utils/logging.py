@@ -3,6 +3,7 @@
 import logging
 import sys
 from pathlib import Path
+from typing import TextIO
 
 __all__ = ["configure_logging"]
 
@@ -13,6 +14,7 @@ def configure_logging(
     log_level_console: str = "WARNING",
     log_file: Path | None = None,
     log_level_file: str = "WARNING",
+    console_stream: TextIO | None = None,
 ) -> None:
     """Configure logging for the application, allowing for both console and file logging.
 
@@ -26,6 +28,8 @@ def configure_logging(
         log file to be used. If None, file logging is disabled. by default None
     log_level_file : str, optional
         log level for file output, by default "WARNING"
+    console_stream : TextIO | None, optional
+        stream console output is written to. If None, sys.stdout is used. by default None
 
     Raises
     ------
@@ -48,7 +52,7 @@ def configure_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)
 
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = logging.StreamHandler(console_stream or sys.stdout)
     console_handler.setLevel(log_level_console_numeric)
     console_formatter = logging.Formatter("%(levelname)-8s %(message)s")
     console_handler.setFormatter(console_formatter)
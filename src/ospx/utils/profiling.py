@@ -0,0 +1,240 @@
+"""Instrumentation to time and count the individual phases of an ospx build."""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from contextlib import AbstractContextManager
+    from pathlib import Path
+    from types import TracebackType
+
+__all__ = ["BuildProfiler", "count", "phase"]
+
+logger = logging.getLogger(__name__)
+
+# The build profiler currently collecting timings and counters (if any).
+_active_profiler: BuildProfiler | None = None
+
+
+@dataclass()
+class PhaseTiming:
+    """Data class holding the accumulated timings of one build phase."""
+
+    name: str
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    calls: int = 0
+
+
+class BuildProfiler:
+    """Collects per-phase wall and CPU timings as well as counters while a build is running.
+
+    A BuildProfiler gets activated by using it as a context manager.
+    While active, the module level functions `phase()` and `count()` record into it.
+    Optionally, a code profiler (cProfile or pyinstrument) is run alongside.
+    """
+
+    code_profilers: tuple[str, ...] = ("cProfile", "pyinstrument")
+
+    def __init__(self, code_profiler: str | None = None) -> None:
+        self.phases: dict[str, PhaseTiming] = {}
+        self.counters: dict[str, int] = {}
+        self.code_profiler: str | None = None
+        self.started_at: datetime | None = None
+        self.wall_time: float = 0.0
+        self.cpu_time: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+        self._profiler: Any = None
+        self._start_wall_time: float = 0.0
+        self._start_cpu_time: float = 0.0
+        self._previous_profiler: BuildProfiler | None = None
+        if code_profiler:
+            if code_profiler in self.code_profilers:
+                self.code_profiler = code_profiler
+            else:
+                logger.error(f"BuildProfiler: code profiler '{code_profiler}' is invalid. No code profiler is used.")
+
+    def __enter__(self) -> Self:
+        global _active_profiler
+        self._previous_profiler = _active_profiler
+        _active_profiler = self
+        self.started_at = datetime.now(tz=UTC)
+        self._start_code_profiler()
+        self._start_wall_time = time.perf_counter()
+        self._start_cpu_time = time.process_time()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        global _active_profiler
+        self.wall_time = time.perf_counter() - self._start_wall_time
+        self.cpu_time = time.process_time() - self._start_cpu_time
+        self._stop_code_profiler()
+        _active_profiler = self._previous_profiler
+        self._previous_profiler = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block and accumulate its wall and CPU time under the passed in phase name.
+
+        Parameters
+        ----------
+        name : str
+            name of the phase
+        """
+        start_wall_time = time.perf_counter()
+        start_cpu_time = time.process_time()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - start_wall_time
+            cpu_time = time.process_time() - start_cpu_time
+            with self._lock:
+                timing = self.phases.setdefault(name, PhaseTiming(name))
+                timing.wall_time += wall_time
+                timing.cpu_time += cpu_time
+                timing.calls += 1
+            logger.debug(f"phase {name}: wall time {wall_time:.4f}s, cpu time {cpu_time:.4f}s")
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Increment the counter with the passed in name.
+
+        Parameters
+        ----------
+        name : str
+            name of the counter
+        value : int, optional
+            value the counter is incremented by, by default 1
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the collected timings and counters as a (json serializable) dict.
+
+        Returns
+        -------
+        dict[str, Any]
+            dict with the collected timings and counters
+        """
+        return {
+            "startedAt": self.started_at.isoformat() if self.started_at else None,
+            "wallTime": self.wall_time,
+            "cpuTime": self.cpu_time,
+            "phases": {
+                timing.name: {
+                    "wallTime": timing.wall_time,
+                    "cpuTime": timing.cpu_time,
+                    "calls": timing.calls,
+                }
+                for timing in self.phases.values()
+            },
+            "counters": dict(self.counters),
+            "codeProfiler": self.code_profiler,
+        }
+
+    def write_report(self, folder: Path, name: str = "buildProfile") -> Path:
+        """Write the timing report as json file into the passed in folder.
+
+        If a code profiler was run, its output is saved beside the report,
+        as <name>.prof (cProfile) or <name>.html (pyinstrument).
+
+        Parameters
+        ----------
+        folder : Path
+            folder the report shall be written into
+        name : str, optional
+            base name of the report file(s), by default "buildProfile"
+
+        Returns
+        -------
+        Path
+            the written json report file
+        """
+        report = self.to_dict()
+        if self._profiler is not None:
+            if self.code_profiler == "cProfile":
+                profile_file = folder / f"{name}.prof"
+                self._profiler.dump_stats(profile_file)
+            else:
+                profile_file = folder / f"{name}.html"
+                with profile_file.open("w") as f:
+                    _ = f.write(self._profiler.output_html())
+            report["codeProfilerOutput"] = profile_file.name
+        report_file = folder / f"{name}.json"
+        with report_file.open("w") as f:
+            json.dump(report, f, indent=4)
+        logger.info(f"Build profile written to {report_file}")
+        return report_file
+
+    def _start_code_profiler(self) -> None:
+        if self.code_profiler == "cProfile":
+            import cProfile  # noqa: PLC0415
+
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        elif self.code_profiler == "pyinstrument":
+            try:
+                from pyinstrument import Profiler  # noqa: PLC0415  # pyright: ignore[reportMissingImports]
+            except ImportError:
+                logger.warning(
+                    "BuildProfiler: pyinstrument is not installed. Install it with 'pip install pyinstrument'. "
+                    "Build gets timed without code profiler."
+                )
+                self.code_profiler = None
+                return
+            self._profiler = Profiler()
+            self._profiler.start()
+
+    def _stop_code_profiler(self) -> None:
+        if self._profiler is None:
+            return
+        if self.code_profiler == "cProfile":
+            self._profiler.disable()
+        else:
+            _ = self._profiler.stop()
+
+
+def phase(name: str) -> AbstractContextManager[None]:
+    """Time the enclosed block as build phase, if a BuildProfiler is active. Otherwise do nothing.
+
+    Parameters
+    ----------
+    name : str
+        name of the phase
+
+    Returns
+    -------
+    AbstractContextManager[None]
+        context manager timing the enclosed block
+    """
+    if _active_profiler is None:
+        return nullcontext()
+    return _active_profiler.phase(name)
+
+
+def count(name: str, value: int = 1) -> None:
+    """Increment the counter with the passed in name, if a BuildProfiler is active. Otherwise do nothing.
+
+    Parameters
+    ----------
+    name : str
+        name of the counter
+    value : int, optional
+        value the counter is incremented by, by default 1
+    """
+    if _active_profiler is not None:
+        _active_profiler.count(name, value)
@@ -0,0 +1,152 @@
+"""Content-addressed file store, sharing identical files between case folders via hardlinks."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+from ospx.utils.file import clone_or_copy, file_digest, link_or_copy_atomic, write_text_atomic
+
+__all__ = ["FileStore"]
+
+logger = logging.getLogger(__name__)
+
+
+class FileStore:
+    """Content-addressed file store.
+
+    Files are stored under the SHA-256 digest of their content, as <folder>/<digest[:2]>/<digest><suffix>.
+    Files are put into the store once per content, and from there linked into the target folders:
+    As hardlinks where the file system supports it, otherwise as clones (reflinks) or, as last resort, as copies.
+    Linking a file whose content is already in the store and already linked to the target does not copy any data.
+
+    To avoid re-hashing unchanged files, the digests of source files are cached in an index inside the store,
+    keyed by path and validated by size and modification time.
+    """
+
+    index_file_name: str = "index.json"
+
+    def __init__(self, folder: str | os.PathLike[str] | None = None) -> None:
+        """Instantiate a file store.
+
+        Parameters
+        ----------
+        folder : str | os.PathLike[str] | None, optional
+            the store folder. If None, the default store folder is used. By default None
+        """
+        self.folder: Path = Path(folder) if folder else FileStore.default_folder()
+        self._index: dict[str, tuple[int, int, str]] | None = None
+        self._lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def default_folder() -> Path:
+        """Return the default store folder.
+
+        The default store folder is read from environment variable OSPX_FMU_STORE.
+        If the environment variable is not set, ~/.ospx/fmuStore is used.
+        Hardlinks require the store folder to be located on the same file system as the case folders.
+
+        Returns
+        -------
+        Path
+            the default store folder
+        """
+        if folder := os.environ.get("OSPX_FMU_STORE"):
+            return Path(folder)
+        return Path.home() / ".ospx" / "fmuStore"
+
+    def digest(self, file: Path) -> str:
+        """Return the SHA-256 digest of the content of the passed in file.
+
+        Parameters
+        ----------
+        file : Path
+            the file
+
+        Returns
+        -------
+        str
+            the SHA-256 digest, as hex string
+        """
+        key = str(file.resolve())
+        stat = file.stat()
+        with self._lock:
+            index = self._read_index()
+            if (entry := index.get(key)) and (entry[0], entry[1]) == (stat.st_size, stat.st_mtime_ns):
+                return entry[2]
+        digest = file_digest(file)
+        with self._lock:
+            index[key] = (stat.st_size, stat.st_mtime_ns, digest)
+            write_text_atomic(self.folder / self.index_file_name, json.dumps(index, indent=0))
+        return digest
+
+    def put(self, file: Path) -> Path:
+        """Put the passed in file into the store, unless a file with the same content is already stored.
+
+        The store gets a copy (or clone) of the file, not a hardlink,
+        so that the stored file remains unchanged even if the original file gets modified in place.
+
+        Parameters
+        ----------
+        file : Path
+            the file
+
+        Returns
+        -------
+        Path
+            the stored file
+        """
+        digest = self.digest(file)
+        stored_file = self.folder / digest[:2] / f"{digest}{file.suffix}"
+        if not stored_file.exists():
+            logger.info(f"Put {file} into file store {self.folder}")
+            stored_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = stored_file.with_name(f".{stored_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                _ = clone_or_copy(file, temp_file)
+                _ = temp_file.replace(stored_file)
+            except BaseException:
+                temp_file.unlink(missing_ok=True)
+                raise
+        return stored_file
+
+    def link(self, file: Path, target: Path) -> Path:
+        """Put the passed in file into the store and link the stored file to target.
+
+        If target is already linked to the stored file, or is a copy with the same content, nothing is done.
+        If target exists but has other content, it gets replaced.
+
+        Parameters
+        ----------
+        file : Path
+            the file
+        target : Path
+            the link (or copy, where hardlinks are not supported) to be created
+
+        Returns
+        -------
+        Path
+            the stored file
+        """
+        stored_file = self.put(file)
+        if target.exists() and (target.samefile(stored_file) or self.digest(target) == stored_file.stem):
+            logger.debug(f"{target} is up to date.")
+            return stored_file
+        if not link_or_copy_atomic(stored_file, target):
+            logger.warning(
+                f"{target} could not be hardlinked to file store {self.folder} and got cloned or copied instead. "
+                "Place the file store on the same file system as the case folders (see OSPX_FMU_STORE)."
+            )
+        return stored_file
+
+    def _read_index(self) -> dict[str, tuple[int, int, str]]:
+        if self._index is None:
+            index_file = self.folder / self.index_file_name
+            try:
+                self._index = {key: tuple(value) for key, value in json.loads(index_file.read_text()).items()}  # pyright: ignore[reportAttributeAccessIssue]
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
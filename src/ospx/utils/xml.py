@@ -0,0 +1,186 @@
+"""Incremental XML emitter and reader, writing and reading XML elements one by one instead of whole documents."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from xml.sax.saxutils import escape
+
+from lxml import etree
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterator, Mapping
+    from typing import IO, TextIO
+
+__all__ = ["XmlStreamWriter", "iter_elements", "local_name"]
+
+_ATTRIBUTE_ENTITIES: dict[str, str] = {'"': "&quot;", "\n": "&#10;", "\r": "&#13;", "\t": "&#9;"}
+
+
+class XmlStreamWriter:
+    """Incremental XML emitter.
+
+    Writes XML elements one by one into a text stream, without building a document tree in memory.
+    The output is pretty-printed the same way as dictIO's XmlFormatter does it
+    (indentation by four spaces, empty elements written as self-closing tags),
+    so that files written by XmlStreamWriter are identical to the ones written through DictWriter.
+    """
+
+    def __init__(self, stream: TextIO, indent: str = " " * 4) -> None:
+        self.stream: TextIO = stream
+        self.indent: str = indent
+        self._open_tags: list[str] = []
+        # True while the start tag of the innermost open element is not yet closed with '>'.
+        # This allows to write elements without children as self-closing tags.
+        self._start_tag_pending: bool = False
+
+    def declaration(self) -> None:
+        """Write the XML declaration."""
+        _ = self.stream.write('<?xml version="1.0" ?>\n')
+
+    def start(self, tag: str, attributes: Mapping[str, Any] | None = None) -> None:
+        """Open an element. Child elements written thereafter get nested inside, until end() is called.
+
+        Parameters
+        ----------
+        tag : str
+            tag of the element
+        attributes : Mapping[str, Any] | None, optional
+            attributes of the element, by default None
+        """
+        self._close_pending_start_tag()
+        _ = self.stream.write(f"{self.indent * len(self._open_tags)}<{tag}{_format_attributes(attributes)}")
+        self._open_tags.append(tag)
+        self._start_tag_pending = True
+
+    def end(self) -> None:
+        """Close the innermost open element."""
+        tag = self._open_tags.pop()
+        if self._start_tag_pending:
+            _ = self.stream.write("/>\n")
+            self._start_tag_pending = False
+        else:
+            _ = self.stream.write(f"{self.indent * len(self._open_tags)}</{tag}>\n")
+
+    def element(
+        self,
+        tag: str,
+        attributes: Mapping[str, Any] | None = None,
+        text: Any = None,  # noqa: ANN401
+    ) -> None:
+        """Write a complete element (without child elements).
+
+        Parameters
+        ----------
+        tag : str
+            tag of the element
+        attributes : Mapping[str, Any] | None, optional
+            attributes of the element, by default None
+        text : Any, optional
+            text content of the element, by default None
+        """
+        self._close_pending_start_tag()
+        indent = self.indent * len(self._open_tags)
+        if text is None:
+            _ = self.stream.write(f"{indent}<{tag}{_format_attributes(attributes)}/>\n")
+        else:
+            _ = self.stream.write(
+                f"{indent}<{tag}{_format_attributes(attributes)}>{escape(_format_value(text))}</{tag}>\n"
+            )
+
+    @contextmanager
+    def block(self, tag: str, attributes: Mapping[str, Any] | None = None) -> Iterator[None]:
+        """Open an element for the enclosed block and close it thereafter.
+
+        Parameters
+        ----------
+        tag : str
+            tag of the element
+        attributes : Mapping[str, Any] | None, optional
+            attributes of the element, by default None
+        """
+        self.start(tag, attributes)
+        try:
+            yield
+        finally:
+            self.end()
+
+    def _close_pending_start_tag(self) -> None:
+        if self._start_tag_pending:
+            _ = self.stream.write(">\n")
+            self._start_tag_pending = False
+
+
+def iter_elements(source: str | os.PathLike[str] | IO[bytes], max_depth: int = 1) -> Iterator[etree._Element]:
+    """Parse an XML file incrementally and yield its elements one by one, as soon as they are complete.
+
+    Yields all elements up to max_depth (root element: depth 0), each when its end tag has been parsed,
+    i.e. children come before their parent. Each yielded element still holds all its child elements.
+    Once processed, an element gets cleared and removed from the tree,
+    so memory stays bounded by the size of the largest element below max_depth, not by the size of the document.
+
+    Parameters
+    ----------
+    source : str | os.PathLike[str] | IO[bytes]
+        the XML file, or a binary stream to read the XML content from (e.g. a member of a zip file)
+    max_depth : int, optional
+        depth up to which elements are yielded, by default 1
+
+    Yields
+    ------
+    Iterator[etree._Element]
+        the elements, in the order their end tags appear in the document
+    """
+    depth: int = -1
+    for event, element in etree.iterparse(source, events=("start", "end"), remove_comments=True, remove_pis=True):
+        if event == "start":
+            depth += 1
+            continue
+        element_depth = depth
+        depth -= 1
+        if element_depth > max_depth:
+            continue
+        yield element
+        # Free the processed element and all its preceding siblings
+        element.clear(keep_tail=False)
+        parent = element.getparent()
+        if parent is not None:
+            while element.getprevious() is not None:
+                del parent[0]
+
+
+def local_name(element: etree._Element) -> str:
+    """Return the tag name of an element without namespace.
+
+    Parameters
+    ----------
+    element : etree._Element
+        the element
+
+    Returns
+    -------
+    str
+        the tag name without namespace
+    """
+    return etree.QName(element).localname
+
+
+def _format_value(value: Any) -> str:  # noqa: ANN401
+    """Format a value the same way dictIO's XmlFormatter formats attribute values.
+
+    Booleans (and strings spelling booleans) are written in lowercase, as is common in XML.
+    """
+    if isinstance(value, Path):
+        return str(value)
+    string = str(value)
+    return string.lower() if string.lower() in {"true", "false"} else string
+
+
+def _format_attributes(attributes: Mapping[str, Any] | None) -> str:
+    if not attributes:
+        return ""
+    return "".join(
+        f' {name}="{escape(_format_value(value), _ATTRIBUTE_ENTITIES)}"' for name, value in attributes.items()
+    )
@@ -1,13 +1,33 @@
 import logging
 import os
 import re
+import struct
+import zlib
+from collections.abc import Mapping
+from copy import copy
+from datetime import datetime
 from pathlib import Path
-from shutil import copyfile
+from shutil import copyfile, copyfileobj, copymode
 from tempfile import mkstemp
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import BinaryIO
+from zipfile import ZIP64_LIMIT, ZIP_DEFLATED, BadZipFile, ZipFile, ZipInfo, sizeFileHeader, structFileHeader
+
+from ospx.utils.file import unshare_file
+from ospx.utils.profiling import count
 
 logger = logging.getLogger(__name__)
 
+# Size of the chunks in which zip members are streamed from one zip file into another.
+# Bounds the memory needed to rewrite a zip file, regardless of the size of its members.
+CHUNK_SIZE: int = 1024 * 1024
+
+# General purpose flag bits of a zip member, see https://pkware.cachefly.net/webdocs/casestudies/APPNOTE.TXT
+_FLAG_ENCRYPTED: int = 0x01
+_FLAG_DATA_DESCRIPTOR: int = 0x08
+# Indices of the file name length and extra field length in a local file header
+_FILE_HEADER_FILENAME_LENGTH: int = 10
+_FILE_HEADER_EXTRA_FIELD_LENGTH: int = 11
+
 
 def read_file_content_from_zip(zip_file: Path, file_name: str) -> str | None:
     """Read a single file.
@@ -20,7 +40,9 @@ def read_file_content_from_zip(zip_file: Path, file_name: str) -> str | None:
         with ZipFile(zip_file, "r") as zip_read:
             for item in zip_read.infolist():
                 if re.search(file_name, item.filename):
-                    file_content = str(zip_read.read(item.filename).decode("utf-8"))
+                    data = zip_read.read(item.filename)
+                    count("bytesReadFromZips", len(data))
+                    file_content = str(data.decode("utf-8"))
                     break
     except Exception:
         logger.exception("misc.zip.read_file_content_from_zip failed")
@@ -35,17 +57,16 @@ def rename_file_in_zip(zip_file: Path, file_name: str, new_file_name: str) -> Zi
 
     Belongs to zip functions.
     """
+    _ = unshare_file(zip_file)  # copy-on-write, as the zip file gets modified in place
     file_handle, temp_name = mkstemp(dir=zip_file.parent)
     updated_zip_file = None
     try:
         with ZipFile(zip_file, "r") as zip_read, ZipFile(temp_name, "w") as zip_write:
             for item in zip_read.infolist():
-                if item.filename != file_name:
-                    data = zip_read.read(item.filename)
+                if item.filename == file_name:
+                    _copy_member(zip_read, zip_write, item, new_file_name)
                 else:
-                    data = zip_read.read(item.filename)
-                    item.filename = new_file_name
-                zip_write.writestr(item, data)
+                    _copy_member(zip_read, zip_write, item)
         _ = copyfile(temp_name, zip_file)
 
         updated_zip_file = ZipFile(zip_file, mode="a")
@@ -64,14 +85,14 @@ def remove_files_from_zip(zip_file: Path, *file_names: str) -> ZipFile | None:
 
     Belongs to zip functions.
     """
+    _ = unshare_file(zip_file)  # copy-on-write, as the zip file gets modified in place
     file_handle, temp_name = mkstemp(dir=zip_file.parent)
     updated_zip_file = None
     try:
         with ZipFile(zip_file, "r") as zip_read, ZipFile(temp_name, "w") as zip_write:
             for item in zip_read.infolist():
                 if item.filename not in file_names:
-                    data = zip_read.read(item.filename)
-                    zip_write.writestr(item, data)
+                    _copy_member(zip_read, zip_write, item)
 
         _ = copyfile(temp_name, zip_file)
 
@@ -92,6 +113,7 @@ def add_file_content_to_zip(zip_file: Path, file_name: str, file_content: str) -
 
     Belongs to zip functions.
     """
+    _ = unshare_file(zip_file)  # copy-on-write, as the zip file gets modified in place
     file_handle, temp_name = mkstemp(dir=zip_file.parent)
     updated_zip_file = None
     try:
@@ -116,6 +138,7 @@ def substitute_text_in_zip(
 
     Belongs to zip functions.
     """
+    _ = unshare_file(zip_file)  # copy-on-write, as the zip file gets returned opened for modification
     file_handle, temp_name = mkstemp(dir=zip_file.parent)
     updated_zip_file = None
     try:
@@ -123,7 +146,7 @@ def substitute_text_in_zip(
             zip_write.comment = zip_read.comment  # preserve the comment
             for item in zip_read.infolist():
                 if not re.search(file_name_pattern, item.filename):
-                    zip_write.writestr(item, zip_read.read(item.filename))
+                    _copy_member(zip_read, zip_write, item)
                 else:
                     temp = zip_read.read(item.filename)
                     source = (re.findall(subst[0], str(temp)))[0]
@@ -148,6 +171,7 @@ def update_file_content_in_zip(zip_file: Path, file_name: str, file_content: str
 
     Belongs to zip functions.
     """
+    _ = unshare_file(zip_file)  # copy-on-write, as the zip file gets modified in place
     file_handle, temp_name = mkstemp(dir=zip_file.parent)
     updated_zip_file = None
     try:
@@ -155,7 +179,7 @@ def update_file_content_in_zip(zip_file: Path, file_name: str, file_content: str
             zip_write.comment = zip_read.comment  # preserve the comment
             for item in zip_read.infolist():
                 if item.filename != file_name:
-                    zip_write.writestr(item, zip_read.read(item.filename))
+                    _copy_member(zip_read, zip_write, item)
 
         with ZipFile(zip_file, mode="a", compression=ZIP_DEFLATED) as zf:
             # zf.writestr(contentFile, '<?xml version="1.0" encoding="UTF-8"?>\n'+data.decode('utf-8'))  # noqa: ERA001
@@ -170,3 +194,192 @@ def update_file_content_in_zip(zip_file: Path, file_name: str, file_content: str
         Path(temp_name).unlink(missing_ok=True)
 
     return updated_zip_file
+
+
+def _copy_member(zip_read: ZipFile, zip_write: ZipFile, item: ZipInfo, new_file_name: str | None = None) -> None:
+    """Copy a single member from one zip file into another, streaming it in chunks of CHUNK_SIZE.
+
+    Belongs to zip functions.
+    """
+    with zip_read.open(item) as source:
+        # (note: item is reused for the target member. Rename it only after the source member has been opened.)
+        if new_file_name is not None:
+            item.filename = new_file_name
+        with zip_write.open(item, mode="w", force_zip64=item.file_size > ZIP64_LIMIT) as target:
+            copyfileobj(source, target, CHUNK_SIZE)
+    count("bytesReadFromZips", item.file_size)
+
+
+def copy_zip(
+    zip_file: Path,
+    target_zip_file: Path,
+    renames: Mapping[str, str] | None = None,
+    replacements: Mapping[str, str | bytes] | None = None,
+) -> None:
+    """Copy a zip file in a single pass, renaming and replacing members on the fly.
+
+    Members which are neither renamed nor replaced are copied as raw (compressed) bytes,
+    i.e. without being decompressed and recompressed.
+    Members are copied in chunks of CHUNK_SIZE, so memory use is bounded regardless of member size.
+    Replacements for members that do not exist in the source zip file are appended.
+    The copy is written into a temporary file in the target folder, which then replaces the target zip file.
+    An existing target zip file is hence never written in place
+    (and files hardlinked to it, e.g. in a file store, remain unchanged).
+
+    Belongs to zip functions.
+
+    Parameters
+    ----------
+    zip_file : Path
+        the zip file to be copied
+    target_zip_file : Path
+        the zip file to be written
+    renames : Mapping[str, str] | None, optional
+        members to be renamed, as mapping from existing to new member name, by default None
+    replacements : Mapping[str, str | bytes] | None, optional
+        members to be replaced, as mapping from member name to new content, by default None
+    """
+    renames = renames or {}
+    replacements = dict(replacements or {})
+    file_handle, temp_name = mkstemp(dir=target_zip_file.parent, prefix=f".{target_zip_file.name}.", suffix=".tmp")
+    os.close(file_handle)
+    try:
+        with ZipFile(zip_file, "r") as zip_read, ZipFile(temp_name, "w") as zip_write:
+            zip_write.comment = zip_read.comment  # preserve the comment
+            for item in zip_read.infolist():
+                if item.filename in replacements:
+                    _write_replacement(zip_write, item.filename, replacements.pop(item.filename))
+                elif _can_copy_raw(item):
+                    _copy_member_raw(zip_read, zip_write, item, renames.get(item.filename))
+                else:
+                    _copy_member(zip_read, zip_write, item, renames.get(item.filename))
+            for file_name, content in replacements.items():
+                _write_replacement(zip_write, file_name, content)
+        if zip_file.exists():
+            copymode(zip_file, temp_name)
+        _ = Path(temp_name).replace(target_zip_file)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def extract_member(zip_read: ZipFile, file_name: str, target: Path) -> bool:
+    """Extract a single member of a zip file, unless the target file already has the same content.
+
+    Whether the content is the same is determined by size and CRC-32, without decompressing the member.
+    The member is streamed into a temporary file in chunks of CHUNK_SIZE, which then replaces the target file.
+
+    Belongs to zip functions.
+
+    Parameters
+    ----------
+    zip_read : ZipFile
+        the zip file, opened for reading
+    file_name : str
+        name of the member to be extracted
+    target : Path
+        the file the member gets extracted to
+
+    Returns
+    -------
+    bool
+        True if the member got extracted, False if the target file was already up to date
+
+    Raises
+    ------
+    KeyError
+        if the zip file has no member with the passed in name
+    """
+    item = zip_read.getinfo(file_name)
+    if target.is_file() and target.stat().st_size == item.file_size and _crc32(target) == item.CRC:
+        logger.debug(f"{target} is up to date.")
+        return False
+    target.parent.mkdir(parents=True, exist_ok=True)
+    file_handle, temp_name = mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(file_handle, "wb") as f, zip_read.open(item) as source:
+            copyfileobj(source, f, CHUNK_SIZE)
+        _ = Path(temp_name).replace(target)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+    count("bytesReadFromZips", item.file_size)
+    return True
+
+
+def _crc32(file: Path) -> int:
+    """Return the CRC-32 of the content of a file, as stored in zip files."""
+    crc = 0
+    with file.open("rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+def _can_copy_raw(item: ZipInfo) -> bool:
+    """Whether a member can be copied as raw bytes.
+
+    Encrypted members and members requiring zip64 extensions are excluded and get recompressed instead.
+    """
+    return not (
+        item.flag_bits & _FLAG_ENCRYPTED
+        or item.file_size > ZIP64_LIMIT
+        or item.compress_size > ZIP64_LIMIT
+        or item.header_offset > ZIP64_LIMIT
+    )
+
+
+def _copy_member_raw(zip_read: ZipFile, zip_write: ZipFile, item: ZipInfo, new_file_name: str | None = None) -> None:
+    """Copy a single member from one zip file into another as raw (compressed) bytes, without recompressing it.
+
+    Belongs to zip functions.
+    """
+    assert zip_read.fp is not None
+    assert zip_write.fp is not None
+    # Locate the compressed data of the member, located behind its local file header
+    _ = zip_read.fp.seek(item.header_offset)
+    file_header = struct.unpack(structFileHeader, zip_read.fp.read(sizeFileHeader))
+    if file_header[0] != b"PK\x03\x04":
+        msg = f"Bad magic number for file header of {item.filename}"
+        raise BadZipFile(msg)
+    _ = zip_read.fp.seek(
+        file_header[_FILE_HEADER_FILENAME_LENGTH] + file_header[_FILE_HEADER_EXTRA_FIELD_LENGTH],
+        os.SEEK_CUR,
+    )
+
+    new_item = copy(item)
+    if new_file_name is not None:
+        new_item.filename = new_file_name
+        new_item.orig_filename = new_file_name
+    # CRC and sizes are known upfront and get written into the local file header.
+    # A data descriptor behind the data is hence not needed.
+    new_item.flag_bits &= ~_FLAG_DATA_DESCRIPTOR
+    new_item.header_offset = zip_write.fp.tell()
+    _ = zip_write.fp.write(new_item.FileHeader(zip64=False))
+    _copy_bytes(zip_read.fp, zip_write.fp, item.compress_size)
+
+    # Register the member in the target zip file, so that it gets listed in the central directory
+    zip_write.filelist.append(new_item)
+    zip_write.NameToInfo[new_item.filename] = new_item
+    zip_write.start_dir = zip_write.fp.tell()
+    zip_write._didModify = True  # noqa: SLF001  # pyright: ignore[reportAttributeAccessIssue]
+    count("bytesReadFromZips", item.compress_size)
+
+
+def _copy_bytes(source: BinaryIO, target: BinaryIO, size: int) -> None:
+    """Copy size bytes from source to target, in chunks of CHUNK_SIZE."""
+    remaining = size
+    while remaining > 0:
+        chunk = source.read(min(CHUNK_SIZE, remaining))
+        if not chunk:
+            msg = "Unexpected end of zip file while copying member data"
+            raise BadZipFile(msg)
+        _ = target.write(chunk)
+        remaining -= len(chunk)
+
+
+def _write_replacement(zip_write: ZipFile, file_name: str, content: str | bytes) -> None:
+    """Write the content of a replaced (or added) member, deflate-compressed and with the current timestamp."""
+    item = ZipInfo(file_name, date_time=datetime.now().timetuple()[:6])  # noqa: DTZ005
+    item.compress_type = ZIP_DEFLATED
+    zip_write.writestr(item, content)
@@ -0,0 +1,383 @@
+"""Bulk validation of a system's connections against the variables and variable groups of the components' FMUs."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from ospx.fmi import Causality, DataType
+from ospx.utils.xml import iter_elements, local_name
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+    from ospx.component import Component
+    from ospx.fmi import VariableTable
+
+__all__ = ["ConnectionIssue", "ConnectionValidator", "ValidationReport"]
+
+logger = logging.getLogger(__name__)
+
+# Connector type and causality expected at each end of a connection
+_EXPECTED_CONNECTOR_TYPES: dict[str, str] = {"source": "output", "target": "input"}
+_EXPECTED_CAUSALITIES: dict[str, Causality] = {"source": Causality.output, "target": Causality.input}
+
+
+@dataclass(frozen=True)
+class ConnectionIssue:
+    """Data class describing an issue found when validating a connection.
+
+    check is one of:
+        'endpoint': endpoint missing, or neither connector nor variable defined
+        'component': component not found
+        'connector': connector not found in component
+        'connectorType': connector type does not match the end of the connection (output -> input)
+        'variable': variable not found in the component's FMU
+        'variableGroup': variable group not found, or it refers to variables not found in the component's FMU
+        'endpointKind': a variable is connected with a variable group
+        'causality': causality of a variable does not match the end of the connection (output -> input)
+        'dataType': data types of the connected variables differ
+        'groupType': types or sizes of the connected variable groups differ
+    """
+
+    connection: str
+    check: str
+    message: str
+
+
+@dataclass()
+class ValidationReport:
+    """Data class holding the result of validating all connections of a system."""
+
+    connections: int = 0
+    issues: list[ConnectionIssue] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        """Returns True if no issues were found.
+
+        Returns
+        -------
+        bool
+            True if all connections are valid. Otherwise False.
+        """
+        return not self.issues
+
+    @property
+    def invalid_connections(self) -> int:
+        """Returns the number of connections with at least one issue.
+
+        Returns
+        -------
+        int
+            number of invalid connections
+        """
+        return len({issue.connection for issue in self.issues})
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the report as dict, e.g. to be saved as JSON.
+
+        Returns
+        -------
+        dict[str, Any]
+            dict with the number of connections checked and found invalid,
+            the number of issues per check, and all issues
+        """
+        issues_per_check: dict[str, int] = {}
+        for issue in self.issues:
+            issues_per_check[issue.check] = issues_per_check.get(issue.check, 0) + 1
+        return {
+            "valid": self.is_valid,
+            "connections": self.connections,
+            "invalidConnections": self.invalid_connections,
+            "issuesPerCheck": issues_per_check,
+            "issues": [
+                {"connection": issue.connection, "check": issue.check, "message": issue.message}
+                for issue in self.issues
+            ],
+        }
+
+
+@dataclass()
+class _Endpoint:
+    """An endpoint of a connection, resolved as far as possible."""
+
+    connection: str
+    end: str
+    component: str
+    name: str
+    is_group: bool
+
+
+class ConnectionValidator:
+    """Validator checking all connections of a system in one pass, against the components' FMUs.
+
+    Connections are validated as defined in the case dict, i.e. including the connections
+    System drops because they cannot be resolved.
+    Checked are the existence of components, connectors, variables and variable groups,
+    the connector types and variable causalities (output -> input), and matching data types
+    of connected variables and matching types of connected variable groups.
+
+    Variables are looked up in the variable tables of the FMUs, in bulk and per component by set operations.
+    Causalities and data types of all connected variables are then compared in vectorized form.
+    Variable groups are read from the <fmu_name>_OspModelDescription.xml file beside each FMU, if existing.
+    """
+
+    def __init__(self, components: Mapping[str, Component]) -> None:
+        """Instantiate a validator for the passed in components.
+
+        Parameters
+        ----------
+        components : Mapping[str, Component]
+            the components, by component name
+        """
+        self.components: Mapping[str, Component] = components
+        # Variable groups of each OspModelDescription file: group name -> (group type, referenced variables)
+        self._variable_groups: dict[Path, dict[str, tuple[str, list[str]]]] = {}
+
+    def validate(self, connections: Mapping[str, Any]) -> ValidationReport:
+        """Validate the passed in connections.
+
+        Parameters
+        ----------
+        connections : Mapping[str, Any]
+            the connections, as defined in the 'connections' section of the case dict
+
+        Returns
+        -------
+        ValidationReport
+            the report, listing all issues found
+        """
+        report = ValidationReport(connections=len(connections))
+        pairs: list[tuple[_Endpoint, _Endpoint]] = []
+        for connection_name, connection_properties in connections.items():
+            endpoints = [
+                self._resolve_endpoint(connection_name, end, connection_properties.get(end), report)
+                for end in ("source", "target")
+            ]
+            if endpoints[0] and endpoints[1]:
+                pairs.append((endpoints[0], endpoints[1]))
+
+        variable_pairs: list[tuple[_Endpoint, _Endpoint]] = []
+        group_pairs: list[tuple[_Endpoint, _Endpoint]] = []
+        for source, target in pairs:
+            if source.is_group != target.is_group:
+                report.issues.append(
+                    ConnectionIssue(
+                        source.connection,
+                        "endpointKind",
+                        f"{_describe(source)} is connected with {_describe(target)}.",
+                    )
+                )
+            elif source.is_group:
+                group_pairs.append((source, target))
+            else:
+                variable_pairs.append((source, target))
+
+        self._check_variable_pairs(variable_pairs, report)
+        self._check_group_pairs(group_pairs, report)
+
+        # Report the issues in the order of the connections
+        order = {name: index for index, name in enumerate(connections)}
+        report.issues.sort(key=lambda issue: order[issue.connection])
+        return report
+
+    def _resolve_endpoint(
+        self,
+        connection_name: str,
+        end: str,
+        properties: Mapping[str, Any] | None,
+        report: ValidationReport,
+    ) -> _Endpoint | None:
+        """Resolve an endpoint to the variable or variable group it refers to. Returns None if that fails."""
+        if not properties or "component" not in properties:
+            report.issues.append(
+                ConnectionIssue(connection_name, "endpoint", f"{end} endpoint or its component missing.")
+            )
+            return None
+        component_name: str = properties["component"]
+        component = self.components.get(component_name)
+        if component is None:
+            report.issues.append(
+                ConnectionIssue(connection_name, "component", f"{end}: component {component_name} not found.")
+            )
+            return None
+        if "connector" in properties:
+            connector = component.connectors.get(properties["connector"])
+            if connector is None:
+                report.issues.append(
+                    ConnectionIssue(
+                        connection_name,
+                        "connector",
+                        f"{end}: connector {properties['connector']} not found in component {component_name}.",
+                    )
+                )
+                return None
+            if connector.type and connector.type != _EXPECTED_CONNECTOR_TYPES[end]:
+                report.issues.append(
+                    ConnectionIssue(
+                        connection_name,
+                        "connectorType",
+                        f"{end}: connector {connector.name} of component {component_name} is of type "
+                        f"'{connector.type}', expected '{_EXPECTED_CONNECTOR_TYPES[end]}'.",
+                    )
+                )
+            if connector.variable_group:
+                return _Endpoint(connection_name, end, component_name, connector.variable_group, is_group=True)
+            if connector.variable:
+                return _Endpoint(connection_name, end, component_name, connector.variable, is_group=False)
+        elif "variable" in properties:
+            return _Endpoint(connection_name, end, component_name, properties["variable"], is_group=False)
+        report.issues.append(
+            ConnectionIssue(connection_name, "endpoint", f"{end}: neither variable nor variable group defined.")
+        )
+        return None
+
+    def _check_variable_pairs(self, pairs: list[tuple[_Endpoint, _Endpoint]], report: ValidationReport) -> None:
+        """Check existence, causalities and data types of all connected variables."""
+        # Existence: one set difference per component
+        referenced: dict[str, set[str]] = {}
+        for pair in pairs:
+            for endpoint in pair:
+                referenced.setdefault(endpoint.component, set()).add(endpoint.name)
+        unknown: dict[str, set[str]] = {
+            component_name: names.difference(self._table(component_name).names)
+            for component_name, names in referenced.items()
+        }
+
+        # Causalities and data types: gathered per endpoint, compared in one go
+        known_pairs: list[tuple[_Endpoint, _Endpoint]] = []
+        for source, target in pairs:
+            unknown_endpoints = [
+                endpoint for endpoint in (source, target) if endpoint.name in unknown[endpoint.component]
+            ]
+            report.issues.extend(
+                ConnectionIssue(
+                    endpoint.connection,
+                    "variable",
+                    f"{endpoint.end}: variable {endpoint.name} not found in FMU of component {endpoint.component}.",
+                )
+                for endpoint in unknown_endpoints
+            )
+            if not unknown_endpoints:
+                known_pairs.append((source, target))
+        if not known_pairs:
+            return
+        causalities = np.empty((len(known_pairs), 2), dtype=np.int8)
+        data_types = np.empty((len(known_pairs), 2), dtype=np.int8)
+        for row, pair in enumerate(known_pairs):
+            for column, endpoint in enumerate(pair):
+                table = self._table(endpoint.component)
+                index = table.index(endpoint.name)
+                causalities[row, column] = table.causalities[index]
+                data_types[row, column] = table.data_types[index]
+
+        for column, end in enumerate(("source", "target")):
+            for row in np.flatnonzero(causalities[:, column] != _EXPECTED_CAUSALITIES[end]).tolist():
+                endpoint = known_pairs[row][column]
+                report.issues.append(
+                    ConnectionIssue(
+                        endpoint.connection,
+                        "causality",
+                        f"{_describe(endpoint)} has causality '{Causality(causalities[row, column]).name}', "
+                        f"expected '{_EXPECTED_CAUSALITIES[end].name}'.",
+                    )
+                )
+        # (undefined data types are coded as -1 and not compared)
+        mismatches = (data_types[:, 0] != data_types[:, 1]) & (data_types >= 0).all(axis=1)
+        for row in np.flatnonzero(mismatches).tolist():
+            source, target = known_pairs[row]
+            report.issues.append(
+                ConnectionIssue(
+                    source.connection,
+                    "dataType",
+                    f"data types differ: {_describe(source)} is of type {_data_type_name(data_types[row, 0])}, "
+                    f"{_describe(target)} is of type {_data_type_name(data_types[row, 1])}.",
+                )
+            )
+
+    def _check_group_pairs(self, pairs: list[tuple[_Endpoint, _Endpoint]], report: ValidationReport) -> None:
+        """Check existence, types and sizes of all connected variable groups."""
+        for source, target in pairs:
+            groups = [self._variable_group(endpoint, report) for endpoint in (source, target)]
+            if groups[0] is None or groups[1] is None:
+                continue
+            (source_type, source_variables), (target_type, target_variables) = groups[0], groups[1]
+            if source_type != target_type or len(source_variables) != len(target_variables):
+                report.issues.append(
+                    ConnectionIssue(
+                        source.connection,
+                        "groupType",
+                        f"{_describe(source)} ({source_type}, {len(source_variables)} variables) does not match "
+                        f"{_describe(target)} ({target_type}, {len(target_variables)} variables).",
+                    )
+                )
+
+    def _variable_group(self, endpoint: _Endpoint, report: ValidationReport) -> tuple[str, list[str]] | None:
+        """Return type and variables of the variable group an endpoint refers to. Reports an issue if not valid."""
+        osp_model_description_file = self._osp_model_description_file(endpoint.component)
+        group = self._read_variable_groups(osp_model_description_file).get(endpoint.name)
+        if group is None:
+            report.issues.append(
+                ConnectionIssue(
+                    endpoint.connection,
+                    "variableGroup",
+                    f"{endpoint.end}: variable group {endpoint.name} of component {endpoint.component} "
+                    f"not found in {osp_model_description_file.name}.",
+                )
+            )
+            return None
+        if unknown := set(group[1]).difference(self._table(endpoint.component).names):
+            report.issues.append(
+                ConnectionIssue(
+                    endpoint.connection,
+                    "variableGroup",
+                    f"{endpoint.end}: variable group {endpoint.name} of component {endpoint.component} refers to "
+                    f"variables not found in its FMU: {', '.join(sorted(unknown))}.",
+                )
+            )
+            return None
+        return group
+
+    def _table(self, component_name: str) -> VariableTable:
+        return self.components[component_name].fmu.variable_table
+
+    def _osp_model_description_file(self, component_name: str) -> Path:
+        fmu_file = self.components[component_name].fmu.file
+        return fmu_file.with_name(f"{fmu_file.stem}_OspModelDescription.xml")
+
+    def _read_variable_groups(self, osp_model_description_file: Path) -> dict[str, tuple[str, list[str]]]:
+        """Read the variable groups of an OspModelDescription file, including nested groups. Cached per file."""
+        if (variable_groups := self._variable_groups.get(osp_model_description_file)) is not None:
+            return variable_groups
+        variable_groups = {}
+        if osp_model_description_file.is_file():
+            for element in iter_elements(osp_model_description_file, max_depth=1):
+                if local_name(element) != "VariableGroups":
+                    continue
+                for group_element in element.iter():
+                    if group_element is element or (group_name := group_element.get("name")) is None:
+                        continue
+                    variable_groups[group_name] = (
+                        local_name(group_element),
+                        [
+                            reference
+                            for variable_element in group_element.iter("{*}Variable")
+                            if (reference := variable_element.get("ref")) is not None
+                        ],
+                    )
+        self._variable_groups[osp_model_description_file] = variable_groups
+        return variable_groups
+
+
+def _describe(endpoint: _Endpoint) -> str:
+    kind = "variable group" if endpoint.is_group else "variable"
+    return f"{endpoint.end} {kind} {endpoint.component}.{endpoint.name}"
+
+
+def _data_type_name(code: int) -> str:
+    return DataType(code).name
@@ -42,6 +42,11 @@ output_files: list[str] = [
     "*.ssd",
     "statisticsDict",
     "watchDict",
+    "buildProfile.*",
+    "validationReport.json",
+    "systemSnapshot.pickle",
+    "*_callGraph",
+    "*_callGraph.pdf",
     "caseDict_imported_from_test_import_OspSystemStructure_xml",
 ]
 
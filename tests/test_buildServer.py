@@ -0,0 +1,69 @@
+import json
+from io import StringIO
+from pathlib import Path
+
+from dictIO import DictParser
+
+from ospx import OspBuildServer
+
+
+def _serve(requests: list[dict[str, object]]) -> list[dict[str, object]]:
+    input_stream = StringIO("\n".join(json.dumps(request) for request in requests) + "\n")
+    output_stream = StringIO()
+    OspBuildServer().serve(input_stream, output_stream)
+    return [json.loads(line) for line in output_stream.getvalue().splitlines()]
+
+
+def test_serve_builds_and_inspects_case() -> None:
+    # Prepare
+    _ = DictParser.parse("test_caseDict")
+    requests: list[dict[str, object]] = [
+        {"jsonrpc": "2.0", "id": 1, "method": "inspect", "params": {"caseDictFile": "parsed.test_caseDict"}},
+        {"jsonrpc": "2.0", "id": 2, "method": "build", "params": {"caseDictFile": "parsed.test_caseDict"}},
+        {"jsonrpc": "2.0", "id": 3, "method": "shutdown"},
+        {"jsonrpc": "2.0", "id": 4, "method": "status"},
+    ]
+    # Execute
+    responses = _serve(requests)
+    # Assert
+    assert [response["id"] for response in responses] == [1, 2, 3]
+    inspect_result, build_result, _ = (response["result"] for response in responses)
+    assert inspect_result["errors"] == []
+    assert inspect_result["fmuCache"] == {"entries": 1, "hits": 1, "misses": 1}
+    # the build reuses the system structure resolved by inspect, hence does not even touch the FMU cache
+    assert build_result["errors"] == []
+    assert build_result["fmuCache"] == {"entries": 1, "hits": 1, "misses": 1}
+    assert Path("OspSystemStructure.xml").exists()
+
+
+def test_handle_reuses_warm_fmus_after_case_dict_changed() -> None:
+    # Prepare
+    _ = DictParser.parse("test_caseDict")
+    server = OspBuildServer()
+    build_request = {"jsonrpc": "2.0", "id": 1, "method": "build", "params": {"caseDictFile": "parsed.test_caseDict"}}
+    # Execute
+    with server.fmu_cache:
+        _ = server.handle(json.dumps(build_request))
+        case_dict_file = Path("parsed.test_caseDict")
+        case_dict_file.write_text(case_dict_file.read_text().replace("component_2", "component_3"))
+        response = server.handle(json.dumps(build_request))
+    # Assert
+    assert response is not None
+    assert response["result"]["fmuCache"] == {"entries": 1, "hits": 3, "misses": 1}
+    assert 'name="component_3"' in Path("OspSystemStructure.xml").read_text()
+
+
+def test_serve_answers_invalid_requests_with_errors() -> None:
+    # Prepare
+    requests: list[dict[str, object]] = [
+        {"jsonrpc": "2.0", "id": 1, "method": "unknown"},
+        {"jsonrpc": "2.0", "id": 2, "method": "build", "params": {"caseDict": "parsed.test_caseDict"}},
+        {"jsonrpc": "2.0", "id": 3, "method": "build", "params": {"caseDictFile": "not_existing_caseDict"}},
+        {"jsonrpc": "2.0", "method": "status"},
+    ]
+    # Execute
+    responses = _serve(requests)
+    # Assert
+    assert [response["id"] for response in responses] == [1, 2, 3]
+    assert [response["error"]["code"] for response in responses] == [-32601, -32602, -32000]
+    assert "FileNotFoundError" in responses[2]["error"]["message"]
@@ -0,0 +1,33 @@
+import os
+from pathlib import Path
+
+from ospx.fmi import FMUCache, load_fmu
+
+
+def test_load_fmu_without_active_cache_parses_fmu_each_time() -> None:
+    # Execute
+    fmu_1 = load_fmu("test_fmu.fmu")
+    fmu_2 = load_fmu("test_fmu.fmu")
+    # Assert
+    assert fmu_1 is not fmu_2
+
+
+def test_fmu_cache_serves_unchanged_fmu_and_reparses_changed_fmu() -> None:
+    # Prepare
+    fmu_file = Path("test_fmu.fmu")
+    fmu_cache = FMUCache()
+    # Execute
+    with fmu_cache:
+        fmu_1 = load_fmu(fmu_file)
+        fmu_2 = load_fmu(fmu_file.absolute())
+        fmu_stat = fmu_file.stat()
+        os.utime(fmu_file, ns=(fmu_stat.st_atime_ns, fmu_stat.st_mtime_ns + 1_000_000_000))
+        fmu_3 = load_fmu(fmu_file)
+    fmu_4 = load_fmu(fmu_file)
+    # Assert
+    assert fmu_2 is fmu_1
+    assert fmu_3 is not fmu_1
+    assert fmu_4 is not fmu_3
+    assert fmu_cache.to_dict() == {"entries": 1, "hits": 1, "misses": 2}
+    assert fmu_cache.invalidate(fmu_file) == 1
+    assert len(fmu_cache) == 0
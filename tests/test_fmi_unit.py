@@ -0,0 +1,70 @@
+import numpy as np
+
+from ospx.fmi import BaseUnit, DisplayUnit, Unit, UnitTable, intern_unit
+from ospx.fmi.fmu import FMU
+
+
+def test_base_unit_from_and_to_attributes() -> None:
+    # Execute
+    base_unit = BaseUnit.from_attributes({"kg": 1, "m": 2, "s": -2, "factor": 1.0})
+    # Assert
+    assert base_unit == BaseUnit(kg=1, m=2, s=-2)
+    # attributes with a value of zero are omitted
+    assert base_unit.to_attributes() == {"kg": 1, "m": 2, "s": -2, "factor": 1.0}
+
+
+def test_display_unit_from_and_to_attributes() -> None:
+    display_unit = DisplayUnit.from_attributes({"name": "deg", "factor": 57.29578})
+    assert display_unit.to_attributes() == {"name": "deg", "factor": 57.29578, "offset": 0.0}
+
+
+def test_intern_unit() -> None:
+    # Prepare
+    unit_1 = Unit(name="test_intern_unit_N", base_unit=BaseUnit(kg=1, m=1, s=-2))
+    unit_2 = Unit(name="test_intern_unit_N", base_unit=BaseUnit(kg=1, m=1, s=-2))
+    unit_3 = Unit(name="test_intern_unit_N", base_unit=BaseUnit(kg=1, m=1, s=-2, factor=1000.0))
+    # Execute & Assert
+    assert intern_unit(unit_1) is unit_1
+    assert intern_unit(unit_2) is unit_1
+    assert intern_unit(unit_3) is unit_3
+
+
+def test_fmu_units_are_shared_across_fmus() -> None:
+    units_1 = FMU("test_fmu.fmu").units
+    units_2 = FMU("test_fmu.fmu").units
+    assert units_1 == units_2
+    assert all(units_1[name] is units_2[name] for name in units_1)
+
+
+def test_unit_table_interns_base_units() -> None:
+    # Prepare
+    newton = BaseUnit(kg=1, m=1, s=-2)
+    kilonewton = BaseUnit(kg=1, m=1, s=-2, factor=1000.0)
+    # Execute
+    table = UnitTable([newton, kilonewton, BaseUnit(kg=1, m=1, s=-2, factor=1)])
+    # Assert
+    assert len(table) == 2
+    assert table.add(BaseUnit(kg=1, m=1, s=-2)) == 0
+    assert table.exponents.tolist() == [[1, 1, -2, 0, 0, 0, 0, 0]] * 2
+    assert table.factors.tolist() == [1.0, 1000.0]
+
+
+def test_unit_table_compatible_and_linear_transformations() -> None:
+    # Prepare
+    table = UnitTable(
+        [
+            BaseUnit(kg=1, m=1, s=-2, factor=1000.0),  # kN
+            BaseUnit(kg=1, m=1, s=-2),  # N
+            BaseUnit(K=1, offset=273.15),  # degC
+            BaseUnit(K=1),  # K
+        ]
+    )
+    sources = np.array([0, 2, 3, 0])
+    targets = np.array([1, 3, 2, 3])
+    # Execute
+    compatible = table.compatible(sources, targets)
+    factors, offsets = table.linear_transformations(sources, targets)
+    # Assert
+    assert compatible.tolist() == [True, True, True, False]
+    assert factors[:3].tolist() == [1000.0, 1.0, 1.0]
+    assert offsets[:3].tolist() == [0.0, 273.15, -273.15]
@@ -0,0 +1,56 @@
+from ospx.fmi import DataType, ScalarVariable, cast_to_fmi_data_types, get_fmi_data_type
+
+
+def test_get_fmi_data_type_bool() -> None:
+    assert get_fmi_data_type(True) == "Boolean"  # noqa: FBT003
+    assert get_fmi_data_type(1) == "Integer"
+    assert get_fmi_data_type(1.0) == "Real"
+    assert get_fmi_data_type("1") == "String"
+
+
+def test_cast_to_fmi_data_types() -> None:
+    # Prepare
+    values = [0, "1.5", "true", 2.7, "abc", [1, 2], 3, None]
+    data_types = ["Real", "Real", "Boolean", "Integer", DataType.Integer, "Real", "String", None]
+    # Execute
+    casted_values, failures = cast_to_fmi_data_types(values, data_types)
+    # Assert
+    assert casted_values[:3] == [0.0, 1.5, True]
+    assert isinstance(casted_values[0], float)
+    assert casted_values[3] is None
+    assert casted_values[4] is None
+    assert casted_values[5] is None
+    assert casted_values[6] == "3"
+    assert [failure.index for failure in failures] == [3, 4, 5]
+    assert failures[0].data_type == "Integer"
+
+
+def test_cast_to_fmi_data_types_reports_invalid_booleans() -> None:
+    # Prepare
+    values = [True, "false", 1, 0, "abc", "$outerTemperature", "None", None, 2, 0.5]
+    data_types = ["Boolean"] * len(values)
+    # Execute
+    casted_values, failures = cast_to_fmi_data_types(values, data_types)
+    # Assert
+    assert casted_values == [True, False, True, False, None, None, None, None, None, None]
+    assert [failure.index for failure in failures] == [4, 5, 6, 7, 8, 9]
+    assert all(failure.data_type == "Boolean" for failure in failures)
+
+
+def test_cast_to_fmi_data_types_does_not_truncate_integers() -> None:
+    # Prepare
+    values = [2.0, "3", 2.7, "2.7", None]
+    data_types = ["Integer"] * len(values)
+    # Execute
+    casted_values, failures = cast_to_fmi_data_types(values, data_types)
+    # Assert
+    assert casted_values == [2, 3, None, None, None]
+    assert isinstance(casted_values[0], int)
+    assert [failure.index for failure in failures] == [2, 3, 4]
+
+
+def test_scalar_variable_start_is_casted_to_data_type() -> None:
+    variable = ScalarVariable(name="var", data_type="Real")
+    variable.start = 1
+    assert variable.start == 1.0
+    assert isinstance(variable.start, float)
@@ -1,7 +1,9 @@
 from pathlib import Path
+from zipfile import ZipFile
 
 import pytest
 
+from ospx.fmi import Causality, DataType
 from ospx.fmi.fmu import FMU
 
 
@@ -48,6 +50,98 @@ def test_fmu_variables_start_value(test_fmu: FMU) -> None:
     assert test_fmu.variables["Vector_1_IN[2]"].start == 12.0
 
 
+def test_fmu_variables_are_read_once_and_shared(test_fmu: FMU) -> None:
+    variables_1 = test_fmu.variables
+    variables_2 = test_fmu.variables
+    assert variables_1 is not variables_2
+    assert variables_1["Variable_1_IN_Real"] is variables_2["Variable_1_IN_Real"]
+    assert not hasattr(variables_1["Variable_1_IN_Real"], "__dict__")
+
+
+def test_fmu_variable_table(test_fmu: FMU) -> None:
+    table = test_fmu.variable_table
+    assert len(table) == len(test_fmu.variables)
+    assert "Variable_1_IN_Real" in table
+    inputs = table.select(causality="input")
+    assert "Variable_1_IN_Real" in inputs
+    assert "Variable_4_OUT_Real" not in inputs
+    assert table.select(causality="output", data_type="Boolean") == ["Variable_6_OUT_Bool"]
+
+
+def test_fmu_variables_enum_codes(test_fmu: FMU) -> None:
+    variable = test_fmu.variables["Variable_4_OUT_Real"]
+    assert variable.causality == "output"
+    assert variable.causality_code is Causality.output
+    assert variable.data_type_code is DataType.Real
+    table = test_fmu.variable_table
+    assert table.select(causality=Causality.output, data_type=DataType.Real) == table.select(
+        causality="output", data_type="Real"
+    )
+
+
+def test_fmu_copy(test_fmu: FMU, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Prepare
+    monkeypatch.setenv("USER", "tester")
+    monkeypatch.setenv("USERNAME", "tester")
+    with ZipFile(test_fmu.file, "a") as zip_write:
+        zip_write.writestr("binaries/win64/test_fmu.dll", b"dll")
+        zip_write.writestr("binaries/linux64/test_fmu.so", b"so")
+        zip_write.writestr("resources/table.csv", "1,2,3")
+    # Execute
+    new_fmu = test_fmu.copy("test_fmu_copy")
+    # Assert
+    assert new_fmu.file.name == "test_fmu_copy.fmu"
+    with ZipFile(new_fmu.file, "r") as zip_read:
+        assert zip_read.testzip() is None
+        assert sorted(zip_read.namelist()) == [
+            "binaries/linux64/test_fmu_copy.so",
+            "binaries/win64/test_fmu_copy.dll",
+            "modelDescription.xml",
+            "resources/table.csv",
+        ]
+        assert zip_read.read("resources/table.csv") == b"1,2,3"
+        assert 'modelIdentifier="test_fmu_copy"' in zip_read.read("modelDescription.xml").decode("utf-8")
+    assert new_fmu.model_description["_xmlOpts"]["_rootAttributes"]["modelName"] == "test_fmu_copy"
+    assert len(new_fmu.variables) == len(test_fmu.variables)
+    # the copied FMU's model description, read back from file, matches the one held in memory
+    assert len(FMU(new_fmu.file).variables) == len(new_fmu.variables)
+    new_fmu.file.unlink()
+    Path("test_fmu_copy_ModelDescription.xml").unlink()
+
+
+def test_fmu_copy_with_identical_name_leaves_fmu_unchanged(test_fmu: FMU) -> None:
+    # Prepare
+    content = test_fmu.file.read_bytes()
+    # Execute & Assert
+    with pytest.raises(ValueError, match="identical with existing name"):
+        _ = test_fmu.copy("test_fmu")
+    assert test_fmu.file.read_bytes() == content
+
+
+def test_fmu_clone(test_fmu: FMU, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Prepare
+    monkeypatch.setenv("USER", "tester")
+    monkeypatch.setenv("USERNAME", "tester")
+    clones = [
+        (f"clone_{index}", {"Variable_1_IN_Real": index, "Variable_2_IN_Integer": 10 * index}) for index in range(4)
+    ]
+    # Execute
+    new_fmus = test_fmu.clone(clones, max_workers=2)
+    # Assert
+    assert [new_fmu.file.name for new_fmu in new_fmus] == [f"clone_{index}.fmu" for index in range(4)]
+    for index, new_fmu in enumerate(new_fmus):
+        # read back from file, to check the start values were written into the FMU
+        variables = FMU(new_fmu.file).variables
+        assert variables["Variable_1_IN_Real"].start == float(index)
+        assert variables["Variable_2_IN_Integer"].start == 10 * index
+        assert new_fmu.variables["Variable_1_IN_Real"].start == float(index)
+    # the template FMU remains unchanged
+    assert test_fmu.variables["Variable_2_IN_Integer"].start != 30
+    for new_fmu in new_fmus:
+        new_fmu.file.unlink()
+        new_fmu.file.with_name(f"{new_fmu.file.stem}_ModelDescription.xml").unlink()
+
+
 # def test_fmu() -> None:
 # Prepare
 
@@ -0,0 +1,118 @@
+import subprocess
+from copy import copy
+from pathlib import Path
+from typing import Any
+
+import pytest
+from dictIO import DictParser, DictReader
+
+from ospx import Graph, OspSimulationCase
+from ospx import graph as graph_module
+
+
+def _setup_case() -> OspSimulationCase:
+    _ = DictParser.parse("test_caseDict")
+    case = OspSimulationCase(DictReader.read("parsed.test_caseDict", comments=False))
+    case.setup()
+    return case
+
+
+def test_build_dependency_graph_collapses_parallel_edges() -> None:
+    # Prepare
+    case = _setup_case()
+    connections = case.system_structure.connections
+    connections["component_1_to_component_2_again"] = copy(connections["component_1_to_component_2"])
+    # Execute
+    callgraph = Graph.build_dependency_graph(case, cluster_separator="_")
+    # Assert
+    assert callgraph is not None
+    assert callgraph.engine == "dot"
+    source = callgraph.source
+    assert source.count("component_1 -> component_2") == 1
+    assert source.count("component_2 -> component_1") == 1
+    assert "2 connections" in source
+    assert "subgraph cluster_component" in source
+
+
+def test_build_dependency_graph_uses_fast_engine_for_large_systems(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Prepare
+    case = _setup_case()
+    monkeypatch.setattr(graph_module, "LARGE_GRAPH_THRESHOLD", 1)
+    # Execute
+    callgraph = Graph.build_dependency_graph(case)
+    # Assert
+    assert callgraph is not None
+    assert callgraph.engine == "sfdp"
+    assert 'size="10, 10!"' not in callgraph.source
+    assert Graph.build_dependency_graph(case, engine="neato").engine == "neato"  # pyright: ignore[reportOptionalMemberAccess]
+    with pytest.raises(ValueError, match="not supported"):
+        _ = Graph.build_dependency_graph(case, engine="circo")
+
+
+def test_generate_dependency_graph_aborts_rendering_after_timeout(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    # Prepare
+    case = _setup_case()
+
+    def run(args: list[str], **kwargs: Any) -> None:  # noqa: ANN401
+        raise subprocess.TimeoutExpired(args, kwargs["timeout"])
+
+    monkeypatch.setattr(subprocess, "run", run)
+    # Execute
+    Graph.generate_dependency_graph(case, timeout=0.5)
+    # Assert
+    assert Path(f"{case.simulation.name}_callGraph").exists()
+    assert "did not finish rendering" in caplog.text
+    assert "within 0.5 seconds" in caplog.text
+
+
+def test_generate_dependency_graph_renders_only_if_graph_changed(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Prepare
+    case = _setup_case()
+    rendered: list[str] = []
+
+    def run(args: list[str], **_: Any) -> None:  # noqa: ANN401
+        rendered.append(args[0])
+        _ = Path(args[3]).write_bytes(b"%PDF")
+
+    monkeypatch.setattr(subprocess, "run", run)
+    source_file = Path(f"{case.simulation.name}_callGraph")
+    pdf_file = Path(f"{case.simulation.name}_callGraph.pdf")
+    # Execute & Assert: first rendering
+    Graph.generate_dependency_graph(case)
+    assert rendered == ["dot"]
+    assert pdf_file.read_bytes() == b"%PDF"
+    assert source_file.read_text().startswith("// ospx graph hash: ")
+    # Execute & Assert: unchanged graph is not rendered again, also not if start values changed
+    variant = case.variant(Path.cwd(), {"component_1": {"Variable_1_IN_Real": 42.0}})
+    Graph.generate_dependency_graph(variant)
+    assert rendered == ["dot"]
+    # Execute & Assert: changed layout engine and changed connections get rendered
+    Graph.generate_dependency_graph(case, engine="neato")
+    assert rendered == ["dot", "neato"]
+    del case.system_structure.connections["component_2_to_component_1"]
+    Graph.generate_dependency_graph(case, engine="neato")
+    assert rendered == ["dot", "neato", "neato"]
+
+
+def test_generate_dependency_graph_saves_dot_only(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Prepare
+    case = _setup_case()
+
+    def run(args: list[str], **_: Any) -> None:  # noqa: ANN401
+        raise AssertionError(args)
+
+    monkeypatch.setattr(subprocess, "run", run)
+    source_file = Path(f"{case.simulation.name}_callGraph")
+    # Execute
+    Graph.generate_dependency_graph(case, render="none")
+    mtime_ns = source_file.stat().st_mtime_ns
+    Graph.generate_dependency_graph(case, render="none")
+    # Assert
+    assert "digraph" in source_file.read_text()
+    assert source_file.stat().st_mtime_ns == mtime_ns
+    assert not Path(f"{case.simulation.name}_callGraph.pdf").exists()
+    with pytest.raises(ValueError, match="not supported"):
+        Graph.generate_dependency_graph(case, render="later")
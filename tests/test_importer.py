@@ -0,0 +1,369 @@
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from zipfile import ZipFile
+
+import pytest
+from dictIO import DictReader
+
+from ospx import OspSystemStructureImporter
+from ospx.importer import (
+    _read_system_structure,  # pyright: ignore[reportPrivateUsage]
+    _read_system_structure_description,  # pyright: ignore[reportPrivateUsage]
+)
+
+# Wall-clock timings depend on the machine. Timing assertions hence only run on request.
+benchmark = pytest.mark.skipif(
+    not os.environ.get("OSPX_BENCHMARK"),
+    reason="timing benchmark. Set environment variable OSPX_BENCHMARK=1 to run it.",
+)
+
+
+def _write_system_structure_file(file: Path, n_simulators: int, n_connections: int) -> None:
+    """Write a machine-generated OspSystemStructure.xml file."""
+    lines: list[str] = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<OspSystemStructure xmlns="http://opensimulationplatform.com/MSMI/OSPSystemStructure" version="0.1">',
+        "    <Simulators>",
+    ]
+    lines.extend(
+        f'        <Simulator name="sim{i}" source="lib/sim{i % 10}.fmu">'
+        f'<InitialValues><InitialValue variable="p"><Real value="{i}.5"/></InitialValue></InitialValues>'
+        "</Simulator>"
+        for i in range(n_simulators)
+    )
+    lines.append("    </Simulators>")
+    lines.append("    <Connections>")
+    lines.extend(
+        "        <VariableConnection>"
+        f'<Variable simulator="sim{j % n_simulators}" name="y{j}"/>'
+        f'<Variable simulator="sim{(7 * j + 1) % n_simulators}" name="u{j}"/>'
+        "</VariableConnection>"
+        for j in range(n_connections)
+    )
+    lines.append("    </Connections>")
+    lines.append("</OspSystemStructure>")
+    _ = file.write_text("\n".join(lines))
+
+
+def _import_time(folder: Path, n_simulators: int, n_connections: int) -> float:
+    system_structure_file = folder / f"OspSystemStructure_{n_connections}.xml"
+    _write_system_structure_file(system_structure_file, n_simulators, n_connections)
+    timings: list[float] = []
+    for _ in range(3):
+        start = time.perf_counter()
+        _, connections, components, _ = _read_system_structure(system_structure_file, folder)
+        timings.append(time.perf_counter() - start)
+        assert len(components) == n_simulators
+        assert len(connections) == n_connections
+    return min(timings)
+
+
+def test_import_system_structure_assigns_connectors_to_exactly_matching_components(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Prepare: component names which are substrings of each other
+    system_structure_file = tmp_path / "OspSystemStructure.xml"
+    _ = system_structure_file.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<OspSystemStructure xmlns="http://opensimulationplatform.com/MSMI/OSPSystemStructure" version="0.1">\n'
+        "    <Simulators>\n"
+        '        <Simulator name="Room1" source="Room1.fmu"/>\n'
+        '        <Simulator name="Room10" source="Room10.fmu"/>\n'
+        "    </Simulators>\n"
+        "    <Connections>\n"
+        "        <VariableConnection>\n"
+        '            <Variable simulator="Room10" name="T_room"/>\n'
+        '            <Variable simulator="Room1" name="T_neighbour"/>\n'
+        "        </VariableConnection>\n"
+        "        <VariableConnection>\n"
+        '            <Variable simulator="Room10" name="T_room"/>\n'
+        '            <Variable simulator="Room1" name="T_neighbour2"/>\n'
+        "        </VariableConnection>\n"
+        "    </Connections>\n"
+        "</OspSystemStructure>\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    # Execute
+    OspSystemStructureImporter.import_system_structure(system_structure_file)
+    # Assert
+    system_structure = DictReader.read(tmp_path / "caseDict_imported_from_OspSystemStructure_xml")["systemStructure"]
+    assert list(system_structure["components"]["Room1"]["connectors"]) == ["Room1_T_neighbour", "Room1_T_neighbour2"]
+    assert list(system_structure["components"]["Room10"]["connectors"]) == ["Room10_T_room"]
+    assert list(system_structure["connections"]) == ["Room10_to_Room1", "Room10_to_Room1_02"]
+
+
+def test_import_system_structure_reads_global_settings(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Prepare
+    system_structure_file = tmp_path / "OspSystemStructure.xml"
+    _write_system_structure_file(system_structure_file, 2, 2)
+    _ = system_structure_file.write_text(
+        system_structure_file.read_text().replace(
+            "<Simulators>",
+            "<StartTime>1.5</StartTime><BaseStepSize>0.05</BaseStepSize><Simulators>",
+        )
+    )
+    monkeypatch.chdir(tmp_path)
+    # Execute
+    OspSystemStructureImporter.import_system_structure(system_structure_file)
+    # Assert
+    case_dict = DictReader.read(tmp_path / "caseDict_imported_from_OspSystemStructure_xml")
+    assert case_dict["run"]["simulation"]["startTime"] == 1.5
+    assert case_dict["run"]["simulation"]["baseStepSize"] == 0.05
+    assert case_dict["run"]["simulation"]["algorithm"] == "fixedStep"
+    assert case_dict["systemStructure"]["components"]["sim1"]["initialize"] == {"p": {"start": 1.5}}
+    assert case_dict["systemStructure"]["components"]["sim1"]["fmu"] == "sim1.fmu"
+
+
+def test_import_system_structure_keeps_default_for_non_numeric_global_settings(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Prepare
+    system_structure_file = tmp_path / "OspSystemStructure.xml"
+    _write_system_structure_file(system_structure_file, 2, 2)
+    _ = system_structure_file.write_text(
+        system_structure_file.read_text().replace(
+            "<Simulators>",
+            "<StartTime>1.5</StartTime><BaseStepSize>$baseTimeStepSize</BaseStepSize><Simulators>",
+        )
+    )
+    monkeypatch.chdir(tmp_path)
+    # Execute
+    OspSystemStructureImporter.import_system_structure(system_structure_file)
+    # Assert
+    case_dict = DictReader.read(tmp_path / "caseDict_imported_from_OspSystemStructure_xml")
+    assert case_dict["run"]["simulation"]["startTime"] == 1.5
+    assert case_dict["run"]["simulation"]["baseStepSize"] == 0.01
+    assert len(case_dict["systemStructure"]["components"]) == 2
+
+
+def test_import_reads_large_system_structure(tmp_path: Path) -> None:
+    # Prepare
+    system_structure_file = tmp_path / "OspSystemStructure.xml"
+    _write_system_structure_file(system_structure_file, 400, 10_000)
+    # Execute
+    _, connections, components, _ = _read_system_structure(system_structure_file, tmp_path)
+    # Assert
+    assert len(components) == 400
+    assert len(connections) == 10_000
+
+
+@benchmark
+def test_import_scales_linearly(tmp_path: Path) -> None:
+    # Execute
+    small = _import_time(tmp_path, 40, 1_000)
+    large = _import_time(tmp_path, 400, 10_000)
+    # Assert
+    assert large < 1.0
+    assert large < 30 * small  # linear scaling: ~10x. Quadratic scaling would be ~100x.
+
+
+def _write_case(folder: Path, connections: str, fmu: str = "../library/test_fmu.fmu") -> None:
+    folder.mkdir(parents=True)
+    _ = (folder / "OspSystemStructure.xml").write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<OspSystemStructure xmlns="http://opensimulationplatform.com/MSMI/OSPSystemStructure" version="0.1">\n'
+        "    <Simulators>\n"
+        f'        <Simulator name="a" source="{fmu}"/>\n'
+        f'        <Simulator name="b" source="{fmu}"/>\n'
+        "    </Simulators>\n"
+        f"    <Connections>{connections}</Connections>\n"
+        "</OspSystemStructure>\n"
+    )
+
+
+def test_import_system_structures_imports_directory_tree_with_shared_fmu_cache(tmp_path: Path) -> None:
+    # Prepare
+    (tmp_path / "library").mkdir()
+    _ = shutil.copyfile("test_fmu.fmu", tmp_path / "library" / "test_fmu.fmu")
+    variable_connection = (
+        '<VariableConnection><Variable simulator="a" name="{}"/>'
+        '<Variable simulator="b" name="Variable_1_IN_Real"/></VariableConnection>'
+    )
+    _write_case(tmp_path / "case_1", variable_connection.format("Variable_4_OUT_Real"))
+    _write_case(
+        tmp_path / "archive" / "case_2",
+        variable_connection.format("not_existing"),
+        fmu="../../library/test_fmu.fmu",
+    )
+    _write_case(
+        tmp_path / "archive" / "case_3",
+        '<SignalConnection><Signal function="f" name="out"/><Variable simulator="b" name="x"/></SignalConnection>',
+    )
+    # Execute
+    summary = OspSystemStructureImporter.import_system_structures(tmp_path, max_workers=3)
+    # Assert
+    assert summary["imported"] == {
+        "archive/case_2/OspSystemStructure.xml": "archive/case_2/caseDict_imported_from_OspSystemStructure_xml",
+        "case_1/OspSystemStructure.xml": "case_1/caseDict_imported_from_OspSystemStructure_xml",
+    }
+    assert list(summary["failed"]) == ["archive/case_3/OspSystemStructure.xml"]
+    assert summary["failed"]["archive/case_3/OspSystemStructure.xml"].startswith("NotImplementedError")
+    assert summary["warnings"] == {
+        "archive/case_2/OspSystemStructure.xml": ["component a: variable not_existing not found in FMU test_fmu.fmu."],
+    }
+    assert summary["fmuCache"]["misses"] == 1
+    assert (tmp_path / "case_1" / "caseDict_imported_from_OspSystemStructure_xml").exists()
+    case_dict = DictReader.read(tmp_path / "case_1" / "caseDict_imported_from_OspSystemStructure_xml")
+    assert Path(case_dict["_environment"]["libSource"]) == (tmp_path / "library").resolve()
+    assert json.loads((tmp_path / "importSummary.json").read_text()) == summary
+
+
+_SSD_HEADER: str = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<ssd:SystemStructureDescription xmlns:ssd="http://ssp-standard.org/SSP1/SystemStructureDescription" '
+    'xmlns:ssc="http://ssp-standard.org/SSP1/SystemStructureCommon" '
+    'xmlns:ssv="http://ssp-standard.org/SSP1/SystemStructureParameterValues" name="test" version="1.0">\n'
+)
+
+
+def _write_system_structure_description_file(file: Path, n_components: int, n_connections: int) -> None:
+    """Write a machine-generated SystemStructure.ssd file."""
+    lines: list[str] = [_SSD_HEADER, '    <ssd:System name="test">', "        <ssd:Elements>"]
+    lines.extend(
+        f'            <ssd:Component name="sim{i}" source="lib/sim{i % 10}.fmu">'
+        '<ssd:ParameterBindings><ssd:ParameterBinding><ssd:ParameterValues><ssv:ParameterSet version="1.0" name="p">'
+        f'<ssv:Parameters><ssv:Parameter name="p"><ssv:Real value="{i}.5"/></ssv:Parameter></ssv:Parameters>'
+        "</ssv:ParameterSet></ssd:ParameterValues></ssd:ParameterBinding></ssd:ParameterBindings>"
+        "</ssd:Component>"
+        for i in range(n_components)
+    )
+    lines.append("        </ssd:Elements>")
+    lines.append("        <ssd:Connections>")
+    lines.extend(
+        f'            <ssd:Connection startElement="sim{j % n_components}" startConnector="y{j}" '
+        f'endElement="sim{(7 * j + 1) % n_components}" endConnector="u{j}"/>'
+        for j in range(n_connections)
+    )
+    lines.append("        </ssd:Connections>")
+    lines.append("    </ssd:System>")
+    lines.append("</ssd:SystemStructureDescription>")
+    _ = file.write_text("\n".join(lines))
+
+
+def test_import_system_structure_description_reads_large_system_structure(tmp_path: Path) -> None:
+    # Prepare
+    system_structure_file = tmp_path / "SystemStructure.ssd"
+    _write_system_structure_description_file(system_structure_file, 400, 10_000)
+    # Execute
+    _, connections, components, _ = _read_system_structure_description(system_structure_file, tmp_path)
+    # Assert
+    assert len(components) == 400
+    assert len(connections) == 10_000
+    assert components["sim1"]["initialize"] == {"p": {"start": 1.5}}
+
+
+@benchmark
+def test_import_system_structure_description_scales_linearly(tmp_path: Path) -> None:
+    # Prepare
+    system_structure_file = tmp_path / "SystemStructure.ssd"
+    _write_system_structure_description_file(system_structure_file, 400, 10_000)
+    # Execute
+    timings: list[float] = []
+    for _ in range(3):
+        start = time.perf_counter()
+        _ = _read_system_structure_description(system_structure_file, tmp_path)
+        timings.append(time.perf_counter() - start)
+    # Assert
+    assert min(timings) < 1.0
+
+
+def test_import_system_structure_imports_ssp_archive(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Prepare
+    fmu_file = Path("test_fmu.fmu").absolute()
+    ssp_file = tmp_path / "suppliers" / "package.ssp"
+    ssp_file.parent.mkdir()
+    system_structure_description = (
+        _SSD_HEADER + '    <ssd:System name="supplied_system">\n'
+        "        <ssd:Elements>\n"
+        '            <ssd:Component name="a" source="resources/test_fmu.fmu" type="application/x-fmu-sharedlibrary">\n'
+        "                <ssd:ParameterBindings>\n"
+        '                    <ssd:ParameterBinding source="resources/a.ssv"/>\n'
+        "                </ssd:ParameterBindings>\n"
+        "            </ssd:Component>\n"
+        '            <ssd:Component name="b" source="resources/test_fmu.fmu">\n'
+        "                <ssd:ParameterBindings>\n"
+        '                    <ssd:ParameterBinding prefix="Variable_"><ssd:ParameterValues>'
+        '<ssv:ParameterSet version="1.0" name="b"><ssv:Parameters>'
+        '<ssv:Parameter name="2_IN_Integer"><ssv:Integer value="3"/></ssv:Parameter>'
+        "</ssv:Parameters></ssv:ParameterSet></ssd:ParameterValues></ssd:ParameterBinding>\n"
+        "                </ssd:ParameterBindings>\n"
+        "            </ssd:Component>\n"
+        "        </ssd:Elements>\n"
+        "        <ssd:Connections>\n"
+        '            <ssd:Connection startElement="a" startConnector="Variable_4_OUT_Real" '
+        'endElement="b" endConnector="Variable_1_IN_Real"/>\n'
+        '            <ssd:Connection startConnector="input" endElement="b" endConnector="Variable_1_IN_Real"/>\n'
+        "        </ssd:Connections>\n"
+        "    </ssd:System>\n"
+        '    <ssd:DefaultExperiment startTime="1.0" stopTime="10.0"/>\n'
+        "</ssd:SystemStructureDescription>\n"
+    )
+    parameter_values = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<ssv:ParameterSet xmlns:ssv="http://ssp-standard.org/SSP1/SystemStructureParameterValues" '
+        'version="1.0" name="a">\n'
+        '    <ssv:Parameters><ssv:Parameter name="Variable_1_IN_Real"><ssv:Real value="2.5"/></ssv:Parameter>'
+        "</ssv:Parameters>\n"
+        "</ssv:ParameterSet>\n"
+    )
+    with ZipFile(ssp_file, "w") as zip_write:
+        zip_write.writestr("SystemStructure.ssd", system_structure_description)
+        zip_write.write(fmu_file, "resources/test_fmu.fmu")
+        zip_write.writestr("resources/a.ssv", parameter_values)
+        zip_write.writestr("resources/unused.fmu", b"not referenced")
+    target_folder = tmp_path / "cases"
+    target_folder.mkdir()
+    monkeypatch.chdir(target_folder)
+    # Execute
+    case_dict_file = OspSystemStructureImporter.import_system_structure(ssp_file)
+    # Assert
+    assert case_dict_file == target_folder / "caseDict_imported_from_package_ssp"
+    case_dict = DictReader.read(case_dict_file)
+    extracted_fmu = target_folder / "package" / "resources" / "test_fmu.fmu"
+    assert extracted_fmu.read_bytes() == fmu_file.read_bytes()
+    assert not (target_folder / "package" / "resources" / "unused.fmu").exists()
+    assert not (target_folder / "package" / "resources" / "a.ssv").exists()
+    assert Path(case_dict["_environment"]["libSource"]) == extracted_fmu.parent
+    assert case_dict["run"]["simulation"] == {
+        "name": "supplied_system",
+        "startTime": 1.0,
+        "stopTime": 10.0,
+        "baseStepSize": 0.01,
+        "algorithm": "fixedStep",
+    }
+    components = case_dict["systemStructure"]["components"]
+    assert components["a"] == {
+        "connectors": {"a_Variable_4_OUT_Real": {"variable": "Variable_4_OUT_Real", "type": "output"}},
+        "fmu": "test_fmu.fmu",
+        "initialize": {"Variable_1_IN_Real": {"start": 2.5}},
+    }
+    assert components["b"]["initialize"] == {"Variable_2_IN_Integer": {"start": 3}}
+    assert case_dict["systemStructure"]["connections"] == {
+        "a_to_b": {
+            "source": {"component": "a", "variable": "Variable_4_OUT_Real"},
+            "target": {"component": "b", "variable": "Variable_1_IN_Real"},
+        },
+    }
+
+    # Execute: import again. The extracted FMU is up to date and does not get extracted again.
+    modification_time = extracted_fmu.stat().st_mtime_ns
+    _ = OspSystemStructureImporter.import_system_structure(ssp_file)
+    # Assert
+    assert extracted_fmu.stat().st_mtime_ns == modification_time
+
+
+def test_import_system_structure_raises_on_nested_system_in_ssd(tmp_path: Path) -> None:
+    # Prepare
+    system_structure_file = tmp_path / "SystemStructure.ssd"
+    _ = system_structure_file.write_text(
+        _SSD_HEADER + '<ssd:System name="outer"><ssd:Elements><ssd:System name="inner"/></ssd:Elements></ssd:System>'
+        "</ssd:SystemStructureDescription>"
+    )
+    # Execute and Assert
+    with pytest.raises(NotImplementedError):
+        _ = OspSystemStructureImporter.import_system_structure(system_structure_file, target_folder=tmp_path)
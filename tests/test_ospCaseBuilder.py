@@ -1,4 +1,5 @@
 # pyright: reportPrivateUsage=false
+import json
 from pathlib import Path
 
 from dictIO import DictParser
@@ -52,3 +53,45 @@ def test_inspect() -> None:
     # Execute
     OspCaseBuilder.build(case_dict_file=parsed_case_dict_file, inspect=True)
     # Assert
+
+
+def test_build_with_profile_writes_timing_report() -> None:
+    # Prepare
+    case_dict_file = Path("test_caseDict_simple")
+    parsed_case_dict_file = Path(f"parsed.{case_dict_file.name}")
+    _ = DictParser.parse(case_dict_file)
+    # Execute
+    OspCaseBuilder.build(case_dict_file=parsed_case_dict_file, profile=True)
+    # Assert
+    report_file = Path("buildProfile.json")
+    assert report_file.exists()
+    report = json.loads(report_file.read_text())
+    assert "setup" in report["phases"]
+    assert "writeOspSystemStructureXml" in report["phases"]
+    assert report["counters"]["fmusParsed"] > 0
+    assert report["counters"]["bytesReadFromZips"] > 0
+    assert report["counters"]["variablesProcessed"] > 0
+
+
+def test_build_with_osp_model_descriptions_writes_osp_model_description_files() -> None:
+    # Prepare
+    case_dict_file = Path("test_caseDict")
+    parsed_case_dict_file = Path(f"parsed.{case_dict_file.name}")
+    _ = DictParser.parse(case_dict_file)
+    # Execute
+    OspCaseBuilder.build(case_dict_file=parsed_case_dict_file, osp_model_descriptions=True, workers=2)
+    # Assert
+    assert Path("component_1_OspModelDescription.xml").exists()
+    assert Path("component_2_OspModelDescription.xml").exists()
+    assert Path("OspSystemStructure.xml").exists()
+
+
+def test_build_with_dedupe_hardlinks_osp_model_description_files() -> None:
+    # Prepare
+    case_dict_file = Path("test_caseDict")
+    parsed_case_dict_file = Path(f"parsed.{case_dict_file.name}")
+    _ = DictParser.parse(case_dict_file)
+    # Execute
+    OspCaseBuilder.build(case_dict_file=parsed_case_dict_file, dedupe=True)
+    # Assert
+    assert Path("component_1_OspModelDescription.xml").samefile("component_2_OspModelDescription.xml")
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import pytest
+from dictIO import DictParser, DictReader
+
+from ospx import OspSweepBuilder
+
+
+def test_build_writes_one_case_folder_per_variant(tmp_path: Path) -> None:
+    # Prepare
+    _ = DictParser.parse("test_caseDict")
+    parameters = {
+        "baseStepSize": [0.01, 0.02],
+        "component_2.Variable_1_IN_Real": [1, "2.5"],
+    }
+    # Execute
+    case_folders = OspSweepBuilder.build("parsed.test_caseDict", parameters, sweep_folder=tmp_path)
+    # Assert
+    assert [case_folder.name for case_folder in case_folders] == ["case_0", "case_1", "case_2", "case_3"]
+    for case_folder in case_folders:
+        for file_name in ("OspSystemStructure.xml", "SystemStructure.ssd", "statisticsDict", "watchDict"):
+            assert (case_folder / file_name).exists()
+        assert not list(case_folder.glob("*.fmu"))
+    osp_system_structure = (tmp_path / "case_3" / "OspSystemStructure.xml").read_text()
+    assert "<BaseStepSize>0.02</BaseStepSize>" in osp_system_structure
+    assert '<Real value="2.5"/>' in osp_system_structure
+    assert 'test_working_directory/test_fmu.fmu"' in osp_system_structure
+    sweep_summary = DictReader.read(tmp_path / "sweepSummary")
+    assert sweep_summary["cases"]["case_3"] == {"baseStepSize": 0.02, "component_2.Variable_1_IN_Real": 2.5}
+
+
+def test_build_raises_for_invalid_parameter(tmp_path: Path) -> None:
+    # Prepare
+    _ = DictParser.parse("test_caseDict")
+    # Execute & Assert
+    with pytest.raises(ValueError, match=r"'component_2\.not_existing' is invalid"):
+        _ = OspSweepBuilder.build("parsed.test_caseDict", {"component_2.not_existing": [1]}, sweep_folder=tmp_path)
+    with pytest.raises(ValueError, match="cannot be casted to Integer"):
+        _ = OspSweepBuilder.build(
+            "parsed.test_caseDict", {"component_2.Variable_2_IN_Integer": [1, "x"]}, sweep_folder=tmp_path
+        )
@@ -0,0 +1,117 @@
+import os
+import time
+from typing import Any
+
+import pytest
+from dictIO import DictParser, DictReader
+
+from ospx import OspSimulationCase, Topology
+
+# Wall-clock timings depend on the machine. Timing assertions hence only run on request.
+benchmark = pytest.mark.skipif(
+    not os.environ.get("OSPX_BENCHMARK"),
+    reason="timing benchmark. Set environment variable OSPX_BENCHMARK=1 to run it.",
+)
+
+
+class _Component:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class _Endpoint:
+    def __init__(self, component: _Component) -> None:
+        self.component = component
+
+
+class _Connection:
+    def __init__(self, source: _Component, target: _Component) -> None:
+        self.source_endpoint = _Endpoint(source)
+        self.target_endpoint = _Endpoint(target)
+
+
+class _System:
+    def __init__(self, names: list[str], edges: list[tuple[str, str]]) -> None:
+        self.components: dict[str, _Component] = {name: _Component(name) for name in names}
+        self.connections: dict[str, _Connection] = {
+            f"{source}_to_{target}_{i}": _Connection(self.components[source], self.components[target])
+            for i, (source, target) in enumerate(edges)
+        }
+
+
+def _topology(names: list[str], edges: list[tuple[str, str]]) -> Topology:
+    system: Any = _System(names, edges)
+    return Topology(system)
+
+
+def test_topology_finds_loops_and_execution_order() -> None:
+    # Prepare
+    names = ["sink", "a", "b", "c", "source", "self"]
+    edges = [
+        ("source", "a"),
+        ("a", "b"),
+        ("b", "c"),
+        ("c", "a"),
+        ("c", "sink"),
+        ("c", "sink"),
+        ("self", "self"),
+    ]
+    # Execute
+    topology = _topology(names, edges)
+    # Assert
+    assert topology.loops() == [["self"], ["a", "b", "c"]]
+    order = topology.execution_order()
+    assert order.index("source") < order.index("a") < order.index("sink")
+    assert topology.hot_spots(max_count=1) == {"fanIn": {"sink": 2}, "fanOut": {"c": 3}}
+    assert topology.to_dict()["loops"]["count"] == 2
+
+
+def _large_topology(n: int) -> tuple[list[str], list[tuple[str, str]]]:
+    """Return a chain of n components closed into one big loop, plus one component per chain link feeding it."""
+    names = [f"c{i}" for i in range(n)] + [f"in{i}" for i in range(n)]
+    edges = [(f"c{i}", f"c{(i + 1) % n}") for i in range(n)] + [(f"in{i}", f"c{i}") for i in range(n)]
+    return names, edges
+
+
+def test_topology_of_large_system() -> None:
+    # Prepare
+    n = 10_000
+    names, edges = _large_topology(n)
+    # Execute
+    topology = _topology(names, edges)
+    loops = topology.loops()
+    order = topology.execution_order()
+    # Assert
+    assert len(loops) == 1
+    assert len(loops[0]) == n
+    assert len(order) == 2 * n
+    assert order.index("in0") < order.index("c0")
+
+
+@benchmark
+def test_topology_scales_linearly() -> None:
+    # Prepare
+    names, edges = _large_topology(10_000)
+    # Execute
+    start = time.perf_counter()
+    topology = _topology(names, edges)
+    _ = topology.loops()
+    _ = topology.execution_order()
+    elapsed = time.perf_counter() - start
+    # Assert
+    assert elapsed < 5.0
+
+
+def test_write_statistics_dict_contains_topology() -> None:
+    # Prepare
+    _ = DictParser.parse("test_caseDict")
+    case = OspSimulationCase(DictReader.read("parsed.test_caseDict", comments=False))
+    case.setup()
+    # Execute
+    case.write_statistics_dict()
+    # Assert
+    topology = DictReader.read("statisticsDict")["topology"]
+    assert topology["loops"]["count"] == 1
+    assert topology["loops"]["components"] == [["component_1", "component_2"]]
+    assert topology["executionOrder"] == ["component_1", "component_2"]
+    assert topology["hotSpots"]["fanIn"] == {"component_1": 1, "component_2": 1}
@@ -0,0 +1,164 @@
+from pathlib import Path
+from typing import Any
+
+from dictIO import DictParser, DictReader, DictWriter
+from lxml import etree
+
+from ospx import OspSimulationCase, System, UnitCompatibility
+from ospx.utils.zip import add_file_content_to_zip
+
+MODEL_DESCRIPTION = """<?xml version="1.0" encoding="UTF-8"?>
+<fmiModelDescription fmiVersion="2.0" modelName="Units" guid="units">
+    <CoSimulation modelIdentifier="Units"/>
+    <UnitDefinitions>
+        <Unit name="N">
+            <BaseUnit kg="1" m="1" s="-2"/>
+        </Unit>
+        <Unit name="kN">
+            <BaseUnit kg="1" m="1" s="-2" factor="1000.0"/>
+        </Unit>
+        <Unit name="degC">
+            <BaseUnit K="1" offset="273.15"/>
+        </Unit>
+        <Unit name="K">
+            <BaseUnit K="1"/>
+        </Unit>
+        <Unit name="m">
+            <BaseUnit m="1"/>
+        </Unit>
+    </UnitDefinitions>
+    <ModelVariables>
+        <ScalarVariable name="force_N_out" valueReference="0" causality="output"><Real unit="N"/></ScalarVariable>
+        <ScalarVariable name="force_kN_out" valueReference="1" causality="output"><Real unit="kN"/></ScalarVariable>
+        <ScalarVariable name="temperature_degC_out" valueReference="2" causality="output">
+            <Real unit="degC"/>
+        </ScalarVariable>
+        <ScalarVariable name="force_N_in" valueReference="3" causality="input">
+            <Real unit="N" start="0.0"/>
+        </ScalarVariable>
+        <ScalarVariable name="temperature_K_in" valueReference="4" causality="input">
+            <Real unit="K" start="0.0"/>
+        </ScalarVariable>
+        <ScalarVariable name="length_m_in" valueReference="5" causality="input">
+            <Real unit="m" start="0.0"/>
+        </ScalarVariable>
+        <ScalarVariable name="no_unit_in" valueReference="6" causality="input"><Real start="0.0"/></ScalarVariable>
+    </ModelVariables>
+    <ModelStructure/>
+</fmiModelDescription>
+"""
+
+
+def _system_structure(tmp_path: Path, connections: dict[str, tuple[str, str]]) -> dict[str, Any]:
+    fmu_file = tmp_path / "units.fmu"
+    _ = add_file_content_to_zip(fmu_file, "modelDescription.xml", MODEL_DESCRIPTION)
+    return {
+        "components": {
+            "source": {"fmu": str(fmu_file)},
+            "target": {"fmu": str(fmu_file)},
+        },
+        "connections": {
+            name: {
+                "source": {"component": "source", "variable": source},
+                "target": {"component": "target", "variable": target},
+            }
+            for name, (source, target) in connections.items()
+        },
+    }
+
+
+def _system(tmp_path: Path, connections: dict[str, tuple[str, str]]) -> System:
+    return System(_system_structure(tmp_path, connections))
+
+
+def test_unit_compatibility(tmp_path: Path) -> None:
+    # Prepare
+    system = _system(
+        tmp_path,
+        {
+            "N_to_N": ("force_N_out", "force_N_in"),
+            "kN_to_N": ("force_kN_out", "force_N_in"),
+            "degC_to_K": ("temperature_degC_out", "temperature_K_in"),
+            "N_to_m": ("force_N_out", "length_m_in"),
+            "N_to_no_unit": ("force_N_out", "no_unit_in"),
+        },
+    )
+    # Execute
+    unit_compatibility = UnitCompatibility(system)
+    # Assert
+    assert unit_compatibility.incompatible_connections() == ["N_to_m"]
+    assert unit_compatibility.conversions() == {"kN_to_N": (1000.0, 0.0), "degC_to_K": (1.0, 273.15)}
+    assert unit_compatibility.to_dict() == {
+        "distinctUnits": 5,
+        "connections": {"count": 5, "checked": 4},
+        "incompatible": {"count": 1, "names": ["N_to_m"]},
+        "conversions": {
+            "count": 2,
+            "transformations": {
+                "kN_to_N": {"factor": 1000.0, "offset": 0.0},
+                "degC_to_K": {"factor": 1.0, "offset": 273.15},
+            },
+        },
+    }
+
+
+def test_write_statistics_dict_contains_unit_compatibility() -> None:
+    # Prepare
+    _ = DictParser.parse("test_caseDict")
+    case = OspSimulationCase(DictReader.read("parsed.test_caseDict", comments=False))
+    case.setup()
+    # Execute
+    case.write_statistics_dict()
+    # Assert
+    unit_compatibility = DictReader.read("statisticsDict")["unitCompatibility"]
+    assert unit_compatibility["connections"]["count"] == 1
+    assert unit_compatibility["conversions"]["count"] == 0
+
+
+def test_write_osp_system_structure_xml_converts_units(tmp_path: Path) -> None:
+    # Prepare
+    system_structure = _system_structure(
+        tmp_path,
+        {
+            "N_to_N": ("force_N_out", "force_N_in"),
+            "kN_to_N": ("force_kN_out", "force_N_in"),
+            "degC_to_K": ("temperature_degC_out", "temperature_K_in"),
+        },
+    )
+    for component in system_structure["components"].values():
+        component["fmu"] = "units.fmu"
+    case_dict_file = tmp_path / "caseDict"
+    DictWriter.write(
+        {
+            "_environment": {"libSource": str(tmp_path)},
+            "systemStructure": system_structure,
+            "run": {"simulation": {"name": "units", "baseStepSize": 0.01}},
+        },
+        case_dict_file,
+    )
+    case = OspSimulationCase(DictReader.read(case_dict_file, comments=False))
+    case.setup()
+    namespace = {"osp": "http://opensimulationplatform.com/MSMI/OSPSystemStructure"}
+    # Execute
+    case.write_osp_system_structure_xml()
+    # Assert
+    root = etree.parse(tmp_path / "OspSystemStructure.xml").getroot()
+    functions = root.findall("osp:Functions/osp:LinearTransformation", namespace)
+    assert [function.attrib for function in functions] == [
+        {"name": "kN_to_N_unitConversion", "factor": "1000.0", "offset": "0.0"},
+        {"name": "degC_to_K_unitConversion", "factor": "1.0", "offset": "273.15"},
+    ]
+    assert len(root.findall("osp:Connections/osp:VariableConnection", namespace)) == 1
+    signal_connections = root.findall("osp:Connections/osp:SignalConnection", namespace)
+    assert [[endpoint.attrib for endpoint in connection] for connection in signal_connections[:2]] == [
+        [{"simulator": "source", "name": "force_kN_out"}, {"function": "kN_to_N_unitConversion", "name": "in"}],
+        [{"function": "kN_to_N_unitConversion", "name": "out"}, {"simulator": "target", "name": "force_N_in"}],
+    ]
+    assert len(signal_connections) == 4
+
+    # Execute
+    case.write_osp_system_structure_xml(convert_units=False)
+    # Assert
+    root = etree.parse(tmp_path / "OspSystemStructure.xml").getroot()
+    assert root.find("osp:Functions", namespace) is None
+    assert len(root.findall("osp:Connections/osp:VariableConnection", namespace)) == 3
@@ -1,6 +1,7 @@
 import pytest
+from dictIO.formatter import NativeFormatter
 
-from ospx.utils.dict import shrink_dict
+from ospx.utils.dict import LinearNativeFormatter, shrink_dict
 
 
 def test_shrink_dict_removes_duplicates_from_nested_unique_key() -> None:
@@ -77,3 +78,13 @@ def test_shrink_dict_is_tolerant_to_dict_values_being_none() -> None:
     assert result == {
         "one": {"_attributes": {"name": None}},
     }
+
+
+def test_linear_native_formatter_formats_like_native_formatter() -> None:
+    source = {
+        "components": {f"component_{i}": {"fmu": "test_fmu.fmu", "stepSize": 0.01 * i} for i in range(100)},
+        "list": [1, 2.5, "string with spaces   ", True, None],
+        "empty": {},
+    }
+
+    assert LinearNativeFormatter().to_string(source) == NativeFormatter().to_string(source)
@@ -0,0 +1,29 @@
+import stat
+from pathlib import Path
+
+from ospx.utils.file import write_text_atomic
+
+
+def test_write_text_atomic_keeps_permissions_of_existing_file(tmp_path: Path) -> None:
+    # Prepare
+    file = tmp_path / "file.txt"
+    _ = file.write_text("old")
+    file.chmod(0o640)
+    # Execute
+    write_text_atomic(file, "new")
+    # Assert
+    assert file.read_text() == "new"
+    assert stat.S_IMODE(file.stat().st_mode) == 0o640
+
+
+def test_write_text_atomic_gives_new_file_regular_permissions(tmp_path: Path) -> None:
+    # Prepare
+    file = tmp_path / "file.txt"
+    regular_file = tmp_path / "regular_file.txt"
+    _ = regular_file.write_text("regular")
+    # Execute
+    write_text_atomic(file, "new")
+    # Assert
+    assert file.read_text() == "new"
+    assert stat.S_IMODE(file.stat().st_mode) == stat.S_IMODE(regular_file.stat().st_mode)
+    assert not list(tmp_path.glob(".*.tmp"))
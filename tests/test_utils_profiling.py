@@ -0,0 +1,63 @@
+import json
+from pathlib import Path
+
+from ospx.utils.profiling import BuildProfiler, count, phase
+
+
+def test_phase_and_count_are_no_ops_without_active_profiler() -> None:
+    # Execute & Assert (must not raise)
+    with phase("noProfiler"):
+        count("noProfiler")
+
+
+def test_build_profiler_records_phases_and_counters() -> None:
+    # Prepare
+    build_profiler = BuildProfiler()
+    # Execute
+    with build_profiler:
+        with phase("first"):
+            count("items", 3)
+        with phase("first"):
+            count("items")
+        with phase("second"):
+            pass
+    # Assert
+    assert list(build_profiler.phases) == ["first", "second"]
+    assert build_profiler.phases["first"].calls == 2
+    assert build_profiler.phases["first"].wall_time >= 0.0
+    assert build_profiler.counters == {"items": 4}
+    assert build_profiler.wall_time >= build_profiler.phases["first"].wall_time
+
+
+def test_build_profiler_deactivates_on_exit() -> None:
+    # Prepare
+    build_profiler = BuildProfiler()
+    # Execute
+    with build_profiler:
+        count("inside")
+    count("outside")
+    # Assert
+    assert build_profiler.counters == {"inside": 1}
+
+
+def test_build_profiler_writes_report_and_cprofile_output(tmp_path: Path) -> None:
+    # Prepare
+    build_profiler = BuildProfiler(code_profiler="cProfile")
+    with build_profiler, phase("work"):
+        count("items", 2)
+    # Execute
+    report_file = build_profiler.write_report(tmp_path)
+    # Assert
+    assert report_file == tmp_path / "buildProfile.json"
+    report = json.loads(report_file.read_text())
+    assert report["phases"]["work"]["calls"] == 1
+    assert report["counters"] == {"items": 2}
+    assert report["codeProfiler"] == "cProfile"
+    assert (tmp_path / "buildProfile.prof").exists()
+
+
+def test_build_profiler_ignores_invalid_code_profiler() -> None:
+    # Execute
+    build_profiler = BuildProfiler(code_profiler="invalid")
+    # Assert
+    assert build_profiler.code_profiler is None
@@ -0,0 +1,95 @@
+from pathlib import Path
+
+import pytest
+
+from ospx.fmi import FMU
+from ospx.utils.store import FileStore
+from ospx.utils.zip import add_file_content_to_zip, read_file_content_from_zip
+
+
+def test_file_store_links_identical_content_to_one_stored_file(tmp_path: Path) -> None:
+    # Prepare
+    file_store = FileStore(tmp_path / "store")
+    source_1 = tmp_path / "library_1" / "model.fmu"
+    source_2 = tmp_path / "library_2" / "model.fmu"
+    for source in (source_1, source_2):
+        source.parent.mkdir()
+        _ = source.write_bytes(b"fmu-content")
+    target_1 = tmp_path / "case_1" / "model.fmu"
+    target_2 = tmp_path / "case_2" / "model.fmu"
+    # Execute
+    stored_file = file_store.link(source_1, target_1)
+    _ = file_store.link(source_2, target_2)
+    # Assert
+    assert stored_file.parent.parent == tmp_path / "store"
+    assert target_1.samefile(stored_file)
+    assert target_2.samefile(stored_file)
+    assert not source_1.samefile(stored_file)
+    assert len(list((tmp_path / "store").rglob("*.fmu"))) == 1
+
+
+def test_file_store_replaces_target_if_content_changed(tmp_path: Path) -> None:
+    # Prepare
+    file_store = FileStore(tmp_path / "store")
+    source = tmp_path / "model.fmu"
+    target = tmp_path / "case" / "model.fmu"
+    _ = source.write_bytes(b"version 1")
+    _ = file_store.link(source, target)
+    # Execute
+    _ = source.write_bytes(b"version 2, longer")
+    _ = file_store.link(source, target)
+    # Assert
+    assert target.read_bytes() == b"version 2, longer"
+
+
+def test_modifying_a_linked_zip_leaves_other_links_untouched(tmp_path: Path) -> None:
+    # Prepare
+    file_store = FileStore(tmp_path / "store")
+    source = Path("test_fmu.fmu")
+    target_1 = tmp_path / "case_1" / "test_fmu.fmu"
+    target_2 = tmp_path / "case_2" / "test_fmu.fmu"
+    stored_file = file_store.link(source, target_1)
+    _ = file_store.link(source, target_2)
+    # Execute
+    _ = add_file_content_to_zip(target_1, "extra.txt", "extra")
+    # Assert
+    assert read_file_content_from_zip(target_1, "extra.txt") == "extra"
+    assert read_file_content_from_zip(target_2, "extra.txt") is None
+    assert target_2.samefile(stored_file)
+    assert not target_1.samefile(stored_file)
+
+
+def test_copying_an_fmu_onto_a_linked_fmu_leaves_other_links_untouched(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Prepare
+    monkeypatch.setenv("USER", "tester")
+    monkeypatch.setenv("USERNAME", "tester")
+    file_store = FileStore(tmp_path / "store")
+    target_1 = tmp_path / "case_1" / "linked.fmu"
+    target_2 = tmp_path / "case_2" / "linked.fmu"
+    _ = _create_fmu(tmp_path / "library" / "linked.fmu")
+    stored_file = file_store.link(tmp_path / "library" / "linked.fmu", target_1)
+    _ = file_store.link(tmp_path / "library" / "linked.fmu", target_2)
+    # the external model description of the FMU in case_1 is shared with the store as well
+    stored_model_description = file_store.link(
+        Path("test_fmu_modelDescription.xml"), target_1.with_name("linked_ModelDescription.xml")
+    )
+    content = stored_file.read_bytes()
+    model_description = stored_model_description.read_bytes()
+    fmu = FMU(_create_fmu(tmp_path / "case_1" / "other.fmu"))
+    # Execute
+    _ = fmu.copy("linked")
+    # Assert
+    assert not target_1.samefile(stored_file)
+    assert target_2.samefile(stored_file)
+    assert stored_file.read_bytes() == content
+    assert stored_model_description.read_bytes() == model_description
+
+
+def _create_fmu(fmu_file: Path) -> Path:
+    fmu_file.parent.mkdir(parents=True, exist_ok=True)
+    _ = fmu_file.write_bytes(Path("test_fmu.fmu").read_bytes())
+    _ = add_file_content_to_zip(fmu_file, "extra.txt", "extra")
+    return fmu_file
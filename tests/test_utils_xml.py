@@ -0,0 +1,70 @@
+from io import StringIO
+from pathlib import Path
+
+from ospx.utils.xml import XmlStreamWriter, iter_elements, local_name
+
+
+def test_xml_stream_writer_writes_nested_elements() -> None:
+    # Prepare
+    stream = StringIO()
+    xml = XmlStreamWriter(stream)
+    # Execute
+    xml.declaration()
+    with xml.block("Root", {"version": "0.1"}):
+        xml.element("Value", text=1.5)
+        with xml.block("Items"):
+            xml.element("Item", {"name": "a", "flag": True})
+    # Assert
+    assert stream.getvalue() == (
+        '<?xml version="1.0" ?>\n'
+        '<Root version="0.1">\n'
+        "    <Value>1.5</Value>\n"
+        "    <Items>\n"
+        '        <Item name="a" flag="true"/>\n'
+        "    </Items>\n"
+        "</Root>\n"
+    )
+
+
+def test_xml_stream_writer_writes_empty_block_as_self_closing_tag() -> None:
+    # Prepare
+    stream = StringIO()
+    xml = XmlStreamWriter(stream)
+    # Execute
+    with xml.block("Root"), xml.block("Empty", {"name": "e"}):
+        pass
+    # Assert
+    assert stream.getvalue() == '<Root>\n    <Empty name="e"/>\n</Root>\n'
+
+
+def test_xml_stream_writer_escapes_special_characters() -> None:
+    # Prepare
+    stream = StringIO()
+    xml = XmlStreamWriter(stream)
+    # Execute
+    xml.element("Item", {"name": 'a<b & "c"'}, text="x > y")
+    # Assert
+    assert stream.getvalue() == '<Item name="a&lt;b &amp; &quot;c&quot;">x &gt; y</Item>\n'
+
+
+def test_iter_elements_yields_complete_elements_and_frees_processed_ones(tmp_path: Path) -> None:
+    # Prepare
+    xml_file = tmp_path / "test.xml"
+    _ = xml_file.write_text(
+        '<Root xmlns="urn:test"><Items><Item name="a"><Value>1</Value></Item><Item name="b"/>'
+        '<Item name="c"/></Items><!-- comment --><Last/></Root>'
+    )
+    visited: list[tuple[str, str | None, int, int]] = []
+    # Execute
+    for element in iter_elements(xml_file, max_depth=2):
+        preceding_siblings = len(list(element.itersiblings(preceding=True)))
+        visited.append((local_name(element), element.get("name"), len(element), preceding_siblings))
+    # Assert
+    assert visited == [
+        ("Item", "a", 1, 0),
+        ("Item", "b", 0, 1),
+        ("Item", "c", 0, 1),
+        ("Items", None, 1, 0),
+        ("Last", None, 0, 1),
+        ("Root", None, 1, 0),
+    ]
@@ -0,0 +1,88 @@
+import tracemalloc
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
+
+from ospx.utils.zip import CHUNK_SIZE, copy_zip, extract_member, remove_files_from_zip, rename_file_in_zip
+
+MEMBER_SIZE: int = 16 * CHUNK_SIZE
+
+
+def _create_zip_with_large_member(zip_file: Path) -> None:
+    with ZipFile(zip_file, "w") as zip_write:
+        zip_write.writestr("modelDescription.xml", "<fmiModelDescription/>", compress_type=ZIP_DEFLATED)
+        with zip_write.open(ZipInfo("resources/table.bin"), mode="w") as f:
+            for index in range(MEMBER_SIZE // CHUNK_SIZE):
+                _ = f.write(bytes([index]) * CHUNK_SIZE)
+        zip_write.writestr("binaries/win64/model.dll", b"dll", compress_type=ZIP_DEFLATED)
+
+
+def test_rename_file_in_zip_streams_large_members(tmp_path: Path) -> None:
+    # Prepare
+    zip_file = tmp_path / "model.fmu"
+    _create_zip_with_large_member(zip_file)
+    # Execute
+    tracemalloc.start()
+    try:
+        updated_zip_file = rename_file_in_zip(zip_file, "binaries/win64/model.dll", "binaries/win64/copy.dll")
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert updated_zip_file is not None
+    updated_zip_file.close()
+    # Assert
+    assert peak_memory < MEMBER_SIZE / 4
+    with ZipFile(zip_file, "r") as zip_read:
+        assert zip_read.namelist() == ["modelDescription.xml", "resources/table.bin", "binaries/win64/copy.dll"]
+        assert zip_read.testzip() is None
+        assert zip_read.getinfo("resources/table.bin").file_size == MEMBER_SIZE
+        assert zip_read.read("binaries/win64/copy.dll") == b"dll"
+
+
+def test_remove_files_from_zip(tmp_path: Path) -> None:
+    # Prepare
+    zip_file = tmp_path / "model.fmu"
+    _create_zip_with_large_member(zip_file)
+    # Execute
+    updated_zip_file = remove_files_from_zip(zip_file, "binaries/win64/model.dll")
+    assert updated_zip_file is not None
+    updated_zip_file.close()
+    # Assert
+    with ZipFile(zip_file, "r") as zip_read:
+        assert zip_read.namelist() == ["modelDescription.xml", "resources/table.bin"]
+        assert zip_read.testzip() is None
+
+
+def test_copy_zip_replaces_target_instead_of_writing_it_in_place(tmp_path: Path) -> None:
+    # Prepare
+    zip_file = tmp_path / "model.fmu"
+    _create_zip_with_large_member(zip_file)
+    target_zip_file = tmp_path / "copy.fmu"
+    _ = target_zip_file.write_bytes(b"old content")
+    link = tmp_path / "link.fmu"
+    link.hardlink_to(target_zip_file)
+    # Execute
+    copy_zip(zip_file, target_zip_file, renames={"binaries/win64/model.dll": "binaries/win64/copy.dll"})
+    # Assert
+    with ZipFile(target_zip_file, "r") as zip_read:
+        assert zip_read.namelist() == ["modelDescription.xml", "resources/table.bin", "binaries/win64/copy.dll"]
+        assert zip_read.testzip() is None
+    # the file hardlinked to the former target remains unchanged
+    assert link.read_bytes() == b"old content"
+    assert sorted(file.name for file in tmp_path.iterdir()) == ["copy.fmu", "link.fmu", "model.fmu"]
+
+
+def test_extract_member_only_if_target_differs(tmp_path: Path) -> None:
+    # Prepare
+    zip_file = tmp_path / "package.ssp"
+    _create_zip_with_large_member(zip_file)
+    target = tmp_path / "extracted" / "table.bin"
+    with ZipFile(zip_file, "r") as zip_read:
+        # Execute and Assert
+        assert extract_member(zip_read, "resources/table.bin", target)
+        assert target.stat().st_size == MEMBER_SIZE
+        assert not extract_member(zip_read, "resources/table.bin", target)
+        with target.open("r+b") as f:
+            _ = f.write(b"modified")
+        assert extract_member(zip_read, "resources/table.bin", target)
+        assert target.read_bytes()[:8] == bytes(8)
+    assert list(target.parent.iterdir()) == [target]
@@ -0,0 +1,107 @@
+import json
+from pathlib import Path
+
+from dictIO import DictParser, DictReader
+
+from ospx import ConnectionValidator, OspCaseBuilder, OspSimulationCase
+
+
+def _endpoint(component: str, **properties: str) -> dict[str, str]:
+    return {"component": component, **properties}
+
+
+def test_validate_connections_reports_all_issues() -> None:
+    # Prepare
+    _ = DictParser.parse("test_caseDict")
+    case = OspSimulationCase(DictReader.read("parsed.test_caseDict", comments=False))
+    case.setup()
+    connections = {
+        "valid": {
+            "source": _endpoint("component_1", connector="output_1"),
+            "target": _endpoint("component_2", connector="input_1"),
+        },
+        "unknown_connector": {
+            "source": _endpoint("component_1", connector="output_9"),
+            "target": _endpoint("component_2", connector="input_1"),
+        },
+        "unknown_component": {
+            "source": _endpoint("component_9", variable="Variable_4_OUT_Real"),
+            "target": _endpoint("component_2", variable="Variable_1_IN_Real"),
+        },
+        "unknown_variable": {
+            "source": _endpoint("component_1", variable="Variable_9_OUT_Real"),
+            "target": _endpoint("component_2", variable="Variable_1_IN_Real"),
+        },
+        "reversed": {
+            "source": _endpoint("component_1", connector="input_1"),
+            "target": _endpoint("component_2", connector="output_1"),
+        },
+        "data_type_mismatch": {
+            "source": _endpoint("component_1", variable="Variable_5_OUT_Integer"),
+            "target": _endpoint("component_2", variable="Variable_1_IN_Real"),
+        },
+        "variable_to_group": {
+            "source": _endpoint("component_1", connector="output_1"),
+            "target": _endpoint("component_2", connector="input_2"),
+        },
+        "missing_target": {
+            "source": _endpoint("component_1", connector="output_1"),
+        },
+    }
+    # Execute
+    report = ConnectionValidator(case.system_structure.components).validate(connections)
+    # Assert
+    assert not report.is_valid
+    assert report.connections == 8
+    assert report.invalid_connections == 7
+    assert [(issue.connection, issue.check) for issue in report.issues] == [
+        ("unknown_connector", "connector"),
+        ("unknown_component", "component"),
+        ("unknown_variable", "variable"),
+        ("reversed", "connectorType"),
+        ("reversed", "connectorType"),
+        ("reversed", "causality"),
+        ("reversed", "causality"),
+        ("data_type_mismatch", "dataType"),
+        ("variable_to_group", "endpointKind"),
+        ("missing_target", "endpoint"),
+    ]
+    report_dict = report.to_dict()
+    assert report_dict["issuesPerCheck"]["causality"] == 2
+    assert report_dict["issues"][0]["connection"] == "unknown_connector"
+
+
+def test_validate_connections_checks_variable_groups() -> None:
+    # Prepare
+    _ = DictParser.parse("test_caseDict")
+    case = OspSimulationCase(DictReader.read("parsed.test_caseDict", comments=False))
+    case.setup()
+    connections = {
+        "group_to_group": {
+            "source": _endpoint("component_2", connector="output_2"),
+            "target": _endpoint("component_1", connector="input_2"),
+        },
+        "unknown_group": {
+            "source": _endpoint("component_2", connector="output_2"),
+            "target": _endpoint("component_1", variableGroup="VariableGroup_9_IN"),
+        },
+    }
+    case.system_structure.components["component_1"].connectors["input_2"].variable_group = "VariableGroup_9_IN"
+    # Execute
+    report = ConnectionValidator(case.system_structure.components).validate(connections)
+    # Assert
+    assert [(issue.connection, issue.check) for issue in report.issues] == [
+        ("group_to_group", "variableGroup"),
+        ("unknown_group", "endpoint"),
+    ]
+
+
+def test_validate_case() -> None:
+    # Prepare
+    _ = DictParser.parse("test_caseDict")
+    # Execute
+    report = OspCaseBuilder.validate("parsed.test_caseDict")
+    # Assert
+    assert report.is_valid
+    assert report.connections == 2
+    assert json.loads(Path("validationReport.json").read_text())["valid"] is True